@@ -7,7 +7,7 @@ UPDATED: Now reads banned components and nets from design_database.yaml
 Checks:
 1. Database banned_components list is complete
 2. BOM doesn't contain any banned components
-3. Net labels don't contain any banned nets
+3. Net labels and schematic nets (sedu_netlist.py) don't contain any banned nets
 4. U4 (LMR33630) configured for 3.3V output (not 5V)
 5. Documentation updated (no active 5V references)
 """
@@ -18,6 +18,10 @@ import re
 import sys
 import yaml
 
+import sedu_db
+import sedu_netlist
+import sedu_sexpr
+
 ROOT = pathlib.Path(__file__).resolve().parents[1]
 DATABASE = ROOT / "design_database.yaml"
 BOM = ROOT / "hardware" / "BOM_Seed.csv"
@@ -32,8 +36,7 @@ def load_database():
         sys.exit(1)
 
     try:
-        with open(DATABASE, 'r', encoding='utf-8') as f:
-            return yaml.safe_load(f)
+        return sedu_db.load_database(DATABASE)
     except yaml.YAMLError as e:
         print(f"[5v_elimination] ERROR: Failed to parse database: {e}")
         sys.exit(1)
@@ -115,6 +118,27 @@ def check_net_labels(banned_nets):
     return issues
 
 
+def check_schematic_nets(banned_nets):
+    """Verify no banned nets in the schematic sheets.
+
+    Returns (issues, net count); net count is None if the schematic
+    could not be read.
+    """
+    try:
+        netlist = sedu_netlist.extract()
+    except (OSError, sedu_sexpr.SExprError) as e:
+        return [f"Cannot read schematic: {e}"], None
+
+    names = netlist.label_names()
+    issues = []
+    for banned in banned_nets:
+        net_name = banned.get('name', '')
+        reason = banned.get('reason', 'eliminated')
+        if net_name in names:
+            issues.append(f"Schematic net '{net_name}' still exists ({reason})")
+    return issues, len(netlist.nets)
+
+
 def check_documentation():
     """Check SSOT and other docs for 5V rail references (except historical)."""
     issues = []
@@ -183,6 +207,13 @@ def main():
         all_issues.extend(net_issues)
     else:
         print("   [OK] No banned nets found in net labels")
+    sch_issues, sch_nets = check_schematic_nets(banned_nets)
+    if sch_issues:
+        for issue in sch_issues:
+            print(f"   [FAIL] {issue}")
+        all_issues.extend(sch_issues)
+    else:
+        print(f"   [OK] No banned nets found in schematic ({sch_nets} nets)")
     print()
 
     # Documentation check
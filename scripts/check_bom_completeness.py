@@ -13,6 +13,8 @@ Returns 0 if all required components present, 1 if missing components found.
 import sys
 import csv
 import yaml
+
+import sedu_db
 from pathlib import Path
 
 ROOT = Path(__file__).resolve().parents[1]
@@ -27,8 +29,7 @@ def load_database():
         sys.exit(1)
 
     try:
-        with open(DATABASE, 'r', encoding='utf-8') as f:
-            return yaml.safe_load(f)
+        return sedu_db.load_database(DATABASE)
     except yaml.YAMLError as e:
         print(f"[bom_completeness] ERROR: Failed to parse database: {e}")
         sys.exit(1)
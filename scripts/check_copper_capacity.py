@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+"""Check the copper carrying the high-current nets against the power budget.
+
+For every track segment, arc and copper zone on VBAT, VBAT_PROT,
+MOTOR_PH_U/V/W and GND (from the sedu_board model) this computes:
+
+1. Temperature rise at the net's budgeted current - IPC-2152 baseline
+   chart (curve fit, no board/plane modifiers, so conservative for
+   external layers with nearby planes)
+2. Voltage drop - copper resistivity at AMBIENT_C plus that rise. The
+   report gives the worst single segment's drop at the net's current:
+   segment drops of a branched net do not add up to any real path
+
+The curve fit is only used inside the chart's plotted rises (RISE_RANGE,
+1-100 C). Copper too narrow for its current to reach the chart's hottest
+curve is reported as "beyond IPC-2152 chart" instead of a temperature;
+its voltage drop is then a lower bound (taken at the chart's top rise).
+AMBIENT_C is the worst-case ambient of the calculation graph (sedu_calc
+TAMB), shared with the thermal checks.
+
+Currents are the applied currents of the connectors feeding each net in
+check_power_budget.POWER_REQUIREMENTS (GND returns the battery current).
+Copper thickness comes from the board stackup, else 1 oz (hardware/README.md).
+Zones are pours without a filled outline here, so each is estimated as a
+strip as wide as its bounding box's short side.
+
+All segments are evaluated at once with NumPy when it is installed; the
+pure-Python fallback gives the same numbers.
+
+Exit codes:
+ 0 = every net within MAX_RISE_C (or no copper routed yet)
+ 1 = a bottleneck exceeds MAX_RISE_C, or the board is unreadable
+"""
+from __future__ import annotations
+
+import math
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+import sedu_board
+import sedu_calc
+import sedu_sexpr
+from check_power_budget import POWER_REQUIREMENTS
+
+try:
+    import numpy as np
+except ImportError:  # Optional: pure-Python path below
+    np = None
+
+# Net -> POWER_REQUIREMENTS entry whose applied_current the net carries
+NET_SOURCES = {
+    "VBAT": "J_BAT",
+    "VBAT_PROT": "J_BAT",
+    "MOTOR_PH_U": "J_MOT",
+    "MOTOR_PH_V": "J_MOT",
+    "MOTOR_PH_W": "J_MOT",
+    "GND": "J_BAT",
+}
+
+DEFAULT_THICKNESS = 0.035   # mm, 1 oz copper
+AMBIENT_C = sedu_calc.load()["TAMB"]  # °C, worst-case ambient (sedu_calc TAMB)
+MAX_RISE_C = 20.0           # °C allowed copper temperature rise
+
+RHO_20C = 1.72e-5           # Ω·mm, annealed copper at 20 °C
+ALPHA = 0.00393             # 1/°C resistivity temperature coefficient
+MIL2_PER_MM2 = 1 / 0.0254 ** 2
+
+# IPC-2152 baseline curve fit: A[mil²] = (K1·ΔT^E1 + K2) · I^(K3·ΔT^E2 + K4)
+K1, E1, K2, K3, E2, K4 = 117.555, -0.913, 1.15, 0.84, -0.018, 1.159
+RISE_RANGE = (1.0, 100.0)   # °C, rises plotted on the baseline chart (inverse bracket)
+ITERATIONS = 60
+
+
+def required_area(current, rise):
+    """Cross-section (mil²) that carries current (A) at the given rise (°C)."""
+    return (K1 * rise ** E1 + K2) * current ** (K3 * rise ** E2 + K4)
+
+
+def temperature_rise(current, area):
+    """IPC-2152 rise (°C) for current (A) through area (mil²), element-wise.
+
+    The fit is monotonic in ΔT, so it is inverted by bisection in log space;
+    results are clipped to RISE_RANGE (see beyond_chart()).
+    """
+    lo, hi = math.log(RISE_RANGE[0]), math.log(RISE_RANGE[1])
+    if np is not None:
+        current, area = np.asarray(current, float), np.asarray(area, float)
+        lo, hi = np.full(area.shape, lo), np.full(area.shape, hi)
+        for _ in range(ITERATIONS):
+            mid = (lo + hi) / 2
+            cooler = required_area(current, np.exp(mid)) > area  # Need more rise
+            lo, hi = np.where(cooler, mid, lo), np.where(cooler, hi, mid)
+        return np.exp((lo + hi) / 2)
+
+    rises = []
+    for i, a in zip(current, area):
+        l, h = lo, hi
+        for _ in range(ITERATIONS):
+            mid = (l + h) / 2
+            if required_area(i, math.exp(mid)) > a:
+                l = mid
+            else:
+                h = mid
+        rises.append(math.exp((l + h) / 2))
+    return rises
+
+
+def beyond_chart(rise) -> bool:
+    """True for a rise clipped at the chart's hottest curve: the fit has no answer there."""
+    return rise >= RISE_RANGE[1] * 0.999
+
+
+def format_rise(rise) -> str:
+    if beyond_chart(rise):
+        return f"beyond IPC-2152 chart (> +{RISE_RANGE[1]:g} C)"
+    if rise <= RISE_RANGE[0] * 1.001:
+        return f"< +{RISE_RANGE[0]:g} C"
+    return f"+{rise:.1f} C"
+
+
+def voltage_drop(current, length, width, thickness, rise):
+    """I·R (V) of copper strips (mm) at AMBIENT_C + rise."""
+    if np is not None:
+        current, length, width, thickness, rise = (
+            np.asarray(v, float) for v in (current, length, width, thickness, rise))
+        rho = RHO_20C * (1 + ALPHA * (AMBIENT_C + rise - 20.0))
+        return current * rho * length / (width * thickness)
+    return [i * RHO_20C * (1 + ALPHA * (AMBIENT_C + r - 20.0)) * l / (w * t)
+            for i, l, w, t, r in zip(current, length, width, thickness, rise)]
+
+
+def _length(track) -> float:
+    if track.mid is None:
+        return math.dist(track.start, track.end)
+    return math.dist(track.start, track.mid) + math.dist(track.mid, track.end)
+
+
+def net_currents() -> dict:
+    return {net: float(POWER_REQUIREMENTS[src]["applied_current"])
+            for net, src in NET_SOURCES.items()}
+
+
+def collect_copper(board, currents: dict) -> list:
+    """(net, kind, layer, width, length, where) for copper on the checked nets."""
+    def checked(net):
+        name = net.rsplit("/", 1)[-1]  # Hierarchical names: /Power_In/VBAT
+        return name if name in currents else None
+
+    copper = []
+    for layer, tracks in sorted(board.tracks_by_layer.items()):
+        for t in tracks:
+            net = checked(t.net)
+            if net and t.width > 0:
+                where = f"({t.start[0]:g},{t.start[1]:g})-({t.end[0]:g},{t.end[1]:g})"
+                copper.append((net, "track", layer, t.width, _length(t), where))
+    for z in board.zones:
+        net = checked(z.net)
+        if not net or z.keepout or not z.bbox:
+            continue
+        x0, y0, x1, y1 = z.bbox
+        width, length = sorted((x1 - x0, y1 - y0))
+        if width <= 0:
+            continue
+        for layer in z.layers:
+            if layer.endswith(".Cu") and not layer.startswith("*"):
+                copper.append((net, "zone", layer, width, length, z.name or f"zone at ({x0:g},{y0:g})"))
+    return copper
+
+
+def analyse(board, currents: dict):
+    """Per-item rise and drop: returns (copper, rises, drops)."""
+    copper = collect_copper(board, currents)
+    if not copper:
+        return copper, [], []
+    thickness = board.copper_thickness
+    amps = [currents[c[0]] for c in copper]
+    widths = [c[3] for c in copper]
+    lengths = [c[4] for c in copper]
+    t = [thickness.get(c[2], DEFAULT_THICKNESS) for c in copper]
+    if np is not None:
+        areas = np.asarray(widths) * np.asarray(t) * MIL2_PER_MM2
+    else:
+        areas = [w * th * MIL2_PER_MM2 for w, th in zip(widths, t)]
+    rises = temperature_rise(amps, areas)
+    drops = voltage_drop(amps, lengths, widths, t, rises)
+    return copper, [float(r) for r in rises], [float(d) for d in drops]
+
+
+def main() -> int:
+    path = Path(sys.argv[1]) if len(sys.argv) > 1 else sedu_board.PCB
+    try:
+        board = sedu_board.load_board(path)
+    except (OSError, sedu_sexpr.SExprError) as e:
+        print(f"[copper] FAIL: cannot read {path.name}: {e}")
+        return 1
+
+    currents = net_currents()
+    t0 = time.perf_counter()
+    copper, rises, drops = analyse(board, currents)
+    elapsed = time.perf_counter() - t0
+
+    print(f"[copper] {path.name}: IPC-2152 baseline, {AMBIENT_C:g} C ambient, "
+          f"max rise {MAX_RISE_C:g} C ({'NumPy' if np is not None else 'pure Python'})")
+    if not copper:
+        print(f"[copper] INFO: no copper yet on {', '.join(currents)} - nothing to check")
+        return 0
+
+    rc = 0
+    for net, amps in currents.items():
+        rows = [i for i, c in enumerate(copper) if c[0] == net]
+        if not rows:
+            print(f"[copper] INFO: {net:10s} {amps:5.1f} A  no copper yet")
+            continue
+        worst = max(rows, key=lambda i: rises[i])
+        _, kind, layer, width, _, where = copper[worst]
+        tracks = [i for i in rows if copper[i][1] == "track"]
+        drop = max(tracks, key=lambda i: drops[i]) if tracks else None
+        status = "OK" if rises[worst] <= MAX_RISE_C else "FAIL"
+        if status == "FAIL":
+            rc = 1
+        if drop is None:
+            drop_text = ""
+        else:  # Beyond the chart the drop is taken at its top rise: a lower bound
+            bound = ">= " if beyond_chart(rises[drop]) else ""
+            drop_text = f"  worst segment drop {bound}{drops[drop] * 1000:.1f} mV"
+        print(f"[copper] {status}: {net:10s} {amps:5.1f} A  {len(rows)} items  "
+              f"worst {format_rise(rises[worst])} at {width:g} mm {kind} on {layer} {where}"
+              f"{drop_text}")
+        if status == "FAIL":
+            thickness = board.copper_thickness.get(layer, DEFAULT_THICKNESS)
+            needed = required_area(amps, MAX_RISE_C) / MIL2_PER_MM2 / thickness
+            print(f"         needs >= {needed:.1f} mm at {thickness * 1000:g} um on {layer} "
+                  f"for +{MAX_RISE_C:g} C")
+
+    print(f"[copper] {len(copper)} copper items analysed in {elapsed * 1000:.1f} ms")
+    if rc == 0:
+        print("[copper] PASS: High-current copper within temperature-rise limit")
+    else:
+        print(f"[copper] FAIL: Copper bottleneck exceeds {MAX_RISE_C:g} C rise")
+    return rc
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -17,6 +17,8 @@ import sys
 from pathlib import Path
 import yaml
 
+import sedu_db
+
 
 def load_database():
     """Load design database from YAML."""
@@ -26,8 +28,7 @@ def load_database():
         sys.exit(1)
 
     try:
-        with open(db_path, 'r', encoding='utf-8') as f:
-            return yaml.safe_load(f)
+        return sedu_db.load_database(db_path)
     except yaml.YAMLError as e:
         print(f"[ERROR] Failed to parse YAML: {e}")
         sys.exit(1)
@@ -15,6 +15,9 @@ import re
 import sys
 from typing import Set, List
 
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent))
+import sedu_scan
+
 ROOT = pathlib.Path(__file__).resolve().parents[1]
 INDEX = ROOT / "docs" / "DOCS_INDEX.md"
 SCAN_DIRS = ["docs", "hardware", "firmware", "scripts", "archive"]
@@ -36,31 +39,44 @@ def extract_paths(md_text: str) -> Set[pathlib.Path]:
     return paths
 
 
+def is_artifact(rel: pathlib.Path) -> bool:
+    if not any(rel.as_posix().startswith(d + "/") for d in SCAN_DIRS):
+        return False
+    if rel.name in IGNORE_NAMES:
+        return False
+    if any(rel.suffix.endswith(s) for s in IGNORE_SUFFIXES):
+        return False
+    return True
+
+
 def list_repo_artifacts() -> Set[pathlib.Path]:
-    results: Set[pathlib.Path] = set()
-    for d in SCAN_DIRS:
-        base = ROOT / d
-        if not base.exists():
-            continue
-        for p in base.rglob("*"):
-            rel = p.relative_to(ROOT)
-            if p.is_dir():
-                continue
-            if rel.name in IGNORE_NAMES:
-                continue
-            if any(rel.suffix.endswith(s) for s in IGNORE_SUFFIXES):
-                continue
-            results.add(rel)
-    return results
+    scanner = DocsIndexScanner()
+    for repo_file in sedu_scan.list_files(ROOT):
+        scanner.visit(repo_file)
+    return scanner.artifacts
 
 
-def main() -> int:
+class DocsIndexScanner:
+    """sedu_scan scanner: collects artifacts under SCAN_DIRS (paths only, no reads)."""
+
+    def __init__(self):
+        self.artifacts: Set[pathlib.Path] = set()
+
+    def visit(self, repo_file: sedu_scan.RepoFile) -> None:
+        rel = pathlib.Path(repo_file.rel)
+        if is_artifact(rel):
+            self.artifacts.add(rel)
+
+    def report(self) -> int:
+        return check_index(self.artifacts)
+
+
+def check_index(repo: Set[pathlib.Path]) -> int:
     if not INDEX.exists():
         print("[docs_index] Missing docs/DOCS_INDEX.md")
         return 1
     md_text = INDEX.read_text(encoding="utf-8")
     listed = extract_paths(md_text)
-    repo = list_repo_artifacts()
 
     missing: List[pathlib.Path] = []
     for p in sorted(listed):
@@ -86,6 +102,10 @@ def main() -> int:
     return rc
 
 
+def main() -> int:
+    return sedu_scan.run_scanners([DocsIndexScanner()])
+
+
 if __name__ == "__main__":
     sys.exit(main())
 
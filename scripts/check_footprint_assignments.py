@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""Validate hardware/Footprint_Assignments.csv against the footprint libraries.
+
+Checks:
+1. Every row is Ref,Library:Footprint and no ref is assigned twice
+2. Footprints in available libraries exist (sedu_fplib index); rows whose
+   library is not installed here (KiCad stock libraries without
+   KICAD*_FOOTPRINT_DIR) are listed as unverified, not failed
+3. Refs placed with a SEDU placeholder symbol (Schematic_Place_List.csv
+   Value/MPN = symbol name) use the symbol's default footprint
+4. Symbol pin count vs footprint pad count where both are known (warning
+   only - placeholder symbols omit pins by design)
+
+Exit codes:
+ 0 = OK, 1 = violations found
+"""
+from __future__ import annotations
+
+import csv
+import pathlib
+import sys
+
+import sedu_fplib
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+ASSIGNMENTS = ROOT / "hardware" / "Footprint_Assignments.csv"
+PLACE_LIST = ROOT / "hardware" / "Schematic_Place_List.csv"
+
+
+def load_assignments(path: pathlib.Path):
+    """Return ({ref: lib_id}, [problems]); '#' lines are comments."""
+    assignments, problems = {}, []
+    with path.open(newline="", encoding="utf-8") as f:
+        rows = [r for r in csv.reader(f) if r and not r[0].lstrip().startswith("#")]
+    for line, row in enumerate(rows[1:], start=2):
+        ref = row[0].strip()
+        lib_id = row[1].strip() if len(row) > 1 else ""
+        if ":" not in lib_id or not ref:
+            problems.append(f"row {line}: '{','.join(row)}' is not Ref,Library:Footprint")
+        elif ref in assignments:
+            problems.append(f"{ref} assigned twice ({assignments[ref]}, {lib_id})")
+        else:
+            assignments[ref] = lib_id
+    return assignments, problems
+
+
+def load_placed_symbols(symbols: dict) -> dict:
+    """Ref -> SymbolInfo for refs whose Value/MPN names a library symbol."""
+    by_name = {lib_id.split(":", 1)[1]: info for lib_id, info in symbols.items()}
+    placed = {}
+    if not PLACE_LIST.exists():
+        return placed
+    with PLACE_LIST.open(newline="", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            ref, value = (row.get("Ref") or "").strip(), (row.get("Value/MPN") or "").strip()
+            if ref and value in by_name:
+                placed[ref] = by_name[value]
+    return placed
+
+
+def main() -> int:
+    rc = 0
+    if not ASSIGNMENTS.exists():
+        print("[fp_assign] FAIL: hardware/Footprint_Assignments.csv not found")
+        return 1
+
+    assignments, problems = load_assignments(ASSIGNMENTS)
+    for problem in problems:
+        print(f"[fp_assign] FAIL: {problem}")
+        rc = 1
+
+    index = sedu_fplib.FootprintIndex.load()
+    print(f"[fp_assign] {len(assignments)} assignments, {len(index.libraries)} footprint libraries "
+          f"({len(index.entries)} footprints indexed, {index.parsed} parsed this run)")
+    for path, message in index.errors:
+        print(f"[fp_assign] FAIL: cannot read {path}: {message}")
+        rc = 1
+
+    # 2. Existence in available libraries
+    unverified = {}
+    for ref, lib_id in sorted(assignments.items()):
+        if not index.has_library(lib_id):
+            unverified.setdefault(lib_id.split(":", 1)[0], []).append(ref)
+        elif index.get(lib_id) is None:
+            print(f"[fp_assign] FAIL: {ref}: {lib_id} not found in library")
+            rc = 1
+    verified = len(assignments) - sum(len(refs) for refs in unverified.values())
+    print(f"[fp_assign] {verified} assignments checked against available libraries")
+    if unverified:
+        print(f"[fp_assign] INFO: {len(unverified)} libraries not installed, "
+              f"{sum(len(r) for r in unverified.values())} assignments unverified:")
+        for lib, refs in sorted(unverified.items()):
+            print(f"  - {lib}: {', '.join(refs)}")
+
+    # 3./4. Symbol cross-check
+    placed = load_placed_symbols(sedu_fplib.load_symbols())
+    for ref, symbol in sorted(placed.items()):
+        lib_id = assignments.get(ref)
+        if lib_id is None:
+            print(f"[fp_assign] FAIL: {ref} ({symbol.lib_id}) has no footprint assignment")
+            rc = 1
+            continue
+        if symbol.footprint and symbol.footprint != lib_id:
+            print(f"[fp_assign] FAIL: {ref}: assigned {lib_id}, "
+                  f"but symbol {symbol.lib_id} defaults to {symbol.footprint}")
+            rc = 1
+        info = index.get(lib_id)
+        if info is not None and info.pad_count != len(symbol.pins):
+            print(f"[fp_assign] WARNING: {ref}: {len(symbol.pins)} symbol pins vs "
+                  f"{info.pad_count} pads on {lib_id}")
+    print(f"[fp_assign] {len(placed)} refs cross-checked against placeholder symbols")
+
+    if rc == 0:
+        print("[fp_assign] PASS: Footprint assignments consistent")
+    else:
+        print("[fp_assign] FAIL: Footprint assignment check failed")
+    return rc
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -14,11 +14,15 @@ through verification.
 """
 from __future__ import annotations
 
+import bisect
 import pathlib
 import re
 import sys
 from typing import Dict, List, Tuple
 
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent))
+import sedu_scan
+
 ROOT = pathlib.Path(__file__).resolve().parents[1]
 
 # ============================================================================
@@ -109,6 +113,7 @@ ALLOWLIST_PATTERNS = [
 
     # Scripts (may contain banned strings for verification purposes)
     r"scripts/.*\.py$",  # All verification scripts
+    r"tests/.*\.py$",  # Script tests (feed banned strings to the matcher)
 
     # Files that explicitly document what to check/avoid
     r"GITHUB_ISSUES\.md$",  # Issue tracking (may reference old parts)
@@ -198,39 +203,259 @@ def is_safe_context(line: str, banned_string: str) -> bool:
     return False
 
 
+# ============================================================================
+# COMPILED MATCHER
+# ============================================================================
+
+class BannedMatcher:
+    """
+    All BANNED_PATTERNS compiled once and applied to whole files.
+
+    Each pattern gets a required literal (e.g. "TPS62133", "49.9", "80")
+    taken from its regex. A file that does not contain a pattern's literal
+    is never searched with that pattern, so the common clean file costs a
+    few substring tests instead of lines x patterns regex calls.
+
+    Patterns are applied to the whole text with whitespace classes narrowed to
+    "whitespace except newline", so matches never span lines - the same
+    hits a line-by-line search would find. Hits are mapped back to line
+    numbers with bisect over the newline offsets.
+
+    find_bytes() runs UTF-8 byte versions of the same patterns over a
+    memory-mapped file, so large files are never decoded whole.
+    """
+
+    def __init__(self, patterns: Dict[str, dict]):
+        self.entries = []
+        self.byte_entries = []
+        for pattern in patterns:
+            ignore_case = pattern.startswith(r"\b")
+            flags = re.IGNORECASE if ignore_case else 0
+            compiled = re.compile(pattern.replace(r"\s", r"[^\S\n]"), flags)
+            literal = required_literal(pattern)
+            if ignore_case:
+                literal = literal.lower()
+            self.entries.append((pattern, compiled, literal, ignore_case))
+
+            compiled_bytes = re.compile(bytes_pattern(pattern), flags)
+            # A case-insensitive literal with letters cannot be found with bytes.find()
+            literal_bytes = literal.encode("utf-8") if literal.lower() == literal.upper() or not ignore_case else b""
+            self.byte_entries.append((pattern, compiled_bytes, literal_bytes))
+
+    def find(self, text: str) -> List[Tuple[int, str]]:
+        """Return sorted (line_index, pattern) pairs, at most one per line and pattern."""
+        text_lower = None
+        hits = set()
+        line_starts = None
+        for order, (pattern, compiled, literal, ignore_case) in enumerate(self.entries):
+            if ignore_case:
+                if text_lower is None:
+                    text_lower = text.lower()
+                haystack = text_lower
+            else:
+                haystack = text
+            if literal not in haystack:
+                continue
+            for match in compiled.finditer(text):
+                if line_starts is None:
+                    line_starts = [0] + [m.end() for m in re.finditer("\n", text)]
+                hits.add((bisect.bisect_right(line_starts, match.start()) - 1, order))
+        return [(line_idx, self.entries[order][0]) for line_idx, order in sorted(hits)]
+
+    def find_bytes(self, buf) -> List[Tuple[int, str, str]]:
+        """Like find() for a bytes-like buffer (e.g. mmap); returns (line_index, line_text, pattern)."""
+        starts = []
+        for order, (pattern, compiled, literal) in enumerate(self.byte_entries):
+            if literal and buf.find(literal) == -1:
+                continue
+            starts.extend((match.start(), order) for match in compiled.finditer(buf))
+
+        results = {}
+        line_idx, pos = 0, 0
+        for start, order in sorted(starts):
+            line_idx += count_newlines(buf, pos, start)
+            pos = start
+            if (line_idx, order) in results:
+                continue
+            begin = buf.rfind(b"\n", 0, start) + 1
+            end = buf.find(b"\n", start)
+            line = buf[begin:end if end != -1 else len(buf)].decode("utf-8", errors="ignore")
+            results[(line_idx, order)] = line
+        return [(line_idx, line, self.byte_entries[order][0])
+                for (line_idx, order), line in sorted(results.items())]
+
+
+def count_newlines(buf, start: int, end: int, chunk: int = 1 << 20) -> int:
+    """Newlines in buf[start:end], counted in chunks (mmap has no count())."""
+    total = 0
+    for pos in range(start, end, chunk):
+        total += buf[pos:min(pos + chunk, end)].count(b"\n")
+    return total
+
+
+def bytes_pattern(pattern: str) -> bytes:
+    """
+    UTF-8 byte regex equivalent to a BANNED_PATTERNS entry.
+
+    Character classes holding non-ASCII characters (e.g. "[×x]") become
+    alternations, since "×" is two bytes in UTF-8.
+    """
+    def expand(match):
+        members = match.group(1)
+        if members.isascii() or "-" in members or members.startswith("^"):
+            return match.group(0)
+        return "(?:" + "|".join(re.escape(ch) for ch in members) + ")"
+
+    pattern = pattern.replace(r"\s", r"[^\S\n]")
+    pattern = re.sub(r"(?<!\\)\[([^\]\\]+)\]", expand, pattern)
+    return pattern.encode("utf-8")
+
+
+def required_literal(pattern: str) -> str:
+    """
+    Longest run of plain characters every match of pattern must contain.
+
+    Conservative: only literal characters outside groups count. Groups
+    (including lookarounds), character classes, escape classes (\\s, \\d,
+    \\b ...), "." and anchors end a run, and so does a character followed
+    by "?", "*" or "{" (it may be absent or repeated). Returns "" (no
+    prefilter) for alternations.
+    """
+    if "|" in pattern:
+        return ""
+    runs, current = [], ""
+    i = 0
+    while i < len(pattern):
+        ch = pattern[i]
+        literal = None
+        if ch == "\\" and i + 1 < len(pattern):
+            if not pattern[i + 1].isalnum():  # \. \- ... are literals
+                literal = pattern[i + 1]
+            i += 2
+        elif ch == "(":
+            i = _group_end(pattern, i)
+        elif ch == "[":
+            i = _class_end(pattern, i)
+        elif ch in ".^$":
+            i += 1
+        else:
+            literal = ch
+            i += 1
+
+        quantifier = pattern[i] if i < len(pattern) else ""
+        if literal is not None and quantifier not in ("?", "*", "{"):
+            current += literal
+        else:
+            runs.append(current)
+            current = ""
+        if quantifier == "{":
+            i = pattern.index("}", i) + 1
+        elif quantifier in ("?", "*", "+"):
+            i += 1
+        if quantifier and i < len(pattern) and pattern[i] in "?+":  # lazy / possessive
+            i += 1
+        if quantifier == "+":  # repeated: what follows is not adjacent to the run
+            runs.append(current)
+            current = ""
+    runs.append(current)
+    return max(runs, key=len)
+
+
+def _class_end(pattern: str, i: int) -> int:
+    """Index just past the character class starting at pattern[i] == "["."""
+    j = i + 1
+    if j < len(pattern) and pattern[j] == "^":
+        j += 1
+    if j < len(pattern) and pattern[j] == "]":  # "]" first is a member
+        j += 1
+    while j < len(pattern) and pattern[j] != "]":
+        j += 2 if pattern[j] == "\\" else 1
+    return j + 1
+
+
+def _group_end(pattern: str, i: int) -> int:
+    """Index just past the group starting at pattern[i] == "("."""
+    depth = 0
+    j = i
+    while j < len(pattern):
+        ch = pattern[j]
+        if ch == "\\":
+            j += 2
+            continue
+        if ch == "[":
+            j = _class_end(pattern, j)
+            continue
+        if ch == "(":
+            depth += 1
+        elif ch == ")":
+            depth -= 1
+            if depth == 0:
+                return j + 1
+        j += 1
+    return j
+
+
+MATCHER = BannedMatcher(BANNED_PATTERNS)
+
+
+def build_violations(hits) -> List[Tuple[int, str, str, str]]:
+    """Turn (line_index, line_text, pattern) hits into violations, dropping safe contexts."""
+    violations = []
+
+    for line_idx, line, pattern in hits:
+        # Check if it's in a safe context
+        if not is_safe_context(line, pattern):
+            violations.append((
+                line_idx + 1,
+                line.strip(),
+                pattern,
+                BANNED_PATTERNS[pattern]["reason"]
+            ))
+
+    return violations
+
+
+def scan_text(text: str) -> List[Tuple[int, str, str, str]]:
+    """
+    Scan file content for frozen state violations.
+
+    Returns: List of (line_number, line_text, banned_pattern, reason)
+    """
+    lines = text.split("\n")
+    return build_violations((line_idx, lines[line_idx], pattern)
+                            for line_idx, pattern in MATCHER.find(text))
+
+
+def scan_buffer(buf) -> List[Tuple[int, str, str, str]]:
+    """Scan raw UTF-8 bytes (typically an mmap of a large file) for violations."""
+    return build_violations(MATCHER.find_bytes(buf))
+
+
+def scan_repo_file(repo_file: sedu_scan.RepoFile):
+    """Violations for one repository file, or None if its content is binary."""
+    if repo_file.is_binary:
+        return None
+    if repo_file.is_large:
+        with repo_file.mapped() as buf:
+            return scan_buffer(buf)
+    return scan_text(repo_file.text)
+
+
 def scan_file(file_path: pathlib.Path) -> List[Tuple[int, str, str, str]]:
     """
     Scan a file for frozen state violations.
 
     Returns: List of (line_number, line_text, banned_pattern, reason)
     """
-    violations = []
-
     try:
-        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-            lines = f.readlines()
+        return scan_repo_file(sedu_scan.RepoFile(file_path, file_path.name)) or []
     except Exception as e:
         # Skip files that can't be read
-        return violations
-
-    for line_num, line in enumerate(lines, 1):
-        for pattern, info in BANNED_PATTERNS.items():
-            # Check if banned pattern exists in line
-            if re.search(pattern, line, re.IGNORECASE if pattern.startswith(r"\b") else 0):
-                # Check if it's in a safe context
-                if not is_safe_context(line, pattern):
-                    violations.append((
-                        line_num,
-                        line.strip(),
-                        pattern,
-                        info["reason"]
-                    ))
-
-    return violations
+        return []
 
 
-def main() -> int:
-    """Main verification function."""
+def report(all_violations: Dict[pathlib.Path, list], files_scanned: int, files_skipped: int) -> int:
+    """Print scan results; returns 0 if clean, 1 if violations were found."""
     print("=" * 80)
     print("FROZEN STATE VIOLATION CHECKER - Rev C.4b")
     print("=" * 80)
@@ -238,36 +463,6 @@ def main() -> int:
     print("Scanning for obsolete values that contradict FROZEN_STATE_REV_C4b.md...")
     print()
 
-    all_violations = {}
-    files_scanned = 0
-    files_skipped = 0
-
-    # Scan all text files in repo
-    for file_path in ROOT.rglob("*"):
-        # Skip directories
-        if file_path.is_dir():
-            continue
-
-        # Skip binary files
-        if file_path.suffix in {".pdf", ".jpg", ".png", ".pyc", ".so", ".dll", ".exe"}:
-            continue
-
-        # Skip git internals
-        if ".git" in str(file_path):
-            continue
-
-        # Check allowlist
-        if is_allowlisted(file_path):
-            files_skipped += 1
-            continue
-
-        # Scan file
-        violations = scan_file(file_path)
-        if violations:
-            all_violations[file_path] = violations
-
-        files_scanned += 1
-
     # Report results
     print(f"Files scanned: {files_scanned}")
     print(f"Files skipped (allowlisted): {files_skipped}")
@@ -328,5 +523,59 @@ def main() -> int:
     return 1
 
 
+# Anything that changes per-file results; a new value discards the scan cache
+RULESET = sedu_scan.fingerprint(
+    BANNED_PATTERNS, ALLOWLIST_PATTERNS, SAFE_CONTEXT_PHRASES,
+    sedu_scan.source_digest(__file__),
+)
+
+
+class FrozenStateScanner:
+    """sedu_scan scanner: collects violations from every non-allowlisted text file."""
+
+    def __init__(self):
+        self.cache = sedu_scan.ResultCache("frozen_state", RULESET)
+        self.all_violations = {}
+        self.files_scanned = 0
+        self.files_skipped = 0
+
+    def visit(self, repo_file: sedu_scan.RepoFile) -> None:
+        # Skip binary files (by name here; content sniffing happens on a cache miss)
+        if repo_file.has_binary_suffix:
+            return
+
+        # Skip git metadata (.gitignore, .github/)
+        if ".git" in repo_file.rel:
+            return
+
+        # Check allowlist
+        if is_allowlisted(repo_file.path):
+            self.files_skipped += 1
+            return
+
+        # Too large for its type - reported by sedu_scan instead
+        if repo_file.oversize:
+            return
+
+        # Scan file (unchanged content reuses the cached result)
+        violations = self.cache.get(repo_file, scan_repo_file)
+        if violations is None:  # Sniffed as binary
+            return
+        violations = [tuple(v) for v in violations]
+        if violations:
+            self.all_violations[repo_file.path] = violations
+
+        self.files_scanned += 1
+
+    def report(self) -> int:
+        self.cache.save()
+        return report(self.all_violations, self.files_scanned, self.files_skipped)
+
+
+def main() -> int:
+    """Main verification function."""
+    return sedu_scan.run_scanners([FrozenStateScanner()])
+
+
 if __name__ == "__main__":
     sys.exit(main())
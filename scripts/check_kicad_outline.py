@@ -7,6 +7,9 @@ Checks:
 1. Database has correct board_size (80x50mm) and mounting_holes
 2. KiCad PCB file implements database specification correctly
 
+The board is read through the cached board model (sedu_board.py), so an
+unchanged PCB is not reparsed.
+
 Exit codes:
  0 = OK, 1 = violations found
 """
@@ -14,10 +17,13 @@ from __future__ import annotations
 
 import math
 import pathlib
-import re
 import sys
 import yaml
 
+import sedu_board
+import sedu_db
+import sedu_sexpr
+
 ROOT = pathlib.Path(__file__).resolve().parents[1]
 PCB = ROOT / "hardware" / "SEDU_PCB.kicad_pcb"
 DATABASE = ROOT / "design_database.yaml"
@@ -30,18 +36,13 @@ def load_database():
         sys.exit(1)
 
     try:
-        with open(DATABASE, 'r', encoding='utf-8') as f:
-            return yaml.safe_load(f)
+        return sedu_db.load_database(DATABASE)
     except yaml.YAMLError as e:
         print(f"[kicad_outline] ERROR: Failed to parse database: {e}")
         sys.exit(1)
 
 
-def parse_outline_and_holes(text: str):
-    # Edge.Cuts rectangle
-    rect = re.search(r"\(gr_rect \(start ([\d\.]+) ([\d\.]+)\) \(end ([\d\.]+) ([\d\.]+)\) \(layer \"Edge.Cuts\"\)", text)
-    holes = re.findall(r"MountingHole_3\.2mm_M3.*?\(at ([\d\.]+) ([\d\.]+)\).*?\(drill 3\.2\)", text, re.S)
-    return rect, [(float(x), float(y)) for x, y in holes]
+HOLE_DRILL = 3.2
 
 
 def main() -> int:
@@ -84,14 +85,19 @@ def main() -> int:
         print("[kicad_outline] Database values validated, KiCad check skipped")
         return rc
 
-    text = PCB.read_text(encoding="utf-8")
-    rect, holes = parse_outline_and_holes(text)
+    try:
+        board = sedu_board.load_board(PCB)
+    except (OSError, sedu_sexpr.SExprError) as e:
+        print(f"[kicad_outline] FAIL: Cannot parse {PCB.name}: {e}")
+        return 1
+    bbox = board.outline_bbox
+    holes = board.mounting_holes(HOLE_DRILL)
 
-    if not rect:
-        print("[kicad_outline] FAIL: Edge.Cuts rectangle not found in KiCad file")
+    if not bbox:
+        print("[kicad_outline] FAIL: Edge.Cuts outline not found in KiCad file")
         rc = 1
     else:
-        x0, y0, x1, y1 = map(float, rect.groups())
+        x0, y0, x1, y1 = bbox
         w = abs(x1 - x0)
         h = abs(y1 - y0)
 
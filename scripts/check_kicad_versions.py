@@ -3,6 +3,10 @@
 
 This does not fail the build; it prints the versions found so we can
 record them in docs/TOOL_VERSIONS.md and decide whether to upgrade.
+
+Every .kicad_* file under hardware/ (sheets, board, project, symbol and
+footprint libraries) is probed from its first HEADER_BYTES only, so the
+cost per file stays constant however large the board grows.
 """
 from __future__ import annotations
 
@@ -10,28 +14,81 @@ import pathlib
 import re
 
 ROOT = pathlib.Path(__file__).resolve().parents[1]
+HARDWARE = ROOT / "hardware"
+
+# KiCad writes the file head, version and generator on the first lines
+HEADER_BYTES = 4096
+
+SEXPR_HEAD = re.compile(rb"\(\s*([A-Za-z_]+)")
+SEXPR_VERSION = re.compile(rb"\(version\s+(\d+)\)")
+SEXPR_GENERATOR = re.compile(rb'\(generator\s+(?:"((?:[^"\\]|\\.)*)"|([^\s()]+))\)')
+JSON_VERSION = re.compile(rb'"meta"\s*:\s*\{[^{}]*?"version"\s*:\s*(\d+)')
+
+# Last format version written by each KiCad release (file dates are YYYYMMDD)
+RELEASES = [(20211231, "6.x"), (20230220, "7.x"), (20240220, "8.x")]
+
+
+def release_for(version: str | None) -> str:
+    if not version or len(version) != 8:
+        return "-"
+    for last, release in RELEASES:
+        if int(version) <= last:
+            return release
+    return "9.x+"
 
-PCB = ROOT / "hardware" / "SEDU_PCB.kicad_pcb"
-TOP_SCH = ROOT / "hardware" / "SEDU_PCB.kicad_sch"
 
-def extract_version(text: str) -> str | None:
-    m = re.search(r"\(version\s+(\d{6,})\)", text)
-    return m.group(1) if m else None
+def probe(path: pathlib.Path) -> dict:
+    """Head, format version and generator from the start of one file."""
+    with path.open("rb") as f:
+        header = f.read(HEADER_BYTES)
+    info = {"head": "-", "version": None, "generator": "-"}
+    if header.lstrip().startswith(b"{"):  # .kicad_pro / .kicad_prl are JSON
+        m = JSON_VERSION.search(header)
+        info.update(head="json", version=m.group(1).decode() if m else None)
+        return info
+    m = SEXPR_HEAD.search(header)
+    if m:
+        info["head"] = m.group(1).decode()
+    m = SEXPR_VERSION.search(header)
+    if m:
+        info["version"] = m.group(1).decode()
+    m = SEXPR_GENERATOR.search(header)
+    if m:
+        info["generator"] = (m.group(1) or m.group(2)).decode("utf-8", errors="replace")
+    return info
+
 
 def main() -> int:
-    if PCB.exists():
-        pv = extract_version(PCB.read_text(encoding="utf-8", errors="ignore"))
-        print(f"[kicad_ver] PCB file format version: {pv or 'unknown'} ({PCB})")
-    else:
-        print("[kicad_ver] PCB file not found")
-    if TOP_SCH.exists():
-        sv = extract_version(TOP_SCH.read_text(encoding="utf-8", errors="ignore"))
-        print(f"[kicad_ver] SCH file format version: {sv or 'unknown'} ({TOP_SCH})")
-    else:
-        print("[kicad_ver] Schematic file not found")
+    files = sorted(p for p in HARDWARE.rglob("*.kicad_*") if p.is_file())
+    if not files:
+        print("[kicad_ver] No KiCad files found under hardware/")
+        return 0
+
+    rows = []
+    for path in files:
+        rel = path.relative_to(HARDWARE).as_posix()
+        try:
+            info = probe(path)
+        except OSError as e:
+            print(f"[kicad_ver] WARNING: cannot read {rel}: {e}")
+            continue
+        if info["version"] is None and info["head"] == "module":
+            info["version"] = "legacy"  # KiCad 5 footprint, no version token
+        rows.append((rel, info))
+
+    width = max(len(rel) for rel, _ in rows)
+    print(f"[kicad_ver] {'File':<{width}}  {'Head':<18} {'Version':<9} {'KiCad':<6} Generator")
+    for rel, info in rows:
+        version = info["version"] or "unknown"
+        print(f"[kicad_ver] {rel:<{width}}  {info['head']:<18} {version:<9} "
+              f"{release_for(info['version']):<6} {info['generator']}")
+
+    dated = {info["version"] for _, info in rows if info["version"] and len(info["version"]) == 8}
+    if len(dated) > 1:
+        print(f"[kicad_ver] NOTE: mixed format versions: {', '.join(sorted(dated))}")
     print("[kicad_ver] Target KiCad: 8.x stable — ok to open and save to upgrade formats.")
     return 0
 
+
 if __name__ == "__main__":
     raise SystemExit(main())
-
@@ -19,6 +19,8 @@ import re
 import sys
 import yaml
 
+import sedu_db
+
 ROOT = pathlib.Path(__file__).resolve().parents[1]
 DATABASE = ROOT / "design_database.yaml"
 FW = ROOT / "firmware" / "src" / "input_ladder.cpp"
@@ -31,8 +33,7 @@ def load_database():
         sys.exit(1)
 
     try:
-        with open(DATABASE, 'r', encoding='utf-8') as f:
-            return yaml.safe_load(f)
+        return sedu_db.load_database(DATABASE)
     except yaml.YAMLError as e:
         print(f"[ladder_bands] ERROR: Failed to parse database: {e}")
         sys.exit(1)
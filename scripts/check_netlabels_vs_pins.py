@@ -8,6 +8,8 @@ Checks:
 2. Net Labels CSV contains all GPIO function names
 3. Net Labels CSV contains all power rail names
 4. Net Labels CSV contains common nets (GND, motor phases)
+5. Schematic sheets (hardware/*.kicad_sch) name all required nets, once
+   they contain any nets (sedu_netlist.py)
 
 Exit codes:
  0 = OK, 1 = violations found
@@ -19,6 +21,10 @@ import pathlib
 import sys
 import yaml
 
+import sedu_db
+import sedu_netlist
+import sedu_sexpr
+
 ROOT = pathlib.Path(__file__).resolve().parents[1]
 DATABASE = ROOT / "design_database.yaml"
 NETS = ROOT / "hardware" / "Net_Labels.csv"
@@ -31,8 +37,7 @@ def load_database():
         sys.exit(1)
 
     try:
-        with open(DATABASE, 'r', encoding='utf-8') as f:
-            return yaml.safe_load(f)
+        return sedu_db.load_database(DATABASE)
     except yaml.YAMLError as e:
         print(f"[nets_vs_pins] ERROR: Failed to parse database: {e}")
         sys.exit(1)
@@ -87,6 +92,31 @@ def build_required_nets(db):
     return required, categorized
 
 
+def check_schematic(required_nets: set[str]) -> int:
+    """Compare required nets against the nets extracted from the schematic."""
+    try:
+        netlist = sedu_netlist.extract()
+    except (OSError, sedu_sexpr.SExprError) as e:
+        print(f"[nets_vs_pins] FAIL: Cannot read schematic: {e}")
+        return 1
+
+    print(f"[nets_vs_pins] Schematic: {len(netlist.sheets)} sheets, {len(netlist.nets)} nets")
+    for parent, child in netlist.missing:
+        print(f"[nets_vs_pins] FAIL: {parent} references missing sheet {child}")
+    if not netlist.nets:
+        print("[nets_vs_pins] Schematic has no nets yet (schematic entry not started) - CSV check only")
+        return 1 if netlist.missing else 0
+
+    missing = sorted(required_nets - netlist.label_names())
+    if missing:
+        print(f"[nets_vs_pins] FAIL: {len(missing)} required nets not labelled in schematic:")
+        for n in missing:
+            print(f"    - {n}")
+        return 1
+    print("[nets_vs_pins] PASS: Schematic nets cover all required signals")
+    return 1 if netlist.missing else 0
+
+
 def main() -> int:
     rc = 0
 
@@ -141,6 +171,9 @@ def main() -> int:
     else:
         print("[nets_vs_pins] PASS: Net labels cover all required signals")
 
+    print()
+    rc = max(rc, check_schematic(required_nets))
+
     # Check for unexpected nets (informational only, not an error)
     unexpected = sorted(n for n in nets if n not in required_nets)
     if unexpected:
@@ -14,7 +14,8 @@ Returns 0 if pin map correct, 1 if violations found.
 import sys
 import re
 from pathlib import Path
-import yaml
+
+import sedu_db
 
 
 def load_database():
@@ -24,8 +25,7 @@ def load_database():
         print(f"[ERROR] Database not found: {db_path}")
         sys.exit(1)
 
-    with open(db_path, 'r', encoding='utf-8') as f:
-        return yaml.safe_load(f)
+    return sedu_db.load_database(db_path)
 
 
 def parse_generated_pins_h(path: Path):
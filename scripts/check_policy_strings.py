@@ -8,6 +8,9 @@ from __future__ import annotations
 import pathlib
 import sys
 
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent))
+import sedu_scan
+
 ROOT = pathlib.Path(__file__).resolve().parents[1]
 TLV_BANNED = ["TLV757"]  # wrong LDO family
 BANNED_HW = ["VESC fallback", "PPM", "PWM header"]  # legacy interfaces
@@ -20,34 +23,60 @@ ALLOWLIST = {
 }
 
 
-def scan() -> int:
-    rc = 0
-    for p in ROOT.rglob("*"):
-        if p.is_dir():
-            continue
-        if p.suffix in {".pdf", ".jpg", ".png"}:
-            continue
+# Anything that changes per-file results; a new value discards the scan cache
+RULESET = sedu_scan.fingerprint(TLV_BANNED, BANNED_HW, sedu_scan.source_digest(__file__))
+
+
+def find_banned(repo_file: sedu_scan.RepoFile) -> list:
+    """Content-only part of the rules: [TLV757 present, legacy strings present]."""
+    if repo_file.is_binary:
+        return [False, []]
+    if repo_file.is_large:  # Search the mapping instead of decoding the file
+        with repo_file.mapped() as buf:
+            return [any(buf.find(s.encode()) != -1 for s in TLV_BANNED),
+                    [s for s in BANNED_HW if buf.find(s.encode()) != -1]]
+    text = repo_file.text
+    return [any(s in text for s in TLV_BANNED), [s for s in BANNED_HW if s in text]]
+
+
+class PolicyScanner:
+    """sedu_scan scanner: applies both policy rules to every text file."""
+
+    def __init__(self):
+        self.cache = sedu_scan.ResultCache("policy_strings", RULESET)
+        self.messages = []
+
+    def visit(self, repo_file: sedu_scan.RepoFile) -> None:
+        p = repo_file.path
+        if repo_file.has_binary_suffix:
+            return
         if p in ALLOWLIST:
-            continue
-        try:
-            text = p.read_text(encoding="utf-8", errors="ignore")
-        except Exception:
-            continue
+            return
+        if repo_file.oversize:  # reported by sedu_scan
+            return
+        has_tlv, hw_hits = self.cache.get(repo_file, find_banned)
         # Rule 1: TLV757 banned anywhere except archive/
-        if any(s in text for s in TLV_BANNED):
+        if has_tlv:
             if "archive/" not in str(p):
-                print(f"[policy] {p}: banned LDO string found (TLV757)")
-                rc = 1
-                continue
+                self.messages.append(f"[policy] {p}: banned LDO string found (TLV757)")
+                return
         # Rule 2: legacy interfaces banned only in hardware/, firmware/, New Single Board Idea.md, Component_Report.md
         if "hardware/" in str(p) or "firmware/" in str(p) or p.name in {"New Single Board Idea.md", "Component_Report.md"}:
-            hits = [s for s in BANNED_HW if s in text]
-            if hits:
-                print(f"[policy] {p}: banned legacy strings found: {', '.join(hits)}")
-                rc = 1
-    if rc == 0:
-        print("[policy] No banned strings found outside allowlist. PASS")
-    return rc
+            if hw_hits:
+                self.messages.append(f"[policy] {p}: banned legacy strings found: {', '.join(hw_hits)}")
+
+    def report(self) -> int:
+        self.cache.save()
+        for message in self.messages:
+            print(message)
+        if not self.messages:
+            print("[policy] No banned strings found outside allowlist. PASS")
+            return 0
+        return 1
+
+
+def scan() -> int:
+    return sedu_scan.run_scanners([PolicyScanner()])
 
 
 if __name__ == "__main__":
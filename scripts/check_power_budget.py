@@ -104,6 +104,7 @@ POWER_REQUIREMENTS = {
 }
 
 # Thermal limits
+# Steady-state figures; sedu_transient.py simulates the DRV8873 timeout in time
 THERMAL_LIMITS = {
     "DRV8873": {
         "max_junction_temp": 150,  # °C
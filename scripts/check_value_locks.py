@@ -13,7 +13,9 @@ Returns 0 if all locked values correct, 1 if violations found.
 
 import sys
 from pathlib import Path
-import yaml
+
+import sedu_db
+import sedu_units
 
 
 def load_database():
@@ -23,8 +25,7 @@ def load_database():
         print(f"[ERROR] Database not found: {db_path}")
         sys.exit(1)
 
-    with open(db_path, 'r', encoding='utf-8') as f:
-        return yaml.safe_load(f)
+    return sedu_db.load_database(db_path)
 
 
 def check_locked_values():
@@ -53,6 +54,7 @@ def check_locked_values():
     }
 
     components = db.get('components', {})
+    values = sedu_db.component_values(db)
 
     all_pass = True
     violations = []
@@ -75,16 +77,8 @@ def check_locked_values():
         is_locked = comp.get('locked', False)
         expected_value = expected['value']
 
-        # Normalize values for comparison (handle different formats)
-        def normalize_value(v):
-            v = str(v).lower().replace('ohm', '').replace('f', 'F')
-            v = v.replace('h', 'H')
-            return v.strip()
-
-        actual_norm = normalize_value(actual_value)
-        expected_norm = normalize_value(expected_value)
-
-        if actual_norm != expected_norm:
+        # Compare parsed quantities ("1.00k" == "1k", "10uH" == "10µH")
+        if not sedu_units.same(values.get(ref), sedu_units.parse(expected_value, sedu_units.OHM)):
             print(f"[FAIL] {ref:15s} value mismatch: expected {expected_value}, got {actual_value}")
             violations.append(f"{ref}: Expected {expected_value}, found {actual_value}")
             all_pass = False
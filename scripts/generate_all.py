@@ -5,7 +5,10 @@ SEDU Design File Generator - Master Script
 This script generates ALL derived files from the single-source-of-truth database.
 
 Usage:
-    python scripts/generate_all.py
+    python scripts/generate_all.py           # rebuild outputs whose inputs changed
+    python scripts/generate_all.py --force   # rebuild every output
+    python scripts/generate_all.py --pipeline [--jobs N]
+    python scripts/generate_all.py --check   # exit 1 if an output is stale
 
 Generates:
     - hardware/BOM_Seed.csv (from components)
@@ -14,11 +17,36 @@ Generates:
     - Component_Report.md (from components + ics)
     - docs/POWER_BUDGET_MASTER.md (from components power specs)
 
+Incremental regeneration:
+    Each generator declares DATABASE_SECTIONS. The digest of those sections,
+    of the generator script and the scripts/ modules it imports (e.g.
+    sedu_units.py, sedu_output.py) and of its output are stored in
+    .sedu_cache/generate_manifest.json; a generator only runs when one of
+    them changed. Generators also skip writing byte-identical output, so a
+    GPIO-only edit leaves BOM_Seed.csv and Component_Report.md untouched.
+
+Pipeline mode:
+    The database is parsed once and the same read-only object is handed to
+    every stale generator's render function on a thread pool. Each output
+    is written (atomically, temp file + rename) as soon as its render
+    finishes, overlapping file I/O with the remaining renders. Log lines
+    are printed in GENERATORS order.
+
+Check mode:
+    Every generator renders in memory and the result is compared with the
+    file on disk; nothing is written and the manifest is ignored. Run it
+    before committing a database change, so the generated files go into
+    the same commit.
+
 IMPORTANT: Never edit generated files directly - edit design_database.yaml
 and run this script to regenerate.
 """
 
+import argparse
+import json
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 # Add scripts directory to path
@@ -26,18 +54,154 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 # Import individual generators
 try:
-    from generate_bom import generate_bom
-    from generate_pins_h import generate_pins_h
-    from generate_netlabels import generate_netlabels
-    from generate_component_report import generate_component_report
+    import sedu_db
+    import generate_bom
+    import generate_pins_h
+    import generate_netlabels
+    import generate_component_report
+    from sedu_output import matches, write_if_changed
 except ImportError as e:
     print(f"[ERROR] Failed to import generators: {e}")
     print("Make sure all generator scripts exist in scripts/ directory")
     sys.exit(1)
 
+ROOT = Path(__file__).resolve().parents[1]
+MANIFEST = sedu_db.CACHE_DIR / "generate_manifest.json"
+MANIFEST_VERSION = 2
+
+# (display name, generator module, generator function, render function)
+GENERATORS = [
+    ("BOM (hardware/BOM_Seed.csv)", generate_bom,
+     generate_bom.generate_bom, generate_bom.render_bom),
+    ("pins.h (firmware/include/pins.h)", generate_pins_h,
+     generate_pins_h.generate_pins_h, generate_pins_h.render_pins_h),
+    ("Net Labels (hardware/Net_Labels.csv)", generate_netlabels,
+     generate_netlabels.generate_netlabels, generate_netlabels.render_netlabels),
+    ("Component Report (Component_Report.md)", generate_component_report,
+     generate_component_report.generate_component_report,
+     generate_component_report.render_component_report),
+]
+
+
+def load_manifest() -> dict:
+    """Load the generator manifest, starting fresh if missing or outdated."""
+    try:
+        manifest = json.loads(MANIFEST.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        manifest = {}
+    if manifest.get("version") != MANIFEST_VERSION:
+        manifest = {"version": MANIFEST_VERSION, "outputs": {}}
+    return manifest
+
+
+def save_manifest(manifest: dict) -> None:
+    try:
+        MANIFEST.parent.mkdir(parents=True, exist_ok=True)
+        tmp = MANIFEST.with_suffix(".tmp")
+        tmp.write_text(json.dumps(manifest, indent=1, sort_keys=True), encoding="utf-8")
+        os.replace(tmp, MANIFEST)
+    except OSError as e:
+        print(f"[WARN] Could not write generator manifest: {e}")
+
+
+def generator_state(db, module) -> dict:
+    """Everything that determines a generator's output, as digests."""
+    output = Path(module.OUTPUT_PATH)
+    return {
+        "sections": {s: sedu_db.section_digest(db, s) for s in module.DATABASE_SECTIONS},
+        "scripts": {p: sedu_db.file_digest(ROOT / p)
+                    for p in sedu_db.script_imports(module.__file__)},
+        "output": sedu_db.file_digest(output) if output.exists() else "missing",
+    }
+
+
+def output_key(module) -> str:
+    """Manifest key for a generator: its output path relative to ROOT."""
+    return Path(module.OUTPUT_PATH).relative_to(ROOT).as_posix()
+
+
+def plan_generators(db, manifest: dict, force: bool = False) -> set:
+    """Names of generators whose sections, scripts and output are unchanged."""
+    up_to_date = set()
+    for name, module, _, _ in GENERATORS:
+        if not force and manifest["outputs"].get(output_key(module)) == generator_state(db, module):
+            up_to_date.add(name)
+    return up_to_date
+
+
+def record_output(db, manifest: dict, module, ok: bool) -> None:
+    """Store a generator's state after it ran; forget it if it failed."""
+    if ok:
+        manifest["outputs"][output_key(module)] = generator_state(db, module)
+    else:
+        manifest["outputs"].pop(output_key(module), None)
+
+
+def run_pipeline(db, stale, jobs):
+    """Render stale generators concurrently and write each output on completion.
+
+    stale: list of GENERATORS entries. Returns {name: (ok, message)}.
+    """
+    results = {}
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        futures = {pool.submit(render, db): (name, module)
+                   for name, module, _, render in stale}
+        for future in as_completed(futures):
+            name, module = futures[future]
+            output = output_key(module)
+            try:
+                content = future.result()
+                written = write_if_changed(module.OUTPUT_PATH, content,
+                                           volatile=getattr(module, 'VOLATILE_PATTERN', None))
+            except Exception as e:
+                results[name] = (False, f"FAILED: {e}")
+                continue
+            if written:
+                results[name] = (True, f"Wrote {output}")
+            else:
+                results[name] = (True, f"{output} unchanged - not rewritten")
+    return results
+
+
+def check_outputs(db) -> int:
+    """Compare every generator's rendered output with its file; 1 if any differs."""
+    stale = 0
+    for name, module, _, render in GENERATORS:
+        try:
+            current = matches(module.OUTPUT_PATH, render(db),
+                              volatile=getattr(module, 'VOLATILE_PATTERN', None))
+        except Exception as e:
+            print(f"[FAIL] {name}: render failed: {e}")
+            stale += 1
+            continue
+        if current:
+            print(f"[OK]   {name}")
+        else:
+            print(f"[FAIL] {name}: stale - run python scripts/generate_all.py")
+            stale += 1
+    if stale:
+        print(f"[FAIL] {stale} generated file(s) out of date with design_database.yaml")
+        return 1
+    print("[PASS] All generated files match design_database.yaml")
+    return 0
+
+
+def main(argv=None):
+    """Run generators whose database sections (or outputs) changed."""
+    parser = argparse.ArgumentParser(description="Generate all derived files from design_database.yaml")
+    parser.add_argument("--force", action="store_true",
+                        help="run every generator even if its sections are unchanged")
+    parser.add_argument("--pipeline", action="store_true",
+                        help="render on a thread pool over one in-memory database")
+    parser.add_argument("--jobs", type=int, default=len(GENERATORS),
+                        help="worker threads for --pipeline (default: one per generator)")
+    parser.add_argument("--check", action="store_true",
+                        help="write nothing; exit 1 if a generated file is out of date")
+    args = parser.parse_args(argv)
+
+    if args.check:
+        return check_outputs(sedu_db.load_database())
 
-def main():
-    """Run all generators in sequence."""
     print("=" * 70)
     print("SEDU DESIGN FILE GENERATOR")
     print("=" * 70)
@@ -45,33 +209,59 @@ def main():
     print("Generating all derived files from design_database.yaml...")
     print()
 
-    generators = [
-        ("BOM (hardware/BOM_Seed.csv)", generate_bom),
-        ("pins.h (firmware/include/pins.h)", generate_pins_h),
-        ("Net Labels (hardware/Net_Labels.csv)", generate_netlabels),
-        ("Component Report (Component_Report.md)", generate_component_report),
-    ]
+    db = sedu_db.load_database()
+    manifest = load_manifest()
 
     success_count = 0
     fail_count = 0
+    skip_count = 0
 
-    for name, generator_func in generators:
-        try:
-            print(f"[{success_count + fail_count + 1}/{len(generators)}] Generating {name}...")
-            generator_func()
+    up_to_date = plan_generators(db, manifest, args.force)
+
+    pipeline_results = {}
+    if args.pipeline:
+        stale = [g for g in GENERATORS if g[0] not in up_to_date]
+        pipeline_results = run_pipeline(db, stale, max(1, args.jobs))
+
+    for idx, (name, module, generator_func, _) in enumerate(GENERATORS, 1):
+        if name in up_to_date:
+            print(f"[{idx}/{len(GENERATORS)}] {name}")
+            print(f"    [OK] UP TO DATE ({', '.join(module.DATABASE_SECTIONS)} unchanged)")
+            skip_count += 1
+            success_count += 1
+            print()
+            continue
+
+        print(f"[{idx}/{len(GENERATORS)}] Generating {name}...")
+        if args.pipeline:
+            ok, message = pipeline_results[name]
+            if ok:
+                print(message)
+        else:
+            try:
+                generator_func(db)
+                ok = True
+            except Exception as e:
+                ok, message = False, f"FAILED: {e}"
+
+        record_output(db, manifest, module, ok)
+        if ok:
             print(f"    [OK] SUCCESS")
             success_count += 1
-        except Exception as e:
-            print(f"    [FAIL] FAILED: {e}")
+        else:
+            print(f"    [FAIL] {message}")
             fail_count += 1
         print()
 
+    save_manifest(manifest)
+
     print("=" * 70)
     print("SUMMARY")
     print("=" * 70)
-    print(f"[OK] Successful: {success_count}/{len(generators)}")
+    print(f"[OK] Successful: {success_count}/{len(GENERATORS)}"
+          + (f" ({skip_count} up to date, use --force to rebuild)" if skip_count else ""))
     if fail_count > 0:
-        print(f"[FAIL] Failed:     {fail_count}/{len(generators)}")
+        print(f"[FAIL] Failed:     {fail_count}/{len(GENERATORS)}")
         print()
         print("[FAIL] Some generators failed. Fix errors and re-run.")
         return 1
@@ -8,23 +8,29 @@ DO NOT edit BOM_Seed.csv directly - edit design_database.yaml and regenerate.
 
 import sys
 import csv
+import io
 from pathlib import Path
-import yaml
+
+import sedu_db
+import sedu_units
+from sedu_output import write_if_changed
+
+OUTPUT_PATH = Path(__file__).parent.parent / "hardware" / "BOM_Seed.csv"
+
+# Database sections this generator reads (generate_all.py rebuilds on change)
+DATABASE_SECTIONS = ['components']
 
 
 def load_database():
     """Load design database from YAML."""
     db_path = Path(__file__).parent.parent / "design_database.yaml"
-    with open(db_path, 'r', encoding='utf-8') as f:
-        return yaml.safe_load(f)
+    return sedu_db.load_database(db_path)
 
 
-def generate_bom():
-    """Generate BOM CSV from design database."""
-    db = load_database()
+def render_bom(db) -> str:
+    """Render BOM CSV text from design database."""
     components = db.get('components', {})
-
-    bom_path = Path(__file__).parent.parent / "hardware" / "BOM_Seed.csv"
+    values = sedu_db.component_values(db)
 
     # Collect all components
     bom_rows = []
@@ -40,18 +46,8 @@ def generate_bom():
 
         # Value (resistance/capacitance)
         if 'value' in comp_data:
-            value_str = comp_data['value']
-            # Format value nicely
-            if value_str.endswith('m'):  # milliohms
-                desc_parts.append(value_str.replace('m', 'mΩ'))
-            elif value_str.endswith('k'):  # kilohms
-                desc_parts.append(value_str.replace('k', 'kΩ'))
-            elif value_str.endswith('R'):  # ohms
-                desc_parts.append(value_str)
-            elif value_str.endswith('F'):  # farads
-                desc_parts.append(value_str)
-            else:
-                desc_parts.append(value_str)
+            # Bare resistor values get their unit: "3.0m" -> "3.0mΩ"
+            desc_parts.append(sedu_units.label(comp_data['value'], values.get(ref)))
 
         # Tolerance
         if 'tolerance' in comp_data:
@@ -113,14 +109,25 @@ def generate_bom():
             'Description': description
         })
 
-    # Write CSV
-    with open(bom_path, 'w', newline='', encoding='utf-8') as f:
-        fieldnames = ['Ref', 'Part Number', 'Qty', 'Description']
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(bom_rows)
+    # Render CSV (LF line endings, matching the committed file)
+    buf = io.StringIO(newline='')
+    fieldnames = ['Ref', 'Part Number', 'Qty', 'Description']
+    writer = csv.DictWriter(buf, fieldnames=fieldnames, lineterminator='\n')
+    writer.writeheader()
+    writer.writerows(bom_rows)
+    return buf.getvalue()
+
+
+def generate_bom(db=None):
+    """Generate BOM CSV from design database."""
+    if db is None:
+        db = load_database()
+    components = db.get('components', {})
 
-    print(f"Generated BOM with {len(bom_rows)} components")
+    if write_if_changed(OUTPUT_PATH, render_bom(db)):
+        print(f"Generated BOM with {len(components)} components")
+    else:
+        print(f"BOM unchanged ({len(components)} components) - not rewritten")
     return 0
 
 
@@ -8,26 +8,32 @@ DO NOT edit Component_Report.md directly - edit design_database.yaml and regener
 
 import sys
 from pathlib import Path
-import yaml
 from datetime import datetime
 
+import sedu_db
+from sedu_output import write_if_changed
+
+OUTPUT_PATH = Path(__file__).parent.parent / "Component_Report.md"
+
+# Database sections this generator reads (generate_all.py rebuilds on change)
+DATABASE_SECTIONS = ['components', 'ics', 'metadata']
+
+# Timestamp line ignored when deciding whether the report changed
+VOLATILE_PATTERN = r'^\*\*Generated:\*\* '
+
 
 def load_database():
     """Load design database from YAML."""
     db_path = Path(__file__).parent.parent / "design_database.yaml"
-    with open(db_path, 'r', encoding='utf-8') as f:
-        return yaml.safe_load(f)
+    return sedu_db.load_database(db_path)
 
 
-def generate_component_report():
-    """Generate Component Report from design database."""
-    db = load_database()
+def render_component_report(db) -> str:
+    """Render Component Report markdown from design database."""
     components = db.get('components', {})
     ics = db.get('ics', {})
     metadata = db.get('metadata', {})
 
-    report_path = Path(__file__).parent.parent / "Component_Report.md"
-
     lines = []
     lines.append("# SEDU Single-PCB Component Report")
     lines.append("")
@@ -148,11 +154,20 @@ def generate_component_report():
         lines.append("No locked components defined.")
         lines.append("")
 
-    # Write file
-    with open(report_path, 'w', encoding='utf-8') as f:
-        f.write('\n'.join(lines))
+    return '\n'.join(lines)
 
-    print(f"Generated Component Report with {len(ics)} ICs and {len(components)} components")
+
+def generate_component_report(db=None):
+    """Generate Component Report from design database."""
+    if db is None:
+        db = load_database()
+    components = db.get('components', {})
+    ics = db.get('ics', {})
+
+    if write_if_changed(OUTPUT_PATH, render_component_report(db), volatile=VOLATILE_PATTERN):
+        print(f"Generated Component Report with {len(ics)} ICs and {len(components)} components")
+    else:
+        print(f"Component Report unchanged ({len(ics)} ICs, {len(components)} components) - not rewritten")
     return 0
 
 
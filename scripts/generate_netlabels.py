@@ -8,25 +8,29 @@ DO NOT edit Net_Labels.csv directly - edit design_database.yaml and regenerate.
 
 import sys
 import csv
+import io
 from pathlib import Path
-import yaml
+
+import sedu_db
+from sedu_output import write_if_changed
+
+OUTPUT_PATH = Path(__file__).parent.parent / "hardware" / "Net_Labels.csv"
+
+# Database sections this generator reads (generate_all.py rebuilds on change)
+DATABASE_SECTIONS = ['gpio_pins', 'power_rails']
 
 
 def load_database():
     """Load design database from YAML."""
     db_path = Path(__file__).parent.parent / "design_database.yaml"
-    with open(db_path, 'r', encoding='utf-8') as f:
-        return yaml.safe_load(f)
+    return sedu_db.load_database(db_path)
 
 
-def generate_netlabels():
-    """Generate Net Labels CSV from design database."""
-    db = load_database()
+def build_net_rows(db):
+    """Build net label rows from design database."""
     gpio_pins = db.get('gpio_pins', {})
     power_rails = db.get('power_rails', {})
 
-    netlabels_path = Path(__file__).parent.parent / "hardware" / "Net_Labels.csv"
-
     # Collect net labels
     net_rows = []
 
@@ -68,15 +72,30 @@ def generate_netlabels():
         {'Net': 'MOTOR_PH_W', 'Type': 'Power', 'Description': 'Motor phase W power'},
     ]
     net_rows.extend(common_nets)
+    return net_rows
+
 
-    # Write CSV
-    with open(netlabels_path, 'w', newline='', encoding='utf-8') as f:
-        fieldnames = ['Net', 'Type', 'Description']
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(net_rows)
+def render_netlabels(db) -> str:
+    """Render Net Labels CSV text (LF line endings, matching the committed file)."""
+    net_rows = build_net_rows(db)
+    buf = io.StringIO(newline='')
+    fieldnames = ['Net', 'Type', 'Description']
+    writer = csv.DictWriter(buf, fieldnames=fieldnames, lineterminator='\n')
+    writer.writeheader()
+    writer.writerows(net_rows)
+    return buf.getvalue()
 
-    print(f"Generated Net Labels with {len(net_rows)} nets")
+
+def generate_netlabels(db=None):
+    """Generate Net Labels CSV from design database."""
+    if db is None:
+        db = load_database()
+    net_rows = build_net_rows(db)
+
+    if write_if_changed(OUTPUT_PATH, render_netlabels(db)):
+        print(f"Generated Net Labels with {len(net_rows)} nets")
+    else:
+        print(f"Net Labels unchanged ({len(net_rows)} nets) - not rewritten")
     return 0
 
 
@@ -8,25 +8,31 @@ DO NOT edit pins.h directly - edit design_database.yaml and regenerate.
 
 import sys
 from pathlib import Path
-import yaml
 from datetime import datetime
 
+import sedu_db
+from sedu_output import write_if_changed
+
+OUTPUT_PATH = Path(__file__).parent.parent / "firmware" / "include" / "pins.h"
+
+# Database sections this generator reads (generate_all.py rebuilds on change)
+DATABASE_SECTIONS = ['gpio_pins', 'metadata']
+
+# Timestamp line ignored when deciding whether pins.h changed
+VOLATILE_PATTERN = r'^ \* Generated: '
+
 
 def load_database():
     """Load design database from YAML."""
     db_path = Path(__file__).parent.parent / "design_database.yaml"
-    with open(db_path, 'r', encoding='utf-8') as f:
-        return yaml.safe_load(f)
+    return sedu_db.load_database(db_path)
 
 
-def generate_pins_h():
-    """Generate pins.h from design database."""
-    db = load_database()
+def render_pins_h(db) -> str:
+    """Render pins.h text from design database."""
     gpio_pins = db.get('gpio_pins', {})
     metadata = db.get('metadata', {})
 
-    pins_h_path = Path(__file__).parent.parent / "firmware" / "include" / "pins.h"
-
     # Group pins by function
     groups = {
         'Motor Control': [],
@@ -110,13 +116,19 @@ def generate_pins_h():
         lines.append("")
 
     lines.append("#endif // PINS_H")
+    return '\n'.join(lines)
+
 
-    # Write file
-    pins_h_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(pins_h_path, 'w', encoding='utf-8') as f:
-        f.write('\n'.join(lines))
+def generate_pins_h(db=None):
+    """Generate pins.h from design database."""
+    if db is None:
+        db = load_database()
+    gpio_pins = db.get('gpio_pins', {})
 
-    print(f"Generated pins.h with {len(gpio_pins)} GPIO definitions")
+    if write_if_changed(OUTPUT_PATH, render_pins_h(db), volatile=VOLATILE_PATTERN):
+        print(f"Generated pins.h with {len(gpio_pins)} GPIO definitions")
+    else:
+        print(f"pins.h unchanged ({len(gpio_pins)} GPIO definitions) - not rewritten")
     return 0
 
 
@@ -3,12 +3,39 @@
 Run all SEDU verification scripts in sequence.
 Use this to verify system integrity when resuming work.
 
+Usage:
+    python scripts/run_all_verification.py              # one subprocess per script
+    python scripts/run_all_verification.py --parallel   # in-process, process pool
+    python scripts/run_all_verification.py --parallel --jobs 4
+    python scripts/run_all_verification.py --force      # ignore the manifest
+
+Incremental: each check's input files (CHECK_INPUTS plus the database, the
+script itself and every scripts/ module it imports) are hashed and stored with its
+last passing result in .sedu_cache/verification_manifest.json. A check whose
+inputs are unchanged since it last passed is reported from the manifest
+without running. Failing checks are always rerun. --force reruns everything.
+
+--parallel imports each script's entry point and runs them across a process
+pool. The database is parsed once (sedu_db) and inherited by the workers,
+output is captured per check and printed in VERIFICATION_SCRIPTS order.
+
 Returns 0 if all scripts pass, 1 if any fail.
 """
+import argparse
+import contextlib
+import importlib
+import io
+import json
+import os
 import subprocess
 import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+import sedu_db
+
 ROOT = Path(__file__).resolve().parents[1]
 SCRIPTS_DIR = ROOT / "scripts"
 
@@ -25,12 +52,216 @@ VERIFICATION_SCRIPTS = [
     "check_bom_completeness.py",
 ]
 
-def main():
+# Function each script calls under `if __name__ == "__main__"` (--parallel mode)
+ENTRY_POINTS = {
+    "check_database_schema.py": "check_database_schema",
+    "check_value_locks.py": "check_locked_values",
+    "check_pinmap.py": "check_pinmap",
+    "check_netlabels_vs_pins.py": "main",
+    "check_kicad_outline.py": "main",
+    "check_5v_elimination.py": "main",
+    "check_ladder_bands.py": "main",
+    "verify_power_calcs.py": "main",
+    "check_bom_completeness.py": "check_completeness",
+}
+
+# Schematic sheets read through sedu_netlist.py
+SCHEMATIC_INPUTS = sorted(f"hardware/{p.name}" for p in (ROOT / "hardware").glob("*.kicad_sch"))
+
+# Data files each check reads besides design_database.yaml (paths relative to
+# ROOT). The scripts/ modules a check imports are found by check_inputs().
+CHECK_INPUTS = {
+    "check_database_schema.py": [],
+    "check_value_locks.py": [],
+    "check_pinmap.py": ["firmware/include/pins.h"],
+    "check_netlabels_vs_pins.py": ["hardware/Net_Labels.csv"] + SCHEMATIC_INPUTS,
+    "check_kicad_outline.py": ["hardware/SEDU_PCB.kicad_pcb"],
+    "check_5v_elimination.py": [
+        "hardware/BOM_Seed.csv",
+        "hardware/Net_Labels.csv",
+        "docs/SEDU_Single_PCB_Parity_Corrected_RevC4a_Final.md",
+    ] + SCHEMATIC_INPUTS,
+    "check_ladder_bands.py": ["firmware/src/input_ladder.cpp"],
+    "verify_power_calcs.py": [],
+    "check_bom_completeness.py": ["hardware/BOM_Seed.csv"],
+}
+
+# Inputs shared by every check
+COMMON_INPUTS = ["design_database.yaml"]
+
+MANIFEST = sedu_db.CACHE_DIR / "verification_manifest.json"
+MANIFEST_VERSION = 1
+
+
+def check_inputs(script_name: str) -> list:
+    """All files whose content determines a check's result.
+
+    The script's own source and its transitive scripts/ imports
+    (sedu_db.script_imports) come first, then the data files it reads.
+    """
+    return (COMMON_INPUTS + sedu_db.script_imports(SCRIPTS_DIR / script_name)
+            + CHECK_INPUTS.get(script_name, []))
+
+
+def load_manifest() -> dict:
+    """Load the manifest, starting fresh if it is missing or from another version."""
+    try:
+        manifest = json.loads(MANIFEST.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        manifest = {}
+    if manifest.get("version") != MANIFEST_VERSION:
+        manifest = {"version": MANIFEST_VERSION, "files": {}, "checks": {}}
+    return manifest
+
+
+def save_manifest(manifest: dict) -> None:
+    try:
+        MANIFEST.parent.mkdir(parents=True, exist_ok=True)
+        tmp = MANIFEST.with_suffix(".tmp")
+        tmp.write_text(json.dumps(manifest, indent=1, sort_keys=True), encoding="utf-8")
+        os.replace(tmp, MANIFEST)
+    except OSError as e:
+        print(f"[WARN] Could not write verification manifest: {e}")
+
+
+def hash_input(rel_path: str, file_cache: dict) -> str:
+    """Content hash of one input, reusing the stored digest while size/mtime match."""
+    path = ROOT / rel_path
+    try:
+        st = path.stat()
+    except OSError:
+        file_cache.pop(rel_path, None)
+        return "missing"
+    cached = file_cache.get(rel_path)
+    if cached and cached[0] == st.st_size and cached[1] == st.st_mtime_ns:
+        return cached[2]
+    digest = sedu_db.file_digest(path)
+    file_cache[rel_path] = [st.st_size, st.st_mtime_ns, digest]
+    return digest
+
+
+def plan_checks(manifest: dict, force: bool = False):
+    """Hash every check's inputs and find checks unchanged since their last pass.
+
+    Returns (input_hashes, unchanged) - {script: {path: digest}} and a set.
+    """
+    input_hashes = {
+        name: {p: hash_input(p, manifest["files"]) for p in check_inputs(name)}
+        for name in VERIFICATION_SCRIPTS
+    }
+    unchanged = set()
+    if not force:
+        for name in VERIFICATION_SCRIPTS:
+            last = manifest["checks"].get(name)
+            if last and last.get("status") == "PASS" and last.get("inputs") == input_hashes[name]:
+                unchanged.add(name)
+    return input_hashes, unchanged
+
+
+def record_result(manifest: dict, script_name: str, returncode: int,
+                  inputs: dict, elapsed: float) -> None:
+    """Store a passing result with its input hashes; forget failing ones."""
+    if returncode == 0:
+        manifest["checks"][script_name] = {
+            "status": "PASS",
+            "inputs": inputs,
+            "elapsed": elapsed,
+        }
+    else:
+        manifest["checks"].pop(script_name, None)
+
+
+def exit_code(value) -> int:
+    """Map a return value or SystemExit code to a process exit code."""
+    if value is None:
+        return 0
+    if isinstance(value, int):
+        return value
+    # sys.exit("message") prints the message and exits with 1
+    print(value)
+    return 1
+
+
+def run_subprocess(script_path: Path):
+    """Run one script in a fresh interpreter, streaming its output."""
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, str(script_path)],
+        cwd=ROOT,
+        capture_output=False,  # Show output in real-time
+    )
+    return result.returncode, time.perf_counter() - start
+
+
+def _init_worker():
+    """Process pool initializer: make scripts importable and warm the database."""
+    if str(SCRIPTS_DIR) not in sys.path:
+        sys.path.insert(0, str(SCRIPTS_DIR))
+    sedu_db.load_database()
+
+
+def run_in_process(script_name: str, kwargs=None):
+    """Import a script and call its entry point with output captured.
+
+    kwargs are passed to the entry point (sedu_watch.py uses this).
+    Returns (script_name, returncode, output, elapsed_seconds).
+    """
+    start = time.perf_counter()
+    buf = io.StringIO()
+    with contextlib.redirect_stdout(buf), contextlib.redirect_stderr(buf):
+        try:
+            module = importlib.import_module(Path(script_name).stem)
+            rc = exit_code(getattr(module, ENTRY_POINTS[script_name])(**(kwargs or {})))
+        except SystemExit as e:
+            rc = exit_code(e.code)
+        except Exception as e:
+            print(f"[ERROR] Unexpected error: {e}")
+            traceback.print_exc()
+            rc = 2
+    return script_name, rc, buf.getvalue(), time.perf_counter() - start
+
+
+def run_parallel(jobs: int, script_names: list):
+    """Run the given scripts across a process pool.
+
+    Returns {script_name: (returncode, output, elapsed)}.
+    """
+    if not script_names:
+        return {}
+    _init_worker()  # Parse once in the parent; forked workers inherit it
+    present = [s for s in script_names if (SCRIPTS_DIR / s).exists()]
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker) as pool:
+        return {
+            name: (rc, output, elapsed)
+            for name, rc, output, elapsed in pool.map(run_in_process, present)
+        }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run all SEDU verification scripts")
+    parser.add_argument("--parallel", action="store_true",
+                        help="run checks in-process across a process pool")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1,
+                        help="worker processes for --parallel (default: CPU count)")
+    parser.add_argument("--force", action="store_true",
+                        help="rerun every check even if its inputs are unchanged")
+    args = parser.parse_args(argv)
+
     print("=" * 70)
     print("SEDU VERIFICATION SUITE - RUNNING ALL SCRIPTS")
+    if args.parallel:
+        print(f"Mode: parallel ({args.jobs} workers)")
     print("=" * 70)
     print()
 
+    suite_start = time.perf_counter()
+
+    manifest = load_manifest()
+    input_hashes, unchanged = plan_checks(manifest, args.force)
+
+    to_run = [name for name in VERIFICATION_SCRIPTS if name not in unchanged]
+    parallel_results = run_parallel(args.jobs, to_run) if args.parallel else {}
+
     results = []
 
     for idx, script_name in enumerate(VERIFICATION_SCRIPTS, 1):
@@ -38,48 +269,63 @@ def main():
 
         if not script_path.exists():
             print(f"[{idx}/{len(VERIFICATION_SCRIPTS)}] {script_name:30s} [!] NOT FOUND")
-            results.append((script_name, "MISSING"))
+            results.append((script_name, "MISSING", 0.0))
+            continue
+
+        if script_name in unchanged:
+            last = manifest["checks"][script_name]
+            print(f"[{idx}/{len(VERIFICATION_SCRIPTS)}] {script_name:30s} [OK] PASS (inputs unchanged, skipped)")
+            results.append((script_name, "CACHED", last.get("elapsed", 0.0)))
             continue
 
         print(f"[{idx}/{len(VERIFICATION_SCRIPTS)}] Running {script_name}...")
         print("-" * 70)
 
-        result = subprocess.run(
-            [sys.executable, str(script_path)],
-            cwd=ROOT,
-            capture_output=False,  # Show output in real-time
-        )
+        if args.parallel:
+            returncode, output, elapsed = parallel_results[script_name]
+            print(output, end="")
+        else:
+            returncode, elapsed = run_subprocess(script_path)
 
-        if result.returncode == 0:
+        record_result(manifest, script_name, returncode, input_hashes[script_name], elapsed)
+        if returncode == 0:
             status = "[OK] PASS"
-            results.append((script_name, "PASS"))
+            results.append((script_name, "PASS", elapsed))
         else:
             status = "[FAIL] FAIL"
-            results.append((script_name, "FAIL"))
+            results.append((script_name, "FAIL", elapsed))
 
         print()
         print(f"[{idx}/{len(VERIFICATION_SCRIPTS)}] {script_name:30s} {status}")
         print()
 
+    save_manifest(manifest)
+    suite_elapsed = time.perf_counter() - suite_start
+
     # Summary
     print("=" * 70)
     print("VERIFICATION SUITE SUMMARY")
     print("=" * 70)
 
-    passed = sum(1 for _, status in results if status == "PASS")
-    failed = sum(1 for _, status in results if status == "FAIL")
-    missing = sum(1 for _, status in results if status == "MISSING")
+    cached = sum(1 for _, status, _ in results if status == "CACHED")
+    passed = sum(1 for _, status, _ in results if status == "PASS") + cached
+    failed = sum(1 for _, status, _ in results if status == "FAIL")
+    missing = sum(1 for _, status, _ in results if status == "MISSING")
 
-    for script_name, status in results:
+    for script_name, status, elapsed in results:
         if status == "PASS":
-            print(f"  [OK]   {script_name}")
+            print(f"  [OK]   {script_name:30s} {elapsed * 1000:8.1f} ms")
+        elif status == "CACHED":
+            print(f"  [OK]   {script_name:30s}  skipped (inputs unchanged)")
         elif status == "FAIL":
-            print(f"  [FAIL] {script_name}")
+            print(f"  [FAIL] {script_name:30s} {elapsed * 1000:8.1f} ms")
         else:
             print(f"  [!]    {script_name} (not found)")
 
     print()
-    print(f"Total: {passed}/{len(VERIFICATION_SCRIPTS)} passed")
+    print(f"Total: {passed}/{len(VERIFICATION_SCRIPTS)} passed"
+          + (f" ({cached} unchanged since last pass, use --force to rerun)" if cached else ""))
+    print(f"Suite wall time: {suite_elapsed * 1000:.1f} ms")
 
     if failed > 0 or missing > 0:
         print()
@@ -0,0 +1,409 @@
+#!/usr/bin/env python3
+"""
+SEDU Board Model - Indexed, cached view of hardware/SEDU_PCB.kicad_pcb
+
+PCB checks query this model instead of parsing the board text themselves:
+
+    board.footprints            ref -> Footprint (absolute pad and courtyard positions)
+    board.pads_on_net(net)      every pad connected to a net
+    board.tracks_on_layer(l)    segments and arcs on a copper layer
+    board.vias_on_layer(l)      vias touching a copper layer
+    board.zones                 copper zones and rule areas (keep-outs)
+    board.edge_points           Edge.Cuts outline points, board.outline_bbox
+    board.net_classes           net class name -> rules and member nets
+    board.copper_thickness      copper layer -> thickness (mm) from the stackup
+    board.thickness             board thickness (mm), general/thickness
+
+The model is built once from the sedu_sexpr tree, then snapshotted in
+.sedu_cache/ keyed by the board file's SHA-256 (sedu_db.load_cached), so
+later runs unpickle it instead of reparsing and repeated loads in one
+process return the same object. All records are NamedTuples in board
+coordinates (mm, KiCad's y-down axis); the model is SHARED - treat it as
+read-only.
+
+Usage:
+    import sedu_board
+    board = sedu_board.load_board()
+    for x, y in board.mounting_holes():
+        print(x, y)
+
+    python scripts/sedu_board.py [PCB]      # summary and load timing
+"""
+from __future__ import annotations
+
+import math
+import sys
+import time
+from pathlib import Path
+from typing import NamedTuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+import sedu_db
+import sedu_sexpr
+
+ROOT = Path(__file__).resolve().parents[1]
+PCB = ROOT / "hardware" / "SEDU_PCB.kicad_pcb"
+
+# Bump when the records below change so stale snapshots are rebuilt
+MODEL_VERSION = 3
+
+DEFAULT_THICKNESS = 1.6  # mm, KiCad's default when general/thickness is absent
+
+EDGE_ITEMS = ("gr_rect", "gr_line", "gr_arc", "gr_poly", "gr_circle")
+COURTYARD_ITEMS = ("fp_line", "fp_rect", "fp_arc", "fp_poly", "fp_circle")
+COURTYARD_LAYERS = ("F.CrtYd", "B.CrtYd")
+
+
+class Pad(NamedTuple):
+    ref: str
+    number: str
+    kind: str            # smd, thru_hole, np_thru_hole, connect
+    shape: str
+    x: float             # absolute board position
+    y: float
+    angle: float
+    size: tuple          # (w, h) before rotation
+    drill: float         # 0.0 for SMD pads
+    layers: tuple
+    net: str             # "" when unconnected
+
+
+class Footprint(NamedTuple):
+    ref: str
+    value: str
+    lib_id: str
+    layer: str           # F.Cu or B.Cu
+    x: float
+    y: float
+    angle: float
+    pads: tuple          # Pad records
+    courtyard: tuple     # absolute (x, y) points of the courtyard graphics
+    courtyard_bbox: tuple | None  # (x0, y0, x1, y1) or None without courtyard
+
+
+class Track(NamedTuple):
+    start: tuple
+    end: tuple
+    width: float
+    layer: str
+    net: str
+    mid: tuple | None    # arcs only
+
+
+class Via(NamedTuple):
+    x: float
+    y: float
+    size: float
+    drill: float
+    layers: tuple        # (top, bottom) copper layers
+    net: str
+
+
+class Zone(NamedTuple):
+    name: str
+    net: str
+    layers: tuple
+    outline: tuple       # (x, y) polygon points
+    bbox: tuple
+    keepout: dict        # rule area flags, e.g. {"tracks": "not_allowed"}; empty for copper
+
+
+def _xy(node, head: str) -> tuple | None:
+    values = node.floats(head)
+    return (values[0], values[1]) if len(values) >= 2 else None
+
+
+def _poly_points(node) -> list:
+    pts = node.find("pts")
+    if pts is None:
+        return []
+    return [(float(xy[1]), float(xy[2])) for xy in pts.nodes("xy") if len(xy) >= 3]
+
+
+def _bbox(points) -> tuple | None:
+    if not points:
+        return None
+    xs = [p[0] for p in points]
+    ys = [p[1] for p in points]
+    return (min(xs), min(ys), max(xs), max(ys))
+
+
+def graphic_points(item) -> list:
+    """Points of a gr_*/fp_* graphic item (circles as their bounding box corners)."""
+    kind = item.head[3:]
+    if kind == "circle":
+        center, end = _xy(item, "center"), _xy(item, "end")
+        if not center or not end:
+            return []
+        r = math.hypot(end[0] - center[0], end[1] - center[1])
+        return [(center[0] - r, center[1] - r), (center[0] + r, center[1] + r)]
+    if kind == "poly":
+        return _poly_points(item)
+    if kind == "rect":
+        start, end = _xy(item, "start"), _xy(item, "end")
+        if not start or not end:
+            return []
+        return [start, (end[0], start[1]), end, (start[0], end[1])]
+    return [p for p in (_xy(item, k) for k in ("start", "mid", "end")) if p]
+
+
+def _layers(node) -> tuple:
+    layers = node.find("layers")
+    if layers is not None:
+        return tuple(layers.atoms)
+    layer = node.value("layer")
+    return (layer,) if layer else ()
+
+
+class _Nets:
+    """Net number -> name table; KiCad 6+ tracks reference nets by number only."""
+
+    def __init__(self, root):
+        self.names = {}
+        for net in root.nodes("net"):
+            if len(net) >= 3:
+                self.names[net[1]] = net[2]
+
+    def of(self, node) -> str:
+        net = node.find("net")
+        if net is None or len(net) < 2:
+            return node.value("net_name", "")
+        if len(net) >= 3 and isinstance(net[2], str):
+            return net[2]
+        return self.names.get(net[1], "")
+
+
+def _footprint(fp, nets: _Nets) -> Footprint:
+    fx, fy, angle = (fp.floats("at") + (0.0, 0.0, 0.0))[:3]
+
+    def place(x, y):
+        dx, dy = sedu_sexpr.rotate(x, y, angle)
+        return (fx + dx, fy + dy)
+
+    ref = value = ""
+    for text in fp.nodes("fp_text"):
+        if len(text) >= 3 and text[1] == "reference":
+            ref = text[2]
+        elif len(text) >= 3 and text[1] == "value":
+            value = text[2]
+    for prop in fp.nodes("property"):  # KiCad 8 stores ref/value as properties
+        if len(prop) >= 3 and prop[1] == "Reference" and not ref:
+            ref = prop[2]
+        elif len(prop) >= 3 and prop[1] == "Value" and not value:
+            value = prop[2]
+
+    pads = []
+    for pad in fp.nodes("pad"):
+        px, py, pangle = (pad.floats("at") + (0.0, 0.0, 0.0))[:3]
+        drill = pad.floats("drill")
+        x, y = place(px, py)
+        pads.append(Pad(
+            ref=ref,
+            number=pad[1] if len(pad) > 1 and isinstance(pad[1], str) else "",
+            kind=pad[2] if len(pad) > 2 and isinstance(pad[2], str) else "",
+            shape=pad[3] if len(pad) > 3 and isinstance(pad[3], str) else "",
+            x=x,
+            y=y,
+            angle=pangle,
+            size=pad.floats("size")[:2],
+            drill=drill[0] if drill else 0.0,
+            layers=_layers(pad),
+            net=nets.of(pad),
+        ))
+
+    courtyard = []
+    for item in fp.find_all(*COURTYARD_ITEMS):
+        if item.value("layer") in COURTYARD_LAYERS:
+            courtyard.extend(place(x, y) for x, y in graphic_points(item))
+
+    return Footprint(
+        ref=ref,
+        value=value,
+        lib_id=fp[1] if len(fp) > 1 and isinstance(fp[1], str) else "",
+        layer=fp.value("layer", "F.Cu"),
+        x=fx,
+        y=fy,
+        angle=angle,
+        pads=tuple(pads),
+        courtyard=tuple(courtyard),
+        courtyard_bbox=_bbox(courtyard),
+    )
+
+
+def _net_classes(root) -> dict:
+    """Net class name -> {"clearance": 0.2, "trace_width": 0.25, ..., "nets": [...]}."""
+    sources = [root] + [n for n in (root.find("rules"), root.find("setup")) if n is not None]
+    classes = {}
+    for source in sources:
+        for nc in source.nodes("net_class"):
+            if len(nc) < 2:
+                continue
+            rules = {"nets": []}
+            for child in nc.nodes():
+                if child.head == "add_net":
+                    rules["nets"].extend(child.atoms)
+                elif len(child) == 2:
+                    try:
+                        rules[child.head] = float(child[1])
+                    except ValueError:
+                        rules[child.head] = child[1]
+            classes[nc[1]] = rules
+    return classes
+
+
+def _copper_thickness(root) -> dict:
+    """Copper layer -> thickness (mm) from setup/stackup; empty without a stackup."""
+    setup = root.find("setup")
+    stackup = setup.find("stackup") if setup is not None else None
+    thickness = {}
+    if stackup is None:
+        return thickness
+    for layer in stackup.nodes("layer"):
+        t = layer.floats("thickness")
+        if len(layer) >= 2 and layer.value("type") == "copper" and t:
+            thickness[layer[1]] = t[0]
+    return thickness
+
+
+class Board:
+    """Indexed board model; build with build_board() or load_board()."""
+
+    def __init__(self, root):
+        nets = _Nets(root)
+        self.nets = sorted(set(nets.names.values()) - {""})
+        self.net_classes = _net_classes(root)
+        self.copper_thickness = _copper_thickness(root)
+        general = root.find("general")
+        self.thickness = ((general.floats("thickness") if general is not None else ())
+                          or (DEFAULT_THICKNESS,))[0]
+
+        self.edge_points = []
+        for item in root.find_all(*EDGE_ITEMS):
+            if item.value("layer") == "Edge.Cuts":
+                self.edge_points.extend(graphic_points(item))
+        self.outline_bbox = _bbox(self.edge_points)
+
+        self.footprints = {}   # ref -> Footprint
+        self.unreferenced = [] # footprints without a reference (logos, ...)
+        for fp in root.find_all("footprint", "module"):
+            footprint = _footprint(fp, nets)
+            if footprint.ref and footprint.ref not in self.footprints:
+                self.footprints[footprint.ref] = footprint
+            else:
+                self.unreferenced.append(footprint)
+
+        self.pads_by_net = {}
+        for footprint in self.all_footprints():
+            for pad in footprint.pads:
+                if pad.net:
+                    self.pads_by_net.setdefault(pad.net, []).append(pad)
+
+        self.tracks_by_layer = {}
+        for seg in root.find_all("segment", "arc"):
+            start, end = _xy(seg, "start"), _xy(seg, "end")
+            if not start or not end:
+                continue
+            track = Track(start, end, (seg.floats("width") or (0.0,))[0],
+                          seg.value("layer", ""), nets.of(seg), _xy(seg, "mid"))
+            self.tracks_by_layer.setdefault(track.layer, []).append(track)
+
+        self.vias_by_layer = {}
+        for v in root.nodes("via"):
+            at = _xy(v, "at")
+            if not at:
+                continue
+            drill = v.floats("drill")
+            via = Via(at[0], at[1], (v.floats("size") or (0.0,))[0],
+                      drill[0] if drill else 0.0, _layers(v) or ("F.Cu", "B.Cu"), nets.of(v))
+            for layer in via.layers:
+                self.vias_by_layer.setdefault(layer, []).append(via)
+
+        self.zones = []
+        for z in root.nodes("zone"):
+            polygon = z.find("polygon")
+            outline = tuple(_poly_points(polygon)) if polygon else ()
+            keepout = z.find("keepout")
+            flags = {c.head: c[1] for c in keepout.nodes() if len(c) >= 2} if keepout else {}
+            self.zones.append(Zone(z.value("name", ""), nets.of(z), _layers(z),
+                                   outline, _bbox(outline), flags))
+
+    # Queries
+
+    def all_footprints(self) -> list:
+        return list(self.footprints.values()) + self.unreferenced
+
+    def footprint(self, ref: str):
+        return self.footprints.get(ref)
+
+    def pads_on_net(self, net: str) -> list:
+        return self.pads_by_net.get(net, [])
+
+    def tracks_on_layer(self, layer: str) -> list:
+        return self.tracks_by_layer.get(layer, [])
+
+    def vias_on_layer(self, layer: str) -> list:
+        return self.vias_by_layer.get(layer, [])
+
+    def keepouts(self) -> list:
+        return [z for z in self.zones if z.keepout]
+
+    def hole_pads(self, drill: float = 3.2) -> list:
+        """MountingHole footprints with a pad of the given drill, as (footprint, pad)."""
+        holes = []
+        for fp in self.all_footprints():
+            if "MountingHole" not in fp.lib_id:
+                continue
+            for pad in fp.pads:
+                if pad.drill == drill:
+                    holes.append((fp, pad))
+                    break
+        return holes
+
+    def mounting_holes(self, drill: float = 3.2) -> list:
+        """Centres (x, y) of the hole_pads() of the given drill."""
+        return [(pad.x, pad.y) for _, pad in self.hole_pads(drill)]
+
+
+def build_board(raw: bytes) -> Board:
+    """Parse board file bytes into a Board (raises sedu_sexpr.SExprError)."""
+    return Board(sedu_sexpr.parse(raw, lazy_depth=1))
+
+
+def load_board(path: Path = PCB, use_cache: bool = True) -> Board:
+    """Board model for path, from the in-process memo or .sedu_cache/ when unchanged.
+
+    Raises OSError if the file cannot be read, sedu_sexpr.SExprError if it
+    is malformed - callers report these in their own format.
+    """
+    name = "board_" + Path(path).name.replace(".", "_")
+    return sedu_db.load_cached(path, build_board, name, MODEL_VERSION, use_cache)
+
+
+if __name__ == "__main__":
+    path = Path(sys.argv[1]) if len(sys.argv) > 1 else PCB
+    try:
+        t0 = time.perf_counter()
+        board = load_board(path, use_cache=False)
+        t1 = time.perf_counter()
+        load_board(path)
+        sedu_db.clear_memo()
+        t2 = time.perf_counter()
+        load_board(path)
+        t3 = time.perf_counter()
+        load_board(path)
+        t4 = time.perf_counter()
+    except (OSError, sedu_sexpr.SExprError) as e:
+        print(f"[FAIL] {path}: {e}")
+        sys.exit(1)
+
+    n_pads = sum(len(fp.pads) for fp in board.all_footprints())
+    n_tracks = sum(len(t) for t in board.tracks_by_layer.values())
+    n_vias = len({id(v) for vias in board.vias_by_layer.values() for v in vias})
+    print(f"Board: {path.name}")
+    print(f"  Footprints: {len(board.footprints)} referenced, {len(board.unreferenced)} unreferenced, {n_pads} pads")
+    print(f"  Tracks: {n_tracks}, vias: {n_vias}, zones: {len(board.zones)}, nets: {len(board.nets)}")
+    print(f"  Net classes: {', '.join(board.net_classes) or 'none'}")
+    print(f"Build from source: {(t1 - t0) * 1000:9.2f} ms")
+    print(f"Snapshot load:     {(t3 - t2) * 1000:9.2f} ms")
+    print(f"Memo hit:          {(t4 - t3) * 1000:9.2f} ms")
+    sys.exit(0)
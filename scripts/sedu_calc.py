@@ -0,0 +1,452 @@
+#!/usr/bin/env python3
+"""
+SEDU Calculation Graph - One memoized model of the electrical and thermal math
+
+Every design quantity is a node. Input nodes come from design_database.yaml
+fields (component values, IC thresholds/parameters, firmware constants) or,
+where the database has no field, from a design assumption declared once in
+INPUTS. Formula nodes are plain functions whose parameter names are the
+nodes they read:
+
+    @formula("ILIM", "A", "LM5069 current limit")
+    def ilim(V_ILIM, RS_IN):
+        return V_ILIM / RS_IN
+
+A Graph evaluates a node on first access and keeps the result. set() changes
+an input and drops only the cached nodes downstream of it, so the next
+access recomputes those and nothing else. A formula whose input is missing
+from the database (None) evaluates to None.
+
+The formula functions take NumPy arrays as well as scalars, and their
+parameter names match the sedu_tolerance params, so the tolerance analysis
+and the thermal sweeps evaluate the same equations the reports print.
+
+Usage:
+    import sedu_calc
+    g = sedu_calc.load()
+    g['ILIM']                      # 18.33
+    g.set('RS_IN', 2.5e-3)         # -> ['ILIM', 'I_CB', 'P_RS_IN_ILIM', ...]
+
+    python scripts/sedu_calc.py                         # every node
+    python scripts/sedu_calc.py ILIM P_RS_IN_ILIM --set RS_IN=2.5m
+
+verify_calcs.py, verify_power_calcs.py, thermal_analysis.py and
+thermal_verification_detailed.py read their shared quantities from here.
+"""
+from __future__ import annotations
+
+import argparse
+import inspect
+import sys
+from pathlib import Path
+from typing import NamedTuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+import sedu_db
+import sedu_units
+
+ROOT = Path(__file__).resolve().parents[1]
+DATABASE = ROOT / "design_database.yaml"
+
+
+class Input(NamedTuple):
+    name: str
+    unit: str
+    path: str               # design_database.yaml field, "" for an assumption
+    value: float | None     # assumption value (path == "")
+    note: str
+
+
+class Formula(NamedTuple):
+    name: str
+    unit: str
+    func: object
+    deps: tuple             # parameter names = node names
+    note: str
+
+
+INPUTS = {}
+FORMULAS = {}
+
+
+def _input(name: str, unit: str, path: str = "", value: float | None = None, note: str = "") -> None:
+    INPUTS[name] = Input(name, unit, path, value, note)
+
+
+def formula(name: str, unit: str, note: str = ""):
+    """Register func as node name; its inputs must already be nodes."""
+    def register(func):
+        deps = tuple(inspect.signature(func).parameters)
+        unknown = [d for d in deps if d not in INPUTS and d not in FORMULAS]
+        if unknown:
+            raise KeyError(f"{name}: unknown input node(s) {', '.join(unknown)}")
+        FORMULAS[name] = Formula(name, unit, func, deps, note)
+        return func
+    return register
+
+
+# ---------------------------------------------------------------------------
+# Inputs: database fields ([min, typ, max] thresholds give typ)
+# ---------------------------------------------------------------------------
+_input("RS_IN", "Ohm", "components.RS_IN.value")
+_input("V_ILIM", "V", "ics.U6.thresholds.V_ILIM")
+_input("V_CB", "V", "ics.U6.thresholds.V_CB")
+_input("V_UV", "V", "ics.U6.thresholds.V_UV")
+_input("V_OV", "V", "ics.U6.thresholds.V_OV")
+_input("RUV_TOP", "Ohm", "components.RUV_TOP.value")
+_input("RUV_BOT", "Ohm", "components.RUV_BOT.value")
+_input("ROV_TOP", "Ohm", "components.ROV_TOP.value")
+_input("ROV_BOT", "Ohm", "components.ROV_BOT.value")
+_input("R_ILIM", "Ohm", "components.R_ILIM.value")
+_input("R_IPROPI", "Ohm", "components.R_IPROPI.value")
+_input("K_ILIM", "V", "ics.U3.parameters.K_ILIM")
+_input("K_IPROPI", "A/A", "ics.U3.parameters.K_IPROPI")
+_input("DRV_RDS_ON", "Ohm", "ics.U3.parameters.RDS_ON_TOTAL")
+_input("R_VBAT_TOP", "Ohm", "components.R_VBAT_TOP.value")
+_input("R_VBAT_BOT", "Ohm", "components.R_VBAT_BOT.value")
+_input("VBAT_MIN", "V", "firmware_constants.VBAT_MIN")
+_input("VBAT_MAX", "V", "firmware_constants.VBAT_MAX")
+_input("CSA_GAIN", "V/V", "firmware_constants.CSA_GAIN")
+_input("R_PHASE", "Ohm", "components.RS_U.value")
+_input("RFBT", "Ohm", "components.RFBT.value")
+_input("RFBB", "Ohm", "components.RFBB.value")
+_input("V_FB", "V", "ics.U4.thresholds.V_FB")
+_input("BUCK_VOUT", "V", "ics.U4.output_voltage")
+_input("BUCK_IOUT", "A", "ics.U4.output_current")
+_input("BUCK_ETA", "", "ics.U4.parameters.EFFICIENCY")
+_input("FET_RDS_ON_125C", "Ohm", "components.Q1.rds_on_125c")
+_input("FET_V_RATING", "V", "components.Q1.voltage_rating")
+_input("TVS_STANDOFF", "V", "components.TVS1.voltage_rating")
+
+# ---------------------------------------------------------------------------
+# Inputs: design assumptions (no database field)
+# ---------------------------------------------------------------------------
+_input("TAMB", "C", value=85, note="worst-case ambient")
+_input("VIN", "V", value=24.0, note="nominal battery")
+_input("V_ADC_FS", "V", value=3.5, note="ESP32 ADC full scale at 11 dB (conservative)")
+_input("I_MOTOR_AVG", "A", value=12.0, note="phase current, normal operation (RMS)")
+_input("I_MOTOR_PEAK", "A", value=20.0, note="phase current, spin-up peak (RMS)")
+_input("I_PHASE_FAULT", "A", value=25, note="phase current, conservative fault peak")
+_input("I_ACTUATOR", "A", value=3.3, note="actuator current (DRV8873 ILIM rounded up)")
+_input("BUCK_IOUT_TYP", "A", value=0.7, note="typical 3.3V load")
+_input("BUCK_RTH_JA", "C/W", value=40, note="HSOIC-8 with thermal vias (sedu_thermal overrides)")
+_input("DRV_RTH_JA", "C/W", value=30, note="HTSSOP-28 with thermal vias (sedu_thermal overrides)")
+_input("FET_RTH_JA", "C/W", value=150, note="SuperSO8, minimal airflow")
+_input("FET_DUTY", "", value=0.5, note="sinusoidal average")
+_input("FET_FSW", "Hz", value=20e3, note="motor PWM")
+_input("FET_COSS", "F", value=1500e-12, note="BSC016N06NS output capacitance")
+_input("PEAK_SW_FACTOR", "", value=2, note="switching loss multiplier at peak")
+
+
+# ---------------------------------------------------------------------------
+# LM5069 hot-swap
+# ---------------------------------------------------------------------------
+@formula("ILIM", "A", "LM5069 current limit")
+def ilim(V_ILIM, RS_IN):
+    return V_ILIM / RS_IN
+
+
+@formula("I_CB", "A", "LM5069 circuit breaker")
+def circuit_breaker(V_CB, RS_IN):
+    return V_CB / RS_IN
+
+
+@formula("UV_TURN_ON", "V", "LM5069 UV turn-on")
+def uv_turn_on(V_UV, RUV_TOP, RUV_BOT):
+    return V_UV * (1 + RUV_TOP / RUV_BOT)
+
+
+@formula("OV_TRIP", "V", "LM5069 OV trip")
+def ov_trip(V_OV, ROV_TOP, ROV_BOT):
+    return V_OV * (1 + ROV_TOP / ROV_BOT)
+
+
+@formula("P_RS_IN_ILIM", "W", "RS_IN dissipation at ILIM")
+def p_rs_in_ilim(ILIM, RS_IN):
+    return ILIM**2 * RS_IN
+
+
+@formula("P_RS_IN_CB", "W", "RS_IN dissipation at the circuit breaker (brief)")
+def p_rs_in_cb(I_CB, RS_IN):
+    return I_CB**2 * RS_IN
+
+
+# ---------------------------------------------------------------------------
+# DRV8873 actuator
+# ---------------------------------------------------------------------------
+@formula("ACT_ILIM", "A", "DRV8873 current limit")
+def act_ilim(K_ILIM, R_ILIM):
+    return K_ILIM / R_ILIM
+
+
+@formula("V_IPROPI", "V", "IPROPI voltage at I_ACTUATOR")
+def v_ipropi(I_ACTUATOR, K_IPROPI, R_IPROPI):
+    return I_ACTUATOR / K_IPROPI * R_IPROPI
+
+
+@formula("DRV_LOSS", "W", "DRV8873 conduction loss at I_ACTUATOR")
+def drv_loss(I_ACTUATOR, DRV_RDS_ON):
+    return I_ACTUATOR**2 * DRV_RDS_ON
+
+
+@formula("DRV_TJ", "C", "DRV8873 junction, continuous")
+def drv_tj(TAMB, DRV_LOSS, DRV_RTH_JA):
+    return TAMB + DRV_LOSS * DRV_RTH_JA
+
+
+# ---------------------------------------------------------------------------
+# Sensing
+# ---------------------------------------------------------------------------
+@formula("V_ADC_VBAT_MAX", "V", "battery divider at VBAT_MAX")
+def v_adc_vbat_max(VBAT_MAX, R_VBAT_TOP, R_VBAT_BOT):
+    return VBAT_MAX * R_VBAT_BOT / (R_VBAT_TOP + R_VBAT_BOT)
+
+
+@formula("V_ADC_VBAT_MIN", "V", "battery divider at VBAT_MIN")
+def v_adc_vbat_min(VBAT_MIN, R_VBAT_TOP, R_VBAT_BOT):
+    return VBAT_MIN * R_VBAT_BOT / (R_VBAT_TOP + R_VBAT_BOT)
+
+
+@formula("V_CSA_FAULT", "V", "motor CSA output at I_PHASE_FAULT")
+def v_csa_fault(I_PHASE_FAULT, R_PHASE, CSA_GAIN):
+    return I_PHASE_FAULT * R_PHASE * CSA_GAIN
+
+
+@formula("P_SHUNT_AVG", "W", "phase shunt dissipation at I_MOTOR_AVG")
+def p_shunt_avg(I_MOTOR_AVG, R_PHASE):
+    return I_MOTOR_AVG**2 * R_PHASE
+
+
+@formula("P_SHUNT_PEAK", "W", "phase shunt dissipation at I_MOTOR_PEAK")
+def p_shunt_peak(I_MOTOR_PEAK, R_PHASE):
+    return I_MOTOR_PEAK**2 * R_PHASE
+
+
+@formula("P_SHUNT_FAULT", "W", "phase shunt dissipation at I_PHASE_FAULT")
+def p_shunt_fault(I_PHASE_FAULT, R_PHASE):
+    return I_PHASE_FAULT**2 * R_PHASE
+
+
+# ---------------------------------------------------------------------------
+# LMR33630 buck
+# ---------------------------------------------------------------------------
+@formula("BUCK_VOUT_FB", "V", "LMR33630 output from the feedback divider")
+def buck_output(V_FB, RFBT, RFBB):
+    return V_FB * (1 + RFBT / RFBB)
+
+
+@formula("BUCK_P_OUT", "W", "LMR33630 output power at BUCK_IOUT")
+def buck_p_out(BUCK_VOUT, BUCK_IOUT):
+    return BUCK_VOUT * BUCK_IOUT
+
+
+@formula("BUCK_LOSS", "W", "LMR33630 loss at BUCK_IOUT")
+def buck_loss(BUCK_P_OUT, BUCK_ETA):
+    return BUCK_P_OUT * (1 / BUCK_ETA - 1)
+
+
+@formula("BUCK_LOSS_TYP", "W", "LMR33630 loss at BUCK_IOUT_TYP")
+def buck_loss_typ(BUCK_VOUT, BUCK_IOUT_TYP, BUCK_ETA):
+    return BUCK_VOUT * BUCK_IOUT_TYP * (1 / BUCK_ETA - 1)
+
+
+@formula("BUCK_I_IN", "A", "LMR33630 input current at BUCK_IOUT")
+def buck_i_in(BUCK_P_OUT, VIN):
+    return BUCK_P_OUT / VIN
+
+
+@formula("BUCK_TJ", "C", "LMR33630 junction at BUCK_IOUT")
+def buck_tj(TAMB, BUCK_LOSS, BUCK_RTH_JA):
+    return TAMB + BUCK_LOSS * BUCK_RTH_JA
+
+
+@formula("BUCK_TJ_TYP", "C", "LMR33630 junction at BUCK_IOUT_TYP")
+def buck_tj_typ(TAMB, BUCK_LOSS_TYP, BUCK_RTH_JA):
+    return TAMB + BUCK_LOSS_TYP * BUCK_RTH_JA
+
+
+# ---------------------------------------------------------------------------
+# BSC016N06NS phase MOSFETs
+# ---------------------------------------------------------------------------
+@formula("FET_P_COND_AVG", "W", "phase FET conduction loss at I_MOTOR_AVG")
+def fet_p_cond_avg(I_MOTOR_AVG, FET_RDS_ON_125C, FET_DUTY):
+    return I_MOTOR_AVG**2 * FET_RDS_ON_125C * FET_DUTY
+
+
+@formula("FET_P_COND_PEAK", "W", "phase FET conduction loss at I_MOTOR_PEAK")
+def fet_p_cond_peak(I_MOTOR_PEAK, FET_RDS_ON_125C, FET_DUTY):
+    return I_MOTOR_PEAK**2 * FET_RDS_ON_125C * FET_DUTY
+
+
+@formula("FET_P_SW", "W", "phase FET Coss switching loss at VIN")
+def fet_p_sw(FET_COSS, VIN, FET_FSW):
+    return 0.5 * FET_COSS * VIN**2 * FET_FSW
+
+
+@formula("FET_TJ_AVG", "C", "phase FET junction at I_MOTOR_AVG")
+def fet_tj_avg(TAMB, FET_P_COND_AVG, FET_P_SW, FET_RTH_JA):
+    return TAMB + (FET_P_COND_AVG + FET_P_SW) * FET_RTH_JA
+
+
+@formula("FET_TJ_PEAK", "C", "phase FET junction at I_MOTOR_PEAK")
+def fet_tj_peak(TAMB, FET_P_COND_PEAK, FET_P_SW, PEAK_SW_FACTOR, FET_RTH_JA):
+    return TAMB + (FET_P_COND_PEAK + PEAK_SW_FACTOR * FET_P_SW) * FET_RTH_JA
+
+
+# ---------------------------------------------------------------------------
+# System
+# ---------------------------------------------------------------------------
+@formula("I_TOTAL_WORST", "A", "motor peak + actuator + buck input")
+def i_total_worst(I_MOTOR_PEAK, I_ACTUATOR, BUCK_I_IN):
+    return I_MOTOR_PEAK + I_ACTUATOR + BUCK_I_IN
+
+
+@formula("FET_V_MARGIN", "%", "phase FET voltage rating over VBAT_MAX")
+def fet_v_margin(FET_V_RATING, VBAT_MAX):
+    return (FET_V_RATING - VBAT_MAX) / VBAT_MAX * 100
+
+
+@formula("TVS_MARGIN", "%", "TVS standoff over VBAT_MAX")
+def tvs_margin(TVS_STANDOFF, VBAT_MAX):
+    return (TVS_STANDOFF - VBAT_MAX) / VBAT_MAX * 100
+
+
+class Graph:
+    """Memoized evaluation of FORMULAS over a set of input values."""
+
+    def __init__(self, values: dict, sources: dict):
+        self.values = dict(values)          # input name -> value
+        self.sources = dict(sources)        # input name -> database path / assumption
+        self.cache = {}
+        self.evaluations = 0
+        self.dependents = {name: [] for name in (*INPUTS, *FORMULAS)}
+        for f in FORMULAS.values():
+            for dep in f.deps:
+                self.dependents[dep].append(f.name)
+
+    def __getitem__(self, name: str):
+        if name in self.values:
+            return self.values[name]
+        if name not in self.cache:
+            f = FORMULAS[name]
+            args = {dep: self[dep] for dep in f.deps}
+            self.cache[name] = None if any(v is None for v in args.values()) else f.func(**args)
+            self.evaluations += 1
+        return self.cache[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name in INPUTS or name in FORMULAS
+
+    def set(self, name: str, value) -> list:
+        """Change an input; returns the formula nodes that are now stale."""
+        if name not in self.values:
+            raise KeyError(f"{name} is not an input node")
+        self.values[name] = value
+        stale, stack = [], list(self.dependents[name])
+        while stack:
+            node = stack.pop()
+            if node in stale:
+                continue
+            stale.append(node)
+            self.cache.pop(node, None)
+            stack.extend(self.dependents[node])
+        return sorted(stale, key=list(FORMULAS).index)
+
+    def upstream(self, name: str) -> list:
+        """Input nodes that name depends on."""
+        if name in INPUTS:
+            return [name]
+        seen = []
+        for dep in FORMULAS[name].deps:
+            seen.extend(n for n in self.upstream(dep) if n not in seen)
+        return seen
+
+
+def field(db: dict, path: str):
+    """Raw database value at a dotted path, None if absent."""
+    node = db
+    for key in path.split("."):
+        if not isinstance(node, dict) or key not in node:
+            return None
+        node = node[key]
+    return node
+
+
+def _number(db: dict, path: str):
+    """Input value at path: parsed value column for components.<ref>.value, typ of [min, typ, max]."""
+    section, _, rest = path.partition(".")
+    ref, _, key = rest.partition(".")
+    if section == "components" and key == "value":
+        q = sedu_db.component_values(db).get(ref)
+        return None if q is None else q.value
+    raw = field(db, path)
+    if isinstance(raw, (list, tuple)):
+        raw = raw[1] if len(raw) == 3 else raw[0]
+    return sedu_units.value(raw)
+
+
+def load(db: dict | None = None) -> Graph:
+    """Graph with inputs from the database (loaded from DATABASE when not given)."""
+    if db is None:
+        db = sedu_db.load_database(DATABASE)
+    values, sources = {}, {}
+    for i in INPUTS.values():
+        if i.path:
+            values[i.name] = _number(db, i.path)
+            sources[i.name] = i.path
+        else:
+            values[i.name] = i.value
+            sources[i.name] = f"assumption: {i.note}"
+    return Graph(values, sources)
+
+
+def _format(value, unit: str) -> str:
+    if value is None:
+        return "MISSING"
+    return f"{value:.6g} {unit}".rstrip()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Evaluate the SEDU calculation graph.")
+    parser.add_argument("nodes", nargs="*", help="nodes to print (default: all)")
+    parser.add_argument("--set", action="append", default=[], metavar="NAME=VALUE",
+                        help="override an input node, e.g. RS_IN=2.5m (repeatable)")
+    args = parser.parse_args()
+
+    g = load()
+    unknown = [n for n in args.nodes if n not in g]
+    if unknown:
+        print(f"[calc] ERROR: unknown node(s): {', '.join(unknown)}")
+        return 1
+    names = args.nodes or [*INPUTS, *FORMULAS]
+    for name in names:
+        g[name]
+
+    for item in args.set:
+        name, _, text = item.partition("=")
+        value = sedu_units.value(text)
+        if name not in g.values or value is None:
+            print(f"[calc] ERROR: --set {item}: expected INPUT=VALUE")
+            return 1
+        before = g.evaluations
+        stale = g.set(name, value)
+        for n in names:
+            g[n]
+        print(f"[calc] {name} = {value:g}: {len(stale)} dependent node(s) stale, "
+              f"{g.evaluations - before} recomputed")
+
+    width = max(len(n) for n in names)
+    for name in names:
+        if name in INPUTS:
+            detail = g.sources[name]
+        else:
+            f = FORMULAS[name]
+            detail = f"{f.note} <- {', '.join(f.deps)}"
+        unit = INPUTS[name].unit if name in INPUTS else FORMULAS[name].unit
+        print(f"   {name:<{width}}  {_format(g[name], unit):<16} {detail}")
+    print(f"[calc] {len(INPUTS)} inputs, {len(FORMULAS)} formulas, {g.evaluations} evaluated")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
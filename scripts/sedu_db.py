@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""
+SEDU Design Database Loader - Shared by all generators and checkers
+
+Every script that reads design_database.yaml goes through load_database() here.
+
+Parsing strategy:
+1. Hash the raw file bytes (SHA-256)
+2. If a binary snapshot for that hash exists in .sedu_cache/, unpickle it
+3. Otherwise parse with the C-accelerated YAML loader (CSafeLoader) when
+   PyYAML was built against libyaml, falling back to the pure-Python SafeLoader
+4. Write the snapshot atomically so concurrent scripts never see a partial file
+
+Within one interpreter the parsed database is also memoized by hash, so
+in-process runners (run_all_verification.py --parallel, generate_all.py)
+parse it exactly once. The returned dict is SHARED - treat it as read-only.
+
+component_values() is the components' value strings parsed once per loaded
+database by sedu_units ({ref: Quantity | None}), so scripts read numbers
+instead of re-parsing "3.0m" / "47nF" themselves.
+
+load_cached() applies the same hash-keyed snapshots to other source files
+(e.g. the board model built by sedu_board.py from the KiCad PCB).
+
+script_imports() lists a script and the scripts/ modules it imports,
+transitively, for the incremental runners' input hashes.
+
+Usage:
+    from sedu_db import load_database, component_values
+    db = load_database()
+    component_values(db)['RS_IN'].value   # 0.003
+"""
+from __future__ import annotations
+
+import ast
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+from pathlib import Path
+
+import yaml
+
+import sedu_units
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader
+
+ROOT = Path(__file__).resolve().parents[1]
+DATABASE = ROOT / "design_database.yaml"
+SCRIPTS_DIR = ROOT / "scripts"
+CACHE_DIR = Path(os.environ.get("SEDU_CACHE_DIR", ROOT / ".sedu_cache"))
+
+# Bump when the snapshot layout changes so stale pickles are ignored
+SNAPSHOT_VERSION = 1
+
+# In-process memo: digest -> parsed database
+_memo: dict[str, dict] = {}
+
+# In-process parsed value columns: id(db) -> (db, {ref: Quantity | None})
+_columns: dict = {}
+
+
+def file_digest(path: Path) -> str:
+    """Return the SHA-256 hex digest of a file's contents."""
+    return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+
+
+def _snapshot_path(name: str, digest: str, version: int = SNAPSHOT_VERSION) -> Path:
+    return CACHE_DIR / f"{name}.v{version}.{digest[:32]}.pickle"
+
+
+def _read_snapshot(snapshot: Path):
+    try:
+        with open(snapshot, 'rb') as f:
+            return pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+        return None
+
+
+def _write_snapshot(name: str, snapshot: Path, data) -> None:
+    """Write snapshot atomically and drop snapshots of older file versions."""
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=CACHE_DIR, suffix=".tmp")
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, snapshot)
+    except OSError:
+        # Cache is an optimization only - read-only checkouts still work
+        return
+
+    for old in CACHE_DIR.glob(f"{name}.v*.pickle"):
+        if old != snapshot:
+            try:
+                old.unlink()
+            except OSError:
+                pass
+
+
+def parse_yaml(text: str):
+    """Parse YAML text with the fastest available safe loader."""
+    return yaml.load(text, Loader=SafeLoader)
+
+
+def load_database(path: Path = DATABASE, use_cache: bool = True):
+    """Load design database, reusing the snapshot for unchanged content.
+
+    Raises FileNotFoundError if the database is missing and yaml.YAMLError
+    if it cannot be parsed - callers report these in their own format.
+    """
+    path = Path(path)
+    raw = path.read_bytes()
+    digest = hashlib.sha256(raw).hexdigest()
+
+    if use_cache and digest in _memo:
+        return _memo[digest]
+
+    snapshot = _snapshot_path(path.stem, digest)
+    data = _read_snapshot(snapshot) if use_cache else None
+
+    if data is None:
+        data = parse_yaml(raw.decode('utf-8'))
+        if use_cache:
+            _write_snapshot(path.stem, snapshot, data)
+
+    if use_cache:
+        _memo.clear()
+        _memo[digest] = data
+        _columns.clear()
+        component_values(data)
+    return data
+
+
+def component_values(db: dict | None = None) -> dict:
+    """{ref: sedu_units.Quantity | None} for the components' value field.
+
+    Built once per database (load_database() fills it); bare values such as
+    "3.0m" are ohms. Like the database itself the column is SHARED.
+    """
+    if db is None:
+        db = load_database()
+    entry = _columns.get(id(db))
+    if entry is None or entry[0] is not db:
+        entry = (db, sedu_units.component_values(db.get('components', {})))
+        _columns[id(db)] = entry
+    return entry[1]
+
+
+# In-process memo for load_cached(): resolved path -> ((size, mtime_ns, name, version), model)
+_file_memo: dict = {}
+
+
+def load_cached(path: Path, build, name: str, version: int = 1, use_cache: bool = True):
+    """Build a model from a source file once per content hash.
+
+    build(raw_bytes) turns the file into a picklable object; the result is
+    snapshotted in .sedu_cache/ as <name>.v<version>.<hash>.pickle (bump
+    version when the model layout changes). Within one interpreter an
+    unchanged file (same size and mtime) is returned without being read.
+    The returned object is SHARED - treat it as read-only.
+
+    Raises OSError if the file cannot be read; build() errors propagate.
+    """
+    path = Path(path).resolve()
+    st = path.stat()
+    key = (st.st_size, st.st_mtime_ns, name, version)
+    cached = _file_memo.get(path)
+    if use_cache and cached and cached[0] == key:
+        return cached[1]
+
+    raw = path.read_bytes()
+    digest = hashlib.sha256(raw).hexdigest()
+    snapshot = _snapshot_path(name, digest, version)
+    data = _read_snapshot(snapshot) if use_cache else None
+    if data is None:
+        data = build(raw)
+        if use_cache:
+            _write_snapshot(name, snapshot, data)
+    if use_cache:
+        _file_memo[path] = (key, data)
+    return data
+
+
+def section_digest(db: dict, section: str) -> str:
+    """Stable SHA-256 of one top-level database section (key order ignored)."""
+    canonical = json.dumps(db.get(section), sort_keys=True, default=str)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+def script_imports(script) -> list[str]:
+    """The script and every scripts/ module it imports, transitively.
+
+    Imports are read from the source (ast), including ones inside functions
+    and try blocks. Paths are relative to ROOT, sorted.
+    """
+    seen = set()
+    pending = [Path(script).resolve()]
+    while pending:
+        path = pending.pop()
+        if path in seen:
+            continue
+        seen.add(path)
+        for node in ast.walk(ast.parse(path.read_bytes(), filename=str(path))):
+            if isinstance(node, ast.Import):
+                names = [alias.name for alias in node.names]
+            elif isinstance(node, ast.ImportFrom) and node.level == 0 and node.module:
+                names = [node.module]
+            else:
+                continue
+            for name in names:
+                module = SCRIPTS_DIR / f"{name.split('.')[0]}.py"
+                if module.is_file():
+                    pending.append(module.resolve())
+    return sorted(p.relative_to(ROOT).as_posix() for p in seen)
+
+
+def clear_memo() -> None:
+    """Forget the in-process copies (next load re-reads snapshot or source)."""
+    _memo.clear()
+    _file_memo.clear()
+    _columns.clear()
+
+
+if __name__ == "__main__":
+    import sys
+    import time
+
+    print(f"Loader: {SafeLoader.__name__}")
+    t0 = time.perf_counter()
+    db = load_database(use_cache=False)
+    t1 = time.perf_counter()
+    load_database()
+    clear_memo()
+    t2 = time.perf_counter()
+    load_database()
+    t3 = time.perf_counter()
+    print(f"Cold parse:     {(t1 - t0) * 1000:7.2f} ms ({len(db)} top-level sections)")
+    print(f"Snapshot load:  {(t3 - t2) * 1000:7.2f} ms")
+    print(f"Cache dir:      {CACHE_DIR}")
+    sys.exit(0)
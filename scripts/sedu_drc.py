@@ -0,0 +1,436 @@
+#!/usr/bin/env python3
+"""
+SEDU DRC-lite - Grid-hashed copper clearance and track width check
+
+KiCad's DRC is not scriptable in the headless pipeline, so this checks the
+two rules that matter most for a 25.2 V (30 V transient) board on the
+board model (sedu_board.py):
+
+1. Clearance between copper of different nets - pads, tracks (segments
+   and arcs) and vias on a shared copper layer must be at least the larger
+   of their net classes' clearances apart
+2. Track width - every track at least its net class's trace width
+
+Net classes and their member nets come from the database (net_classes in
+design_database.yaml); nets not listed belong to Default. Net classes in
+the board's rules that disagree with the database are reported as
+warnings.
+
+Geometry: tracks and vias are capsules (segment + radius), arcs are
+their true curve + radius (exact distances, no chord approximation),
+circular and oval pads are capsules, other pads are their oriented
+rectangles (round-rect corners are not rounded - conservative). Zones are not
+checked: the board model holds zone outlines, not the filled copper.
+
+Every object's bounding box, grown by half the largest clearance, goes
+into a sedu_geometry.GridIndex; only objects sharing a cell are compared,
+so runtime grows with object count and local density, not count squared.
+
+Usage:
+    import sedu_drc
+    result = sedu_drc.check_clearance(sedu_board.load_board(), sedu_drc.load_rules())
+
+    python scripts/sedu_drc.py [PCB]      # report and timing
+
+Exit codes: 0 = no violations, 1 = violations found (or board unreadable)
+"""
+from __future__ import annotations
+
+import math
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import NamedTuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+import sedu_board
+import sedu_db
+import sedu_geometry
+import sedu_sexpr
+
+DEFAULT_CLASS = "Default"
+ALL_LAYERS = frozenset({"*"})  # Through-hole pads and through vias
+
+# Distances within this (mm) of the rule are numerical noise, not violations
+EPSILON = 1e-6
+
+
+class NetClass(NamedTuple):
+    name: str
+    clearance: float     # mm
+    trace_width: float   # mm
+
+
+class Arc(NamedTuple):
+    centre: tuple
+    radius: float
+    start: float         # angle of the start point (rad)
+    sweep: float         # signed angle from start through mid to end (rad)
+    ends: tuple          # (start, end) points
+
+
+class Copper(NamedTuple):
+    label: str           # "U1.3", "via", "track", "arc"
+    net: str
+    layers: frozenset    # copper layers, or ALL_LAYERS
+    seg: tuple | None    # capsule centre segment ((x0, y0), (x1, y1)); arc ends
+    radius: float        # capsule radius (0 for polygons)
+    poly: tuple | None   # convex polygon points (rectangular pads)
+    at: tuple            # location for the report
+    arc: Arc | None = None  # centre curve of arc tracks
+
+
+class Rules:
+    """Net -> NetClass lookup built from the database net_classes section."""
+
+    def __init__(self, classes: dict, members: dict):
+        self.classes = classes   # name -> NetClass
+        self.members = members   # net -> class name
+
+    def of(self, net: str) -> NetClass:
+        name = self.members.get(net.rsplit("/", 1)[-1], DEFAULT_CLASS)
+        return self.classes.get(name) or self.classes[DEFAULT_CLASS]
+
+    @property
+    def max_clearance(self) -> float:
+        return max(c.clearance for c in self.classes.values())
+
+
+def load_rules(db: dict | None = None) -> Rules:
+    """Rules from design_database.yaml (net_classes); Default 0.2/0.25 mm if absent."""
+    db = sedu_db.load_database() if db is None else db
+    classes, members = {}, {}
+    for name, spec in (db.get("net_classes") or {}).items():
+        classes[name] = NetClass(name, float(spec.get("clearance_mm", 0.2)),
+                                 float(spec.get("trace_width_mm", 0.0)))
+        for net in spec.get("nets") or []:
+            members[net] = name
+    classes.setdefault(DEFAULT_CLASS, NetClass(DEFAULT_CLASS, 0.2, 0.25))
+    return Rules(classes, members)
+
+
+def _copper_layers(layers) -> frozenset:
+    found = set()
+    for layer in layers:
+        if layer == "*.Cu":
+            return ALL_LAYERS
+        if layer == "F&B.Cu":
+            found.update(("F.Cu", "B.Cu"))
+        elif layer.endswith(".Cu"):
+            found.add(layer)
+    return frozenset(found)
+
+
+def _share_layer(a: frozenset, b: frozenset) -> bool:
+    return a is ALL_LAYERS or b is ALL_LAYERS or not a.isdisjoint(b)
+
+
+def _pad_copper(pad) -> Copper | None:
+    if pad.kind == "np_thru_hole" or len(pad.size) < 2:
+        return None
+    layers = _copper_layers(pad.layers)
+    if not layers:
+        return None
+    w, h = pad.size
+    label = f"{pad.ref}.{pad.number}" if pad.number else pad.ref
+    if pad.shape in ("circle", "oval"):
+        half = abs(w - h) / 2
+        local = ((-half, 0.0), (half, 0.0)) if w >= h else ((0.0, -half), (0.0, half))
+        seg = tuple((pad.x + dx, pad.y + dy)
+                    for dx, dy in (sedu_sexpr.rotate(x, y, pad.angle) for x, y in local))
+        return Copper(label, pad.net, layers, seg, min(w, h) / 2, None, (pad.x, pad.y))
+    poly = tuple(sedu_geometry.to_board(pad, (-w / 2, -h / 2, w / 2, h / 2)))
+    return Copper(label, pad.net, layers, None, 0.0, poly, (pad.x, pad.y))
+
+
+def make_arc(start, mid, end) -> Arc | None:
+    """Arc through three points, or None if they are collinear (a straight track)."""
+    (ax, ay), (bx, by), (cx, cy) = start, mid, end
+    d = 2 * (ax * (by - cy) + bx * (cy - ay) + cx * (ay - by))
+    if abs(d) < EPSILON:
+        return None
+    a2, b2, c2 = ax * ax + ay * ay, bx * bx + by * by, cx * cx + cy * cy
+    ox = (a2 * (by - cy) + b2 * (cy - ay) + c2 * (ay - by)) / d
+    oy = (a2 * (cx - bx) + b2 * (ax - cx) + c2 * (bx - ax)) / d
+    a0 = math.atan2(ay - oy, ax - ox)
+    to_mid = (math.atan2(by - oy, bx - ox) - a0) % math.tau
+    to_end = (math.atan2(cy - oy, cx - ox) - a0) % math.tau
+    sweep = to_end if to_mid <= to_end else to_end - math.tau
+    return Arc((ox, oy), math.hypot(ax - ox, ay - oy), a0, sweep, (start, end))
+
+
+def collect(board) -> list:
+    """Copper records for every pad, track and via on the board."""
+    copper = []
+    for fp in board.all_footprints():
+        for pad in fp.pads:
+            item = _pad_copper(pad)
+            if item is not None:
+                copper.append(item)
+    for layer, tracks in board.tracks_by_layer.items():
+        layers = frozenset({layer})
+        for t in tracks:
+            arc = None if t.mid is None else make_arc(t.start, t.mid, t.end)
+            label = "track" if arc is None else "arc"
+            copper.append(Copper(label, t.net, layers, (t.start, t.end), t.width / 2, None, t.start, arc))
+    vias = {id(v): v for vs in board.vias_by_layer.values() for v in vs}
+    for v in vias.values():
+        through = set(v.layers) == {"F.Cu", "B.Cu"}
+        layers = ALL_LAYERS if through else frozenset(v.layers)
+        copper.append(Copper("via", v.net, layers, ((v.x, v.y), (v.x, v.y)), v.size / 2, None, (v.x, v.y)))
+    return copper
+
+
+def _in_sweep(arc: Arc, x: float, y: float) -> bool:
+    offset = (math.atan2(y - arc.centre[1], x - arc.centre[0]) - arc.start) % math.tau
+    return offset <= arc.sweep if arc.sweep >= 0 else offset == 0 or offset >= math.tau + arc.sweep
+
+
+def _arc_points(arc: Arc) -> list:
+    """Arc ends plus the axis extremes it passes through (its bounding points)."""
+    (ox, oy), r = arc.centre, arc.radius
+    points = list(arc.ends)
+    for dx, dy in ((r, 0.0), (0.0, r), (-r, 0.0), (0.0, -r)):
+        if _in_sweep(arc, ox + dx, oy + dy):
+            points.append((ox + dx, oy + dy))
+    return points
+
+
+def _bounds(item: Copper) -> tuple:
+    if item.arc is not None:
+        points = _arc_points(item.arc)
+    else:
+        points = item.poly if item.poly is not None else item.seg
+    x0, y0, x1, y1 = sedu_geometry.bounds(points)
+    r = item.radius
+    return (x0 - r, y0 - r, x1 + r, y1 + r)
+
+
+def _point_segment(p, a, b) -> float:
+    dx, dy = b[0] - a[0], b[1] - a[1]
+    length2 = dx * dx + dy * dy
+    t = 0.0 if length2 == 0 else max(0.0, min(1.0, ((p[0] - a[0]) * dx + (p[1] - a[1]) * dy) / length2))
+    return math.hypot(p[0] - (a[0] + t * dx), p[1] - (a[1] + t * dy))
+
+
+def _cross(o, a, b) -> float:
+    return (a[0] - o[0]) * (b[1] - o[1]) - (a[1] - o[1]) * (b[0] - o[0])
+
+
+def segment_distance(a0, a1, b0, b1) -> float:
+    """Shortest distance between segments a0-a1 and b0-b1 (0 if they cross)."""
+    d1, d2 = _cross(b0, b1, a0), _cross(b0, b1, a1)
+    d3, d4 = _cross(a0, a1, b0), _cross(a0, a1, b1)
+    if ((d1 > 0) != (d2 > 0) and d1 != 0 and d2 != 0
+            and (d3 > 0) != (d4 > 0) and d3 != 0 and d4 != 0):
+        return 0.0
+    return min(_point_segment(a0, b0, b1), _point_segment(a1, b0, b1),
+               _point_segment(b0, a0, a1), _point_segment(b1, a0, a1))
+
+
+def point_arc_distance(p, arc: Arc) -> float:
+    """Shortest distance from p to the arc curve."""
+    (ox, oy), r = arc.centre, arc.radius
+    if _in_sweep(arc, p[0], p[1]):
+        return abs(math.hypot(p[0] - ox, p[1] - oy) - r)
+    return min(math.dist(p, arc.ends[0]), math.dist(p, arc.ends[1]))
+
+
+def segment_arc_distance(a, b, arc: Arc) -> float:
+    """Shortest distance between segment a-b and the arc curve (0 if they cross).
+
+    The minimum is at an end of either curve, at the segment point nearest
+    the centre, or at a crossing of the segment and the circle - whichever
+    of the last two lie on the arc.
+    """
+    best = min(point_arc_distance(a, arc), point_arc_distance(b, arc),
+               _point_segment(arc.ends[0], a, b), _point_segment(arc.ends[1], a, b))
+    (ox, oy), r = arc.centre, arc.radius
+    dx, dy = b[0] - a[0], b[1] - a[1]
+    length2 = dx * dx + dy * dy
+    if length2 == 0:
+        return best
+    t = ((ox - a[0]) * dx + (oy - a[1]) * dy) / length2
+    h = math.hypot(a[0] + t * dx - ox, a[1] + t * dy - oy)
+    candidates = [t]
+    if h < r:
+        k = math.sqrt((r * r - h * h) / length2)
+        candidates += [t - k, t + k]
+    for u in candidates:
+        if 0.0 <= u <= 1.0:
+            x, y = a[0] + u * dx, a[1] + u * dy
+            if _in_sweep(arc, x, y):
+                best = min(best, abs(math.hypot(x - ox, y - oy) - r))
+    return best
+
+
+def arc_distance(p: Arc, q: Arc) -> float:
+    """Shortest distance between two arc curves (0 if they cross).
+
+    The minimum is at an end of either arc, on the line through both
+    centres, or at a crossing of the two circles that lies on both arcs.
+    """
+    best = min(point_arc_distance(p.ends[0], q), point_arc_distance(p.ends[1], q),
+               point_arc_distance(q.ends[0], p), point_arc_distance(q.ends[1], p))
+    (px, py), (qx, qy) = p.centre, q.centre
+    d = math.hypot(qx - px, qy - py)
+    if d < EPSILON:  # Concentric: the ends already cover where the sweeps overlap
+        return best
+    ux, uy = (qx - px) / d, (qy - py) / d
+    for arc, other in ((p, q), (q, p)):
+        ox, oy = arc.centre
+        for s in (1.0, -1.0):
+            x, y = ox + s * arc.radius * ux, oy + s * arc.radius * uy
+            if _in_sweep(arc, x, y):
+                best = min(best, point_arc_distance((x, y), other))
+    if abs(p.radius - q.radius) <= d <= p.radius + q.radius:
+        a = (d * d + p.radius ** 2 - q.radius ** 2) / (2 * d)
+        h = math.sqrt(max(p.radius ** 2 - a * a, 0.0))
+        mx, my = px + a * ux, py + a * uy
+        for s in (1.0, -1.0):
+            x, y = mx - s * h * uy, my + s * h * ux
+            if _in_sweep(p, x, y) and _in_sweep(q, x, y):
+                return 0.0
+    return best
+
+
+def _edge_distance(e, f) -> float:
+    if isinstance(e, Arc):
+        return arc_distance(e, f) if isinstance(f, Arc) else segment_arc_distance(*f, e)
+    if isinstance(f, Arc):
+        return segment_arc_distance(*e, f)
+    return segment_distance(*e, *f)
+
+
+def _inside(p, poly) -> bool:
+    signs = {_cross(poly[i], poly[(i + 1) % len(poly)], p) > 0
+             for i in range(len(poly)) if _cross(poly[i], poly[(i + 1) % len(poly)], p) != 0}
+    return len(signs) <= 1
+
+
+def _edges(item: Copper) -> list:
+    if item.arc is not None:
+        return [item.arc]
+    if item.poly is None:
+        return [item.seg]
+    poly = item.poly
+    return [(poly[i], poly[(i + 1) % len(poly)]) for i in range(len(poly))]
+
+
+def distance(a: Copper, b: Copper) -> float:
+    """Edge-to-edge copper distance (<= 0 when the shapes touch or overlap)."""
+    for inner, outer in ((a, b), (b, a)):
+        if outer.poly is not None:
+            points = inner.poly if inner.poly is not None else inner.seg
+            if any(_inside(p, outer.poly) for p in points):
+                return -inner.radius
+    gap = min(_edge_distance(e, f) for e in _edges(a) for f in _edges(b))
+    return gap - a.radius - b.radius
+
+
+def check_clearance(board, rules: Rules) -> dict:
+    """DRC-lite violations on a sedu_board.Board.
+
+    Returns {"clearance": [(gap, required, a, b)], "width": [(track, required)],
+    "checked": n_objects, "pairs": n_candidates, "rules": [warnings]}.
+    """
+    copper = collect(board)
+    grow = rules.max_clearance / 2
+
+    if copper:
+        sizes = [max(b[2] - b[0], b[3] - b[1]) for b in map(_bounds, copper)]
+        cell = max(2 * statistics.median(sizes), 4 * grow, 0.5)
+    else:
+        cell = 1.0
+    index = sedu_geometry.GridIndex(cell)
+    for i, item in enumerate(copper):
+        x0, y0, x1, y1 = _bounds(item)
+        index.insert(i, (x0 - grow, y0 - grow, x1 + grow, y1 + grow))
+
+    clearance = []
+    pairs = 0
+    for i, j in index.pairs():
+        a, b = copper[i], copper[j]
+        if (a.net and a.net == b.net) or not _share_layer(a.layers, b.layers):
+            continue
+        pairs += 1
+        required = max(rules.of(a.net).clearance, rules.of(b.net).clearance)
+        gap = distance(a, b)
+        if gap < required - EPSILON:
+            clearance.append((max(gap, 0.0), required, a, b))
+
+    width = []
+    for tracks in board.tracks_by_layer.values():
+        for t in tracks:
+            required = rules.of(t.net).trace_width
+            if t.width < required - EPSILON:
+                width.append((t, required))
+
+    warnings = []
+    for name, pcb in sorted(board.net_classes.items()):
+        db = rules.classes.get(name)
+        if db is None:
+            warnings.append(f"board net class {name} not in database")
+        elif abs(float(pcb.get("clearance", db.clearance)) - db.clearance) > EPSILON:
+            warnings.append(f"{name}: board clearance {pcb['clearance']:g} mm, database {db.clearance:g} mm")
+
+    return {
+        "clearance": sorted(clearance, key=lambda v: (v[0] - v[1], v[2].at, v[3].at)),
+        "width": sorted(width, key=lambda v: (v[0].layer, v[0].start)),
+        "checked": len(copper),
+        "pairs": pairs,
+        "rules": warnings,
+    }
+
+
+def _name(item: Copper) -> str:
+    net = item.net or "no net"
+    return f"{item.label} [{net}] at ({item.at[0]:g},{item.at[1]:g})"
+
+
+def print_report(result: dict, limit: int = 20) -> int:
+    """Print violations (at most limit per kind); return 1 if any were found."""
+    print(f"Copper objects: {result['checked']}, candidate pairs: {result['pairs']}")
+    for warning in result["rules"]:
+        print(f"  [WARN] Net class: {warning}")
+    rc = 0
+    clearance = result["clearance"]
+    if clearance:
+        rc = 1
+        print(f"  [FAIL] Clearance violations: {len(clearance)}")
+        for gap, required, a, b in clearance[:limit]:
+            print(f"         {gap:.3f} < {required:g} mm: {_name(a)} <-> {_name(b)}")
+        if len(clearance) > limit:
+            print(f"         ... {len(clearance) - limit} more")
+    else:
+        print("  [OK]   Clearance violations: none")
+    width = result["width"]
+    if width:
+        rc = 1
+        print(f"  [FAIL] Track width violations: {len(width)}")
+        for t, required in width[:limit]:
+            print(f"         {t.width:g} < {required:g} mm: {t.net or 'no net'} on {t.layer} "
+                  f"({t.start[0]:g},{t.start[1]:g})-({t.end[0]:g},{t.end[1]:g})")
+        if len(width) > limit:
+            print(f"         ... {len(width) - limit} more")
+    else:
+        print("  [OK]   Track width violations: none")
+    return rc
+
+
+if __name__ == "__main__":
+    path = Path(sys.argv[1]) if len(sys.argv) > 1 else sedu_board.PCB
+    try:
+        board = sedu_board.load_board(path)
+    except (OSError, sedu_sexpr.SExprError) as e:
+        print(f"[FAIL] {path}: {e}")
+        sys.exit(1)
+    rules = load_rules()
+    t0 = time.perf_counter()
+    result = check_clearance(board, rules)
+    elapsed = time.perf_counter() - t0
+    print(f"DRC-lite: {path.name} ({len(rules.classes)} net classes)")
+    rc = print_report(result)
+    print(f"Engine time: {elapsed * 1000:.1f} ms")
+    sys.exit(rc)
@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+"""
+SEDU Footprint Library Index - Cached facts about every resolvable footprint
+
+Libraries come from hardware/fp-lib-table (${KIPRJMOD} = hardware/, other
+${VARS} from the environment) plus the KiCad stock library directory when
+one of KICAD{9,8,7,6}_FOOTPRINT_DIR / KICAD_FOOTPRINT_DIR is set. Project
+libraries shadow stock libraries of the same nickname, as in KiCad.
+
+For each footprint the index stores:
+    pads            distinct copper pad numbers (mechanical holes excluded)
+    courtyard       courtyard bounding box (x0, y0, x1, y1) or None
+    exposed_pads    large SMD pads under the body: (number, x, y, w, h),
+                    see exposed_pads()
+
+The index lives in .sedu_cache/fplib_index.json. Each run lists the
+library directories and stats their files; only new or changed .kicad_mod
+files are parsed, so unchanged libraries are never reopened.
+
+Symbols from the project symbol libraries (sym-lib-table) are read with
+their pin numbers and default Footprint property for cross-checks.
+
+Usage:
+    import sedu_fplib
+    index = sedu_fplib.FootprintIndex.load()
+    info = index.get("SEDU:R_2728_4T_Kelvin")
+
+    python scripts/sedu_fplib.py        # library summary and timing
+"""
+from __future__ import annotations
+
+import json
+import os
+import re
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import NamedTuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+import sedu_board
+import sedu_db
+import sedu_sexpr
+
+ROOT = Path(__file__).resolve().parents[1]
+HARDWARE = ROOT / "hardware"
+FP_LIB_TABLE = HARDWARE / "fp-lib-table"
+SYM_LIB_TABLE = HARDWARE / "sym-lib-table"
+INDEX_PATH = sedu_db.CACHE_DIR / "fplib_index.json"
+INDEX_VERSION = 1
+
+STOCK_FOOTPRINT_VARS = ("KICAD9_FOOTPRINT_DIR", "KICAD8_FOOTPRINT_DIR", "KICAD7_FOOTPRINT_DIR",
+                        "KICAD6_FOOTPRINT_DIR", "KICAD_FOOTPRINT_DIR")
+
+# An SMD pad at least this many times the median SMD pad area is an exposed
+# (thermal) pad - only for parts with at least EP_MIN_PADS pads, so large
+# two-terminal pads (shunts, inductors) do not count
+EP_AREA_RATIO = 4.0
+EP_MIN_PADS = 5
+
+_VAR = re.compile(r"\$\{(\w+)\}")
+
+
+class FootprintInfo(NamedTuple):
+    pads: tuple          # sorted distinct copper pad numbers
+    courtyard: tuple | None
+    exposed_pads: tuple  # (number, x, y, w, h) in footprint coordinates
+
+    @property
+    def pad_count(self) -> int:
+        return len(self.pads)
+
+
+class SymbolInfo(NamedTuple):
+    lib_id: str
+    pins: tuple          # sorted distinct pin numbers
+    footprint: str       # default Footprint property ("" if none)
+
+
+def _expand(uri: str, base: Path) -> Path | None:
+    def var(m):
+        if m.group(1) == "KIPRJMOD":
+            return str(base)
+        return os.environ.get(m.group(1), m.group(0))
+    path = _VAR.sub(var, uri)
+    return None if "${" in path else Path(path)
+
+
+def read_lib_table(table: Path) -> dict:
+    """Nickname -> library path from a KiCad fp-lib-table / sym-lib-table."""
+    libs = {}
+    try:
+        root = sedu_sexpr.load(table, lazy_depth=None)
+    except (OSError, sedu_sexpr.SExprError):
+        return libs
+    for lib in root.nodes("lib"):
+        name, uri = lib.value("name"), lib.value("uri")
+        path = _expand(uri, table.parent) if name and uri else None
+        if path is not None:
+            libs[name] = path
+    return libs
+
+
+def footprint_libraries() -> dict:
+    """Nickname -> .pretty directory for every available footprint library."""
+    libs = {}
+    for var in STOCK_FOOTPRINT_VARS:
+        stock = os.environ.get(var)
+        if stock and Path(stock).is_dir():
+            for pretty in sorted(Path(stock).glob("*.pretty")):
+                libs[pretty.stem] = pretty
+            break
+    libs.update({n: p for n, p in read_lib_table(FP_LIB_TABLE).items() if p.is_dir()})
+    return libs
+
+
+def footprint_info(raw: bytes) -> FootprintInfo:
+    """Pad numbers, courtyard and exposed pads of one .kicad_mod file."""
+    root = sedu_sexpr.parse(raw)
+    numbers = set()
+    smd = []
+    for pad in root.nodes("pad"):
+        number = pad[1] if len(pad) > 1 else ""
+        kind = pad[2] if len(pad) > 2 else ""
+        if number and kind != "np_thru_hole":
+            numbers.add(number)
+        size = pad.floats("size")
+        at = pad.floats("at") + (0.0, 0.0)
+        layers = pad.find("layers")
+        copper = layers is not None and any(layer.endswith(".Cu") for layer in layers.atoms)
+        if kind == "smd" and number and copper and len(size) >= 2:
+            smd.append((number, at[0], at[1], size[0], size[1]))
+
+    exposed = exposed_pads(smd)
+
+    courtyard = []
+    for item in root.find_all(*sedu_board.COURTYARD_ITEMS):
+        if item.value("layer") in sedu_board.COURTYARD_LAYERS:
+            courtyard.extend(sedu_board.graphic_points(item))
+    bbox = None
+    if courtyard:
+        xs, ys = [p[0] for p in courtyard], [p[1] for p in courtyard]
+        bbox = (min(xs), min(ys), max(xs), max(ys))
+    return FootprintInfo(tuple(sorted(numbers, key=_pad_order)), bbox, tuple(exposed))
+
+
+def exposed_pads(smd: list) -> list:
+    """Exposed pads among a part's numbered copper SMD pads.
+
+    smd holds (number, x, y, w, h, ...) tuples; the qualifying tuples are
+    returned unchanged.
+    """
+    if len(smd) < EP_MIN_PADS:
+        return []
+    median = statistics.median(p[3] * p[4] for p in smd)
+    return [p for p in smd if p[3] * p[4] >= EP_AREA_RATIO * median]
+
+
+def _pad_order(number: str):
+    return (0, int(number), "") if number.isdigit() else (1, 0, number)
+
+
+class FootprintIndex:
+    """lib_id ("Lib:Name") -> FootprintInfo for every available footprint."""
+
+    def __init__(self, libraries: dict, entries: dict):
+        self.libraries = libraries   # nickname -> .pretty path
+        self.entries = entries       # lib_id -> FootprintInfo
+        self.parsed = 0              # files (re)parsed while loading
+        self.errors = []             # (file, message) for unreadable footprints
+
+    def get(self, lib_id: str):
+        return self.entries.get(lib_id)
+
+    def has_library(self, lib_id: str) -> bool:
+        return lib_id.split(":", 1)[0] in self.libraries
+
+    @classmethod
+    def load(cls, libraries: dict | None = None, use_cache: bool = True) -> "FootprintIndex":
+        libraries = footprint_libraries() if libraries is None else libraries
+        stored = {}
+        if use_cache:
+            try:
+                data = json.loads(INDEX_PATH.read_text(encoding="utf-8"))
+                if data.get("version") == INDEX_VERSION:
+                    stored = data["entries"]
+            except (OSError, ValueError, KeyError):
+                stored = {}
+
+        index = cls(libraries, {})
+        records = {}
+        for nickname, directory in sorted(libraries.items()):
+            try:
+                files = [e for e in os.scandir(directory) if e.name.endswith(".kicad_mod")]
+            except OSError:
+                continue
+            for entry in sorted(files, key=lambda e: e.name):
+                lib_id = f"{nickname}:{entry.name[:-len('.kicad_mod')]}"
+                st = entry.stat()
+                key = [entry.path, st.st_size, st.st_mtime_ns]
+                known = stored.get(lib_id)
+                if known and known["file"] == key:
+                    info = known["info"]
+                else:
+                    try:
+                        info = footprint_info(Path(entry.path).read_bytes())._asdict()
+                    except (OSError, sedu_sexpr.SExprError) as e:
+                        index.errors.append((entry.path, str(e)))
+                        continue
+                    index.parsed += 1
+                records[lib_id] = {"file": key, "info": info}
+                index.entries[lib_id] = FootprintInfo(
+                    tuple(info["pads"]),
+                    tuple(info["courtyard"]) if info["courtyard"] else None,
+                    tuple(tuple(p) for p in info["exposed_pads"]),
+                )
+
+        if use_cache and (index.parsed or records.keys() != stored.keys()):
+            _save(records)
+        return index
+
+
+def _save(records: dict) -> None:
+    try:
+        INDEX_PATH.parent.mkdir(parents=True, exist_ok=True)
+        tmp = INDEX_PATH.with_suffix(".tmp")
+        tmp.write_text(json.dumps({"version": INDEX_VERSION, "entries": records},
+                                  sort_keys=True), encoding="utf-8")
+        os.replace(tmp, INDEX_PATH)
+    except OSError as e:
+        print(f"[WARN] Could not write footprint index: {e}")
+
+
+def load_symbols() -> dict:
+    """lib_id ("Lib:Name") -> SymbolInfo for the project symbol libraries."""
+    symbols = {}
+    for nickname, path in read_lib_table(SYM_LIB_TABLE).items():
+        try:
+            root = sedu_sexpr.load(path)
+        except (OSError, sedu_sexpr.SExprError):
+            continue
+        for sym in root.nodes("symbol"):
+            if len(sym) < 2:
+                continue
+            pins = {pin.value("number", "") for pin in sym.walk("pin")} - {""}
+            footprint = ""
+            for prop in sym.nodes("property"):
+                if len(prop) >= 3 and prop[1] == "Footprint":
+                    footprint = prop[2]
+            symbols[f"{nickname}:{sym[1]}"] = SymbolInfo(
+                f"{nickname}:{sym[1]}", tuple(sorted(pins, key=_pad_order)), footprint)
+    return symbols
+
+
+if __name__ == "__main__":
+    t0 = time.perf_counter()
+    index = FootprintIndex.load()
+    t1 = time.perf_counter()
+    print(f"Footprint libraries: {len(index.libraries)}")
+    for nickname, path in sorted(index.libraries.items()):
+        count = sum(1 for lib_id in index.entries if lib_id.startswith(nickname + ":"))
+        print(f"  {nickname:30s} {count:5d} footprints  {path}")
+    for lib_id, info in sorted(index.entries.items())[:20]:
+        ep = ", ".join(f"{n or '-'} {w:g}x{h:g}" for n, _, _, w, h in info.exposed_pads) or "none"
+        print(f"  {lib_id:50s} {info.pad_count:3d} pads  EP: {ep}")
+    for path, message in index.errors:
+        print(f"  [FAIL] {path}: {message}")
+    print(f"Symbols: {len(load_symbols())}")
+    print(f"Indexed in {(t1 - t0) * 1000:.1f} ms ({index.parsed} footprint files parsed)")
+    sys.exit(1 if index.errors else 0)
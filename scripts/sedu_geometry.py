@@ -0,0 +1,304 @@
+#!/usr/bin/env python3
+"""
+SEDU Placement Geometry - Courtyard overlap and keep-out engine
+
+Reads placed footprints from the board model (sedu_board.py) and reports:
+
+1. Courtyard overlaps between footprints on the same side
+2. Intrusions into the ESP32 antenna keep-out (>=15 mm forward of the
+   antenna edge, 5 mm to each side, both board sides)
+3. Intrusions into the mounting-hole annuli (3.2 mm hole + 1.5 mm keep-out)
+4. Footprints inside KiCad rule areas that forbid footprints
+
+Each courtyard is the footprint's courtyard bounding box in its own frame,
+rotated with the footprint - an oriented rectangle, so rotated parts are
+not over-approximated. Candidate pairs come from a uniform grid over the
+axis-aligned bounds (expected near-linear time), and only candidates get
+the exact separating-axis test. Touching courtyards do not count.
+
+Usage:
+    import sedu_geometry
+    result = sedu_geometry.check_placement(sedu_board.load_board())
+
+    python scripts/sedu_geometry.py [PCB]     # report and timing
+
+Exit codes: 0 = no violations, 1 = violations found (or board unreadable)
+"""
+from __future__ import annotations
+
+import math
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+import sedu_board
+import sedu_sexpr
+
+# Frozen placement rules (see verify_board_fit.py)
+HOLE_DRILL = 3.2        # mm finished
+HOLE_KEEPOUT = 1.5      # mm annulus around the hole
+ANTENNA_FORWARD = 15.0  # mm beyond the antenna edge
+ANTENNA_SIDES = 5.0     # mm beyond each side of the module
+ANTENNA_MODULES = ("ESP32",)
+
+# Overlaps smaller than this (mm) are numerical noise, not intrusions
+EPSILON = 1e-6
+
+
+class GridIndex:
+    """Uniform-grid spatial hash of axis-aligned boxes (x0, y0, x1, y1)."""
+
+    def __init__(self, cell: float):
+        self.cell = cell
+        self.cells = defaultdict(list)
+        self.boxes = {}
+
+    def _span(self, box):
+        c = self.cell
+        return (range(math.floor(box[0] / c), math.floor(box[2] / c) + 1),
+                range(math.floor(box[1] / c), math.floor(box[3] / c) + 1))
+
+    def insert(self, key, box) -> None:
+        self.boxes[key] = box
+        xs, ys = self._span(box)
+        for ix in xs:
+            for iy in ys:
+                self.cells[(ix, iy)].append(key)
+
+    def query(self, box) -> set:
+        """Keys whose boxes intersect box (closed intervals)."""
+        found = set()
+        xs, ys = self._span(box)
+        for ix in xs:
+            for iy in ys:
+                for key in self.cells.get((ix, iy), ()):
+                    if key not in found and boxes_intersect(self.boxes[key], box):
+                        found.add(key)
+        return found
+
+    def pairs(self):
+        """Each intersecting pair of inserted boxes, once."""
+        c = self.cell
+        for (ix, iy), keys in self.cells.items():
+            for i in range(len(keys)):
+                a = self.boxes[keys[i]]
+                for j in range(i + 1, len(keys)):
+                    b = self.boxes[keys[j]]
+                    if not boxes_intersect(a, b):
+                        continue
+                    # Report only in the cell holding the overlap's lower-left corner
+                    if (math.floor(max(a[0], b[0]) / c) == ix
+                            and math.floor(max(a[1], b[1]) / c) == iy):
+                        yield keys[i], keys[j]
+
+
+def boxes_intersect(a, b) -> bool:
+    return a[0] <= b[2] and b[0] <= a[2] and a[1] <= b[3] and b[1] <= a[3]
+
+
+def bounds(points) -> tuple:
+    xs = [p[0] for p in points]
+    ys = [p[1] for p in points]
+    return (min(xs), min(ys), max(xs), max(ys))
+
+
+def _axes(poly):
+    for i in range(len(poly)):
+        x0, y0 = poly[i]
+        x1, y1 = poly[(i + 1) % len(poly)]
+        yield (y0 - y1, x1 - x0)
+
+
+def polygons_overlap(a, b) -> bool:
+    """True if convex polygons a and b overlap by more than EPSILON (SAT)."""
+    for ax, ay in list(_axes(a)) + list(_axes(b)):
+        norm = math.hypot(ax, ay)
+        if norm == 0:
+            continue
+        pa = [(x * ax + y * ay) / norm for x, y in a]
+        pb = [(x * ax + y * ay) / norm for x, y in b]
+        if min(pa) >= max(pb) - EPSILON or min(pb) >= max(pa) - EPSILON:
+            return False
+    return True
+
+
+def circle_overlaps_polygon(cx: float, cy: float, r: float, poly) -> bool:
+    """True if the disc of radius r intrudes into convex polygon poly."""
+    signs = set()
+    nearest = math.inf
+    for i in range(len(poly)):
+        x0, y0 = poly[i]
+        x1, y1 = poly[(i + 1) % len(poly)]
+        dx, dy = x1 - x0, y1 - y0
+        length2 = dx * dx + dy * dy
+        t = 0.0 if length2 == 0 else max(0.0, min(1.0, ((cx - x0) * dx + (cy - y0) * dy) / length2))
+        nearest = min(nearest, math.hypot(cx - (x0 + t * dx), cy - (y0 + t * dy)))
+        cross = dx * (cy - y0) - dy * (cx - x0)
+        if abs(cross) > EPSILON:
+            signs.add(cross > 0)
+    centre_inside = len(signs) <= 1  # Same side of every edge, either winding
+    return centre_inside or nearest < r - EPSILON
+
+
+def to_box(bbox) -> list:
+    x0, y0, x1, y1 = bbox
+    return [(x0, y0), (x1, y0), (x1, y1), (x0, y1)]
+
+
+def local_rect(fp):
+    """Courtyard bounding box in the footprint's own frame, or None."""
+    if not fp.courtyard:
+        return None
+    local = [sedu_sexpr.rotate(x - fp.x, y - fp.y, -fp.angle) for x, y in fp.courtyard]
+    return bounds(local)
+
+
+def to_board(fp, rect) -> list:
+    """Corners of a footprint-frame rectangle in board coordinates."""
+    x0, y0, x1, y1 = rect
+    corners = []
+    for x, y in ((x0, y0), (x1, y0), (x1, y1), (x0, y1)):
+        dx, dy = sedu_sexpr.rotate(x, y, fp.angle)
+        corners.append((fp.x + dx, fp.y + dy))
+    return corners
+
+
+def antenna_keepout(fp, forward: float = ANTENNA_FORWARD, sides: float = ANTENNA_SIDES):
+    """Keep-out polygon ahead of the module's antenna edge (its courtyard's -y side)."""
+    rect = local_rect(fp)
+    if rect is None:
+        return None
+    x0, y0, x1, _ = rect
+    return to_board(fp, (x0 - sides, y0 - forward, x1 + sides, y0))
+
+
+def _side(fp) -> str:
+    return "B" if fp.layer.startswith("B.") else "F"
+
+
+def check_placement(board, hole_drill: float = HOLE_DRILL, hole_keepout: float = HOLE_KEEPOUT) -> dict:
+    """Placement violations on a sedu_board.Board.
+
+    Returns {"overlaps": [(ref_a, ref_b)], "antenna": [(module, ref)],
+    "holes": [((x, y), ref)], "rule_areas": [(area, ref)],
+    "checked": n, "no_courtyard": [refs]}.
+    """
+    footprints = board.all_footprints()
+    courtyards = {}
+    axis_aligned = set()  # Rotated by a multiple of 90 deg: box tests are exact
+    no_courtyard = []
+    for i, fp in enumerate(footprints):
+        rect = local_rect(fp)
+        if rect is None:
+            if "MountingHole" not in fp.lib_id:
+                no_courtyard.append(fp.ref or fp.lib_id)
+            continue
+        courtyards[i] = to_board(fp, rect)
+        if fp.angle % 90 == 0:
+            axis_aligned.add(i)
+
+    # Cell about twice a typical courtyard: few cells per part, few parts per cell
+    if courtyards:
+        sizes = sorted(max(b[2] - b[0], b[3] - b[1])
+                       for b in (bounds(p) for p in courtyards.values()))
+        cell = max(2 * sizes[len(sizes) // 2], 1.0)
+    else:
+        cell = 10.0
+    index = GridIndex(cell)
+    for i, poly in courtyards.items():
+        index.insert(i, bounds(poly))
+
+    def name(i):
+        return footprints[i].ref or footprints[i].lib_id
+
+    overlaps = []
+    boxes = index.boxes
+    for i, j in index.pairs():
+        if _side(footprints[i]) != _side(footprints[j]):
+            continue
+        if i in axis_aligned and j in axis_aligned:
+            a, b = boxes[i], boxes[j]  # Bounds are the courtyards themselves
+            hit = min(a[2], b[2]) - max(a[0], b[0]) > EPSILON and min(a[3], b[3]) - max(a[1], b[1]) > EPSILON
+        else:
+            hit = polygons_overlap(courtyards[i], courtyards[j])
+        if hit:
+            overlaps.append(tuple(sorted((name(i), name(j)))))
+
+    antenna = []
+    for i, fp in enumerate(footprints):
+        if i not in courtyards or not any(m in fp.lib_id or m in fp.value for m in ANTENNA_MODULES):
+            continue
+        zone = antenna_keepout(fp)
+        for j in index.query(bounds(zone)):
+            if j != i and polygons_overlap(zone, courtyards[j]):
+                antenna.append((name(i), name(j)))
+
+    holes = []
+    r = hole_drill / 2 + hole_keepout
+    for owner, pad in board.hole_pads(hole_drill):
+        x, y = pad.x, pad.y
+        for j in index.query((x - r, y - r, x + r, y + r)):
+            # The hole's own courtyard always surrounds it
+            if footprints[j] is not owner and circle_overlaps_polygon(x, y, r, courtyards[j]):
+                holes.append(((x, y), name(j)))
+
+    rule_areas = []
+    for zone in board.keepouts():
+        if zone.keepout.get("footprints") != "not_allowed" or not zone.bbox:
+            continue
+        for j in index.query(zone.bbox):
+            if polygons_overlap(courtyards[j], to_box(zone.bbox)):
+                rule_areas.append((zone.name or "rule area", name(j)))
+
+    return {
+        "overlaps": sorted(overlaps),
+        "antenna": sorted(antenna),
+        "holes": sorted(holes),
+        "rule_areas": sorted(rule_areas),
+        "checked": len(courtyards),
+        "no_courtyard": sorted(no_courtyard),
+    }
+
+
+def print_report(result: dict, limit: int = 20) -> int:
+    """Print violations (at most limit per kind); return 1 if any were found."""
+    sections = [
+        ("overlaps", "Courtyard overlaps", lambda v: f"{v[0]} <-> {v[1]}"),
+        ("antenna", "ESP32 antenna keep-out intrusions", lambda v: f"{v[1]} in keep-out of {v[0]}"),
+        ("holes", "Mounting-hole keep-out intrusions", lambda v: f"{v[1]} within {HOLE_DRILL / 2 + HOLE_KEEPOUT:.1f} mm of hole at ({v[0][0]:g},{v[0][1]:g})"),
+        ("rule_areas", "Rule-area intrusions", lambda v: f"{v[1]} in {v[0]}"),
+    ]
+    print(f"Courtyards checked: {result['checked']}")
+    if result["no_courtyard"]:
+        print(f"  [!] No courtyard (not checked): {', '.join(result['no_courtyard'][:limit])}")
+    rc = 0
+    for key, title, fmt in sections:
+        found = result[key]
+        if not found:
+            print(f"  [OK]   {title}: none")
+            continue
+        rc = 1
+        print(f"  [FAIL] {title}: {len(found)}")
+        for v in found[:limit]:
+            print(f"         {fmt(v)}")
+        if len(found) > limit:
+            print(f"         ... {len(found) - limit} more")
+    return rc
+
+
+if __name__ == "__main__":
+    path = Path(sys.argv[1]) if len(sys.argv) > 1 else sedu_board.PCB
+    try:
+        board = sedu_board.load_board(path)
+    except (OSError, sedu_sexpr.SExprError) as e:
+        print(f"[FAIL] {path}: {e}")
+        sys.exit(1)
+    t0 = time.perf_counter()
+    result = check_placement(board)
+    elapsed = time.perf_counter() - t0
+    print(f"Placement check: {path.name}")
+    rc = print_report(result)
+    print(f"Engine time: {elapsed * 1000:.1f} ms")
+    sys.exit(rc)
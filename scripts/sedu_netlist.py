@@ -0,0 +1,426 @@
+#!/usr/bin/env python3
+"""
+SEDU Schematic Netlist - Hierarchical connectivity from the .kicad_sch sheets
+
+Extracts nets from hardware/*.kicad_sch without KiCad:
+
+1. Each sheet file is parsed on its own (sedu_sexpr) into local groups of
+   connected items: wires, junctions, labels, symbol pins and sheet pins.
+   Items connect when they share a point or a point lies on a wire; local
+   and hierarchical labels with the same name join within the sheet.
+2. Sheet results are snapshotted in .sedu_cache/ by file hash
+   (sedu_db.load_cached), so an edit reparses only the changed sheet.
+   Stale sheets are parsed in a process pool when there is enough work.
+3. The hierarchy is walked from SEDU_PCB.kicad_sch: a sheet symbol's pin
+   joins the child's hierarchical label of the same name, global labels
+   and power symbols join by name across all sheets. Sheet files that no
+   parent references are treated as extra roots.
+
+Net names follow KiCad: global labels and power nets keep their name,
+local labels get the sheet path ("/MCU/USB_DP"), unlabelled nets are
+named after a pin ("Net-(R1-Pad1)"). Net.labels holds the bare label names
+for comparison with the database. Buses are not expanded.
+
+Symbol pin positions use the symbol's Reference property, so repeated
+instances of one sheet file share references (SEDU uses none).
+
+Usage:
+    import sedu_netlist
+    netlist = sedu_netlist.extract()
+    if "VBAT" in netlist.label_names(): ...
+
+    python scripts/sedu_netlist.py            # sheet summary and nets
+"""
+from __future__ import annotations
+
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import NamedTuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+import sedu_db
+import sedu_geometry
+import sedu_sexpr
+
+ROOT = Path(__file__).resolve().parents[1]
+HARDWARE = ROOT / "hardware"
+TOP_SHEET = "SEDU_PCB.kicad_sch"
+
+# Bump when the per-sheet records change so stale snapshots are rebuilt
+SHEET_VERSION = 1
+
+# Parse stale sheets in a process pool only above this much text
+PARALLEL_MIN_BYTES = 2 * 1024 * 1024
+
+# Schematic coordinates are compared on a 0.1 um grid
+_SCALE = 10000
+
+
+class SheetRef(NamedTuple):
+    name: str            # sheet name shown on the parent
+    file: str            # child file name, relative to the parent's directory
+
+
+class Group(NamedTuple):
+    """Items of one sheet file that are connected locally."""
+    labels: tuple        # local label names
+    globals: tuple       # global labels, power nets, hidden power pins
+    hier: tuple          # hierarchical label names
+    pins: tuple          # (ref, number, name) of symbol pins
+    sheet_pins: tuple    # (index into SheetNets.children, pin name)
+
+
+class SheetNets(NamedTuple):
+    file: str
+    groups: tuple
+    children: tuple      # SheetRef per sheet symbol, in file order
+    symbols: int         # placed symbols (power symbols included)
+
+
+class Net(NamedTuple):
+    name: str
+    labels: frozenset    # bare label / power names on this net
+    pins: tuple          # sorted (ref, number)
+    sheets: tuple        # sheet instance paths the net touches
+
+
+def _key(x: float, y: float) -> tuple:
+    return (round(x * _SCALE), round(y * _SCALE))
+
+
+def _lib_pins(lib_symbols) -> dict:
+    """Lib id -> (is_power, [(unit, style, x, y, number, name, power_in_hidden)])."""
+    library = {}
+    if lib_symbols is None:
+        return library
+    for sym in lib_symbols.nodes("symbol"):
+        pins = []
+        units = [(0, 0, sym)]
+        for sub in sym.nodes("symbol"):
+            parts = sub[1].rsplit("_", 2) if len(sub) > 1 else []
+            try:
+                units.append((int(parts[-2]), int(parts[-1]), sub))
+            except (IndexError, ValueError):
+                units.append((0, 0, sub))
+        for unit, style, node in units:
+            for pin in node.nodes("pin"):
+                x, y = (pin.floats("at") + (0.0, 0.0))[:2]
+                hidden = pin.has_atom("hide") or pin.value("hide") == "yes"
+                pins.append((unit, style, x, y, pin.value("number", ""), pin.value("name", ""),
+                             len(pin) > 1 and pin[1] == "power_in" and hidden))
+        library[sym[1]] = (sym.find("power") is not None, pins)
+    return library
+
+
+def _property(node, *names) -> str:
+    for prop in node.nodes("property"):
+        if len(prop) >= 3 and prop[1] in names:
+            return prop[2]
+    return ""
+
+
+class _Union:
+    def __init__(self):
+        self.parent = {}
+
+    def find(self, a):
+        parent = self.parent
+        parent.setdefault(a, a)
+        root = a
+        while parent[root] != root:
+            root = parent[root]
+        while parent[a] != root:
+            parent[a], a = root, parent[a]
+        return root
+
+    def union(self, a, b) -> None:
+        ra, rb = self.find(a), self.find(b)
+        if ra != rb:
+            self.parent[ra] = rb
+
+
+def build_sheet(raw: bytes, file: str = "") -> SheetNets:
+    """Local connectivity of one sheet file (raises sedu_sexpr.SExprError)."""
+    root = sedu_sexpr.parse(raw, lazy_depth=1)
+    library = _lib_pins(root.find("lib_symbols"))
+
+    items = []           # (kind, payload) per connectable item
+    points = {}          # point key -> item ids anchored there
+    uf = _Union()
+
+    def add(kind, payload, *anchors):
+        item = len(items)
+        items.append((kind, payload))
+        uf.find(item)
+        for x, y in anchors:
+            points.setdefault(_key(x, y), []).append(item)
+        return item
+
+    wires = {}
+    for wire in root.nodes("wire"):
+        pts = wire.find("pts")
+        xy = [(float(p[1]), float(p[2])) for p in pts.nodes("xy")] if pts else []
+        for a, b in zip(xy, xy[1:]):
+            wires[add("wire", None, a, b)] = (a, b)
+    for junction in root.nodes("junction"):
+        add("junction", None, junction.floats("at")[:2])
+
+    by_name = {}
+    for kind in ("label", "global_label", "hierarchical_label"):
+        for label in root.nodes(kind):
+            at = label.floats("at")[:2]
+            if len(label) < 2 or len(at) < 2:
+                continue
+            item = add(kind, label[1], at)
+            if kind != "global_label":  # Global labels join later, across sheets
+                by_name.setdefault((kind, label[1]), []).append(item)
+
+    children = []
+    for sheet in root.nodes("sheet"):
+        index = len(children)
+        children.append(SheetRef(_property(sheet, "Sheetname", "Sheet name"),
+                                 _property(sheet, "Sheetfile", "Sheet file")))
+        for pin in sheet.nodes("pin"):
+            at = pin.floats("at")[:2]
+            if len(pin) > 1 and len(at) == 2:
+                add("sheet_pin", (index, pin[1]), at)
+
+    symbols = 0
+    for sym in root.nodes("symbol"):
+        lib_id = sym.value("lib_name") or sym.value("lib_id")
+        if lib_id not in library:
+            continue
+        symbols += 1
+        is_power, pins = library[lib_id]
+        sx, sy, angle = (sym.floats("at") + (0.0, 0.0, 0.0))[:3]
+        mirror = sym.value("mirror")
+        unit = int(sym.value("unit", "1"))
+        style = int(sym.value("convert") or sym.value("body_style") or "1")
+        ref = _property(sym, "Reference")
+        value = _property(sym, "Value")
+        for pin_unit, pin_style, px, py, number, name, hidden_power in pins:
+            if pin_unit not in (0, unit) or pin_style not in (0, style):
+                continue
+            # Library pins are y-up; rotate on screen, then mirror
+            x, y = sedu_sexpr.rotate(px, -py, angle)
+            if mirror == "x":
+                y = -y
+            elif mirror == "y":
+                x = -x
+            anchor = (sx + x, sy + y)
+            if is_power:
+                add("power", value, anchor)
+            elif hidden_power:
+                add("power", name, anchor)
+                add("pin", (ref, number, name), anchor)
+            else:
+                add("pin", (ref, number, name), anchor)
+
+    # Same point: connected
+    for ids in points.values():
+        for other in ids[1:]:
+            uf.union(ids[0], other)
+    # Point on a wire (T-junctions, labels placed on a wire): connected
+    if wires:
+        index = sedu_geometry.GridIndex(25.4)
+        for item, (a, b) in wires.items():
+            index.insert(item, (min(a[0], b[0]), min(a[1], b[1]), max(a[0], b[0]), max(a[1], b[1])))
+        for (kx, ky), ids in points.items():
+            x, y = kx / _SCALE, ky / _SCALE
+            for wire in index.query((x, y, x, y)):
+                if _on_segment(x, y, *wires[wire]):
+                    uf.union(ids[0], wire)
+    # Same local / hierarchical label name: connected
+    for ids in by_name.values():
+        for other in ids[1:]:
+            uf.union(ids[0], other)
+
+    members = {}
+    for item in range(len(items)):
+        members.setdefault(uf.find(item), []).append(item)
+    groups = []
+    for ids in members.values():
+        fields = {"label": set(), "global_label": set(), "power": set(),
+                  "hierarchical_label": set(), "pin": set(), "sheet_pin": set()}
+        for item in ids:
+            kind, payload = items[item]
+            if kind in fields:
+                fields[kind].add(payload)
+        if not any(fields.values()):
+            continue  # Bare wires and junctions
+        groups.append(Group(
+            labels=tuple(sorted(fields["label"])),
+            globals=tuple(sorted(fields["global_label"] | fields["power"])),
+            hier=tuple(sorted(fields["hierarchical_label"])),
+            pins=tuple(sorted(fields["pin"])),
+            sheet_pins=tuple(sorted(fields["sheet_pin"])),
+        ))
+    groups.sort()
+    return SheetNets(file, tuple(groups), tuple(children), symbols)
+
+
+def _on_segment(x: float, y: float, a: tuple, b: tuple) -> bool:
+    (x0, y0), (x1, y1) = a, b
+    tol = 1.0 / _SCALE
+    if not (min(x0, x1) - tol <= x <= max(x0, x1) + tol and min(y0, y1) - tol <= y <= max(y0, y1) + tol):
+        return False
+    length = ((x1 - x0) ** 2 + (y1 - y0) ** 2) ** 0.5
+    return length == 0 or abs((x1 - x0) * (y - y0) - (y1 - y0) * (x - x0)) / length <= tol
+
+
+def load_sheet(path) -> SheetNets:
+    """Per-sheet groups for path, from memo or .sedu_cache/ when unchanged.
+
+    Raises OSError if the file cannot be read, sedu_sexpr.SExprError if it
+    is malformed.
+    """
+    path = Path(path)
+    return sedu_db.load_cached(path, lambda raw: build_sheet(raw, path.name),
+                               "sheet_" + path.stem, SHEET_VERSION)
+
+
+def load_sheets(paths, jobs: int | None = None) -> dict:
+    """Sheet file name -> SheetNets; stale sheets parse in parallel when worthwhile."""
+    paths = sorted(Path(p) for p in paths)
+    total = sum(p.stat().st_size for p in paths)
+    if len(paths) > 1 and total >= PARALLEL_MIN_BYTES and jobs != 1:
+        try:
+            with ProcessPoolExecutor(max_workers=jobs or min(len(paths), os.cpu_count() or 1)) as pool:
+                return {p.name: sheet for p, sheet in zip(paths, pool.map(load_sheet, paths))}
+        except (OSError, RuntimeError) as e:
+            print(f"[netlist] WARNING: parallel parse unavailable ({e}), parsing serially")
+    return {p.name: load_sheet(p) for p in paths}
+
+
+class Netlist:
+    """Nets of the whole design, resolved across the sheet hierarchy."""
+
+    def __init__(self, sheets: dict, top: str = TOP_SHEET):
+        self.sheets = sheets
+        self.instances = []      # (sheet path, file name)
+        self.missing = []        # (parent file, child file) references to absent files
+        self.unreferenced = []   # sheet files no parent references (walked as extra roots)
+        self._walk(top)
+
+        uf = _Union()
+        first_global = {}
+        hier_by_instance = []
+        for inst, (_, file) in enumerate(self.instances):
+            hier = {}
+            for g, group in enumerate(self.sheets[file].groups):
+                node = (inst, g)
+                uf.find(node)
+                for name in group.globals:
+                    uf.union(node, first_global.setdefault(name, node))
+                for name in group.hier:
+                    hier[name] = node
+            hier_by_instance.append(hier)
+        for inst, child, ref_index in self._links:
+            groups = self.sheets[self.instances[inst][1]].groups
+            for g, group in enumerate(groups):
+                for index, pin_name in group.sheet_pins:
+                    if index == ref_index and pin_name in hier_by_instance[child]:
+                        uf.union((inst, g), hier_by_instance[child][pin_name])
+
+        merged = {}
+        for inst, (_, file) in enumerate(self.instances):
+            for g in range(len(self.sheets[file].groups)):
+                merged.setdefault(uf.find((inst, g)), []).append((inst, g))
+        self.nets = {}
+        for nodes in merged.values():
+            net = self._net(nodes)
+            if net.labels or net.pins:
+                self.nets[net.name] = net
+
+    def _walk(self, top: str) -> None:
+        self._links = []     # (parent instance, child instance, SheetRef index)
+        referenced = {Path(ref.file).name for sheet in self.sheets.values() for ref in sheet.children}
+        self.unreferenced = sorted(f for f in self.sheets if f != top and f not in referenced)
+        roots = ([top] if top in self.sheets else []) + self.unreferenced
+        for root_file in roots:
+            path = "/" if root_file == top else f"/{Path(root_file).stem}/"
+            stack = [(path, root_file, None, None, (root_file,))]
+            while stack:
+                path, file, parent, ref_index, chain = stack.pop()
+                inst = len(self.instances)
+                self.instances.append((path, file))
+                if parent is not None:
+                    self._links.append((parent, inst, ref_index))
+                children = self.sheets[file].children
+                for index in reversed(range(len(children))):
+                    ref = children[index]
+                    child_file = Path(ref.file).name
+                    if child_file not in self.sheets:
+                        self.missing.append((file, ref.file))
+                    elif child_file not in chain:  # KiCad rejects recursive sheets too
+                        stack.append((f"{path}{ref.name}/", child_file, inst, index, chain + (child_file,)))
+
+    def _net(self, nodes) -> Net:
+        globals_, locals_, hier, pins, paths = set(), [], set(), set(), set()
+        for inst, g in nodes:
+            path, file = self.instances[inst]
+            group = self.sheets[file].groups[g]
+            globals_.update(group.globals)
+            locals_.extend(path + name for name in group.labels)
+            hier.update(group.hier)
+            pins.update((ref, number) for ref, number, _ in group.pins)
+            paths.add(path)
+        labels = globals_ | hier | {n.rsplit("/", 1)[-1] for n in locals_}
+        if globals_:
+            name = min(globals_)
+        elif locals_:
+            name = min(locals_, key=lambda n: (n.count("/"), n))
+        elif hier:
+            name = min(paths, key=lambda p: (p.count("/"), p)) + min(hier)
+        elif pins:
+            ref, number = min(pins)
+            name = f"Net-({ref}-Pad{number})"
+        else:
+            name = ""
+        return Net(name, frozenset(labels), tuple(sorted(pins)), tuple(sorted(paths)))
+
+    def label_names(self) -> set:
+        """Every label / power name that names a net, without sheet paths."""
+        names = set()
+        for net in self.nets.values():
+            names |= net.labels
+        return names
+
+    @property
+    def symbol_count(self) -> int:
+        return sum(self.sheets[f].symbols for _, f in self.instances)
+
+
+def extract(directory: Path = HARDWARE, top: str = TOP_SHEET, jobs: int | None = None) -> Netlist:
+    """Netlist of every .kicad_sch in directory (raises OSError / SExprError)."""
+    return Netlist(load_sheets(Path(directory).glob("*.kicad_sch"), jobs), top)
+
+
+if __name__ == "__main__":
+    directory = Path(sys.argv[1]) if len(sys.argv) > 1 else HARDWARE
+    try:
+        t0 = time.perf_counter()
+        netlist = extract(directory)
+        elapsed = time.perf_counter() - t0
+    except (OSError, sedu_sexpr.SExprError) as e:
+        print(f"[FAIL] {e}")
+        sys.exit(1)
+
+    print(f"Schematic: {len(netlist.sheets)} sheet files, {len(netlist.instances)} sheet instances")
+    for path, file in netlist.instances:
+        sheet = netlist.sheets[file]
+        print(f"  {path:30s} {file:28s} {sheet.symbols:4d} symbols {len(sheet.groups):4d} groups")
+    if netlist.unreferenced:
+        print(f"  [!] Not referenced by {TOP_SHEET}: {', '.join(netlist.unreferenced)}")
+    for parent, child in netlist.missing:
+        print(f"  [FAIL] {parent} references missing sheet {child}")
+    print(f"Nets: {len(netlist.nets)}")
+    for name in sorted(netlist.nets)[:50]:
+        net = netlist.nets[name]
+        pins = " ".join(f"{r}.{n}" for r, n in net.pins[:8])
+        print(f"  {name:30s} {pins}{' ...' if len(net.pins) > 8 else ''}")
+    print(f"Extracted in {elapsed * 1000:.1f} ms")
+    sys.exit(1 if netlist.missing else 0)
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+SEDU Generated-File Writer - Shared by all generators
+
+write_if_changed() leaves an output untouched when its content would not
+change, so file mtimes (and the incremental checks that hash them) stay
+stable across regeneration runs.
+
+Generators that stamp a timestamp into their output pass a `volatile`
+regex; lines matching it are ignored when comparing old and new content.
+matches() is that comparison on its own (generate_all.py --check).
+
+Writes are atomic: content goes to a temp file in the output's directory
+and is renamed over the target, so a failing generator (or a concurrent
+reader) can never see a half-written BOM_Seed.csv or pins.h.
+"""
+from __future__ import annotations
+
+import os
+import re
+import tempfile
+from pathlib import Path
+
+
+def _strip_volatile(text: str, volatile: str | None) -> str:
+    if not volatile:
+        return text
+    pattern = re.compile(volatile)
+    return '\n'.join(line for line in text.split('\n') if not pattern.search(line))
+
+
+def matches(path: Path, content: str, volatile: str | None = None) -> bool:
+    """True if the file exists and holds content (volatile lines aside)."""
+    path = Path(path)
+    if not path.exists():
+        return False
+    existing = path.read_bytes()
+    if existing == content.encode('utf-8'):
+        return True
+    return bool(volatile) and _strip_volatile(existing.decode('utf-8', errors='replace'), volatile) \
+        == _strip_volatile(content, volatile)
+
+
+def write_if_changed(path: Path, content: str, volatile: str | None = None) -> bool:
+    """Write content (UTF-8, newlines as given) unless the file already matches.
+
+    Returns True if the file was written, False if it was left as is.
+    """
+    if matches(path, content, volatile):
+        return False
+    write_atomic(Path(path), content.encode('utf-8'))
+    return True
+
+
+def write_atomic(path: Path, data: bytes) -> None:
+    """Replace path with data via temp file + rename (same filesystem)."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    mode = path.stat().st_mode & 0o777 if path.exists() else 0o644
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        os.chmod(tmp, mode)  # mkstemp creates 0600; keep the target's permissions
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+"""
+SEDU Placement Solver - Feasibility of a component set on a board outline
+
+Packs rectangular blocks (component bodies, the ESP32 module grown by its
+antenna keep-out) onto a W x H board around fixed obstacles (mounting-hole
+keep-out squares), keeping a routing channel between blocks. Connectors
+marked edge=True must touch a board edge.
+
+Channel handling: every block is grown by channel/2 on each side, the board
+by channel/2 (bodies may touch the board edge) and obstacles shrunk by
+channel/2, so grown blocks merely must not overlap - exact for rectangles.
+
+Search: MaxRects (free maximal rectangles, best-short-side-fit, both
+orientations) places blocks greedily in a given order; a seeded local
+search swaps or moves blocks in the order and keeps changes that leave no
+more unplaced area, until everything fits or the iteration/time budget
+ends. The search is seeded, so results repeat run to run.
+
+Before searching, three sound bounds can prove infeasibility:
+    fit        a block fits in no free rectangle even on the empty board
+    area       grown block area exceeds the usable board area: the union
+               of the empty board's free rectangles that can hold at
+               least one block (strips too narrow for any block, e.g.
+               between a corner hole and the board edges, are dead)
+    perimeter  edge blocks need more board edge (short side + channel
+               each) than the grown board perimeter
+
+Results: "feasible" with concrete placements, "infeasible" with the proof,
+or "undecided" (no placement found, no bound violated). Undecided is
+expected when the blocks need more than about 95% of the usable area: the
+bounds are too weak to rule such packings out and the greedy search too
+weak to find one. The frozen 80x50 board is proven infeasible at the 3 mm
+channel (area bound) and undecided at 2.5 mm.
+
+Usage:
+    import sedu_placer
+    result = sedu_placer.solve(blocks, 80, 50, obstacles, channel=3.0)
+
+verify_board_fit.py builds the blocks from its component table; run it
+with --size WxH / --channel MM to explore other outlines.
+"""
+from __future__ import annotations
+
+import random
+import time
+from typing import NamedTuple
+
+EPSILON = 1e-9
+MAX_ITERATIONS = 1000
+TIME_LIMIT = 10.0       # s, safety net on top of MAX_ITERATIONS
+
+
+class Block(NamedTuple):
+    name: str
+    w: float
+    l: float
+    edge: bool = False   # must touch a board edge
+
+
+class Placement(NamedTuple):
+    name: str
+    x: float             # body lower-left corner, mm from the board corner
+    y: float
+    w: float             # as placed (after rotation)
+    l: float
+    rotated: bool
+
+
+class Result(NamedTuple):
+    status: str          # feasible, infeasible, undecided
+    placements: list     # Placement records (best attempt when not feasible)
+    unplaced: list       # block names
+    proof: str           # why infeasible, "" otherwise
+    iterations: int
+    elapsed: float       # s
+
+
+class MaxRects:
+    """Free space of a bin as maximal empty rectangles (x0, y0, x1, y1)."""
+
+    def __init__(self, x0: float, y0: float, x1: float, y1: float):
+        self.bin = (x0, y0, x1, y1)
+        self.free = [self.bin]
+
+    def occupy(self, rect) -> None:
+        """Remove rect from the free space."""
+        rx0, ry0, rx1, ry1 = rect
+        split = []
+        for f in self.free:
+            fx0, fy0, fx1, fy1 = f
+            if rx0 >= fx1 - EPSILON or rx1 <= fx0 + EPSILON or ry0 >= fy1 - EPSILON or ry1 <= fy0 + EPSILON:
+                split.append(f)
+                continue
+            if rx0 > fx0 + EPSILON:
+                split.append((fx0, fy0, rx0, fy1))
+            if rx1 < fx1 - EPSILON:
+                split.append((rx1, fy0, fx1, fy1))
+            if ry0 > fy0 + EPSILON:
+                split.append((fx0, fy0, fx1, ry0))
+            if ry1 < fy1 - EPSILON:
+                split.append((fx0, ry1, fx1, fy1))
+        self.free = _prune(split)
+
+    def candidates(self, w: float, h: float, edge: bool):
+        """(score, y, x) positions where a w x h rectangle fits (lower is better)."""
+        bx0, by0, bx1, by1 = self.bin
+        for fx0, fy0, fx1, fy1 in self.free:
+            fw, fh = fx1 - fx0, fy1 - fy0
+            if w > fw + EPSILON or h > fh + EPSILON:
+                continue
+            score = min(fw - w, fh - h)  # Best short side fit
+            for x, y in ((fx0, fy0), (fx1 - w, fy0), (fx0, fy1 - h), (fx1 - w, fy1 - h)):
+                if edge and not (abs(x - bx0) < EPSILON or abs(y - by0) < EPSILON
+                                 or abs(x + w - bx1) < EPSILON or abs(y + h - by1) < EPSILON):
+                    continue
+                yield (score, y, x)
+
+
+def _prune(rects: list) -> list:
+    """Drop rectangles contained in another."""
+    rects = sorted(set(rects), key=lambda r: (r[2] - r[0]) * (r[3] - r[1]), reverse=True)
+    kept = []
+    for r in rects:
+        if not any(k[0] <= r[0] + EPSILON and k[1] <= r[1] + EPSILON
+                   and k[2] >= r[2] - EPSILON and k[3] >= r[3] - EPSILON for k in kept):
+            kept.append(r)
+    return kept
+
+
+def _union_area(rects: list) -> float:
+    """Area covered by a set of rectangles (x0, y0, x1, y1)."""
+    xs = sorted({v for r in rects for v in (r[0], r[2])})
+    total = 0.0
+    for x0, x1 in zip(xs, xs[1:]):
+        covered, top = 0.0, None
+        for y0, y1 in sorted((r[1], r[3]) for r in rects if r[0] <= x0 and r[2] >= x1):
+            if top is None or y0 > top:
+                covered += y1 - y0
+                top = y1
+            elif y1 > top:
+                covered += y1 - top
+                top = y1
+        total += covered * (x1 - x0)
+    return total
+
+
+def _space(width: float, height: float, obstacles, half: float) -> MaxRects:
+    space = MaxRects(-half, -half, width + half, height + half)
+    for x0, y0, x1, y1 in obstacles:
+        if x1 - x0 > 2 * half and y1 - y0 > 2 * half:
+            space.occupy((x0 + half, y0 + half, x1 - half, y1 - half))
+    return space
+
+
+def _greedy(blocks: list, order: list, width: float, height: float, obstacles, half: float):
+    space = _space(width, height, obstacles, half)
+    placed, unplaced = [], []
+    for i in order:
+        b = blocks[i]
+        best = None
+        for rotated, (w, h) in ((False, (b.w, b.l)), (True, (b.l, b.w))):
+            for score, y, x in space.candidates(w + 2 * half, h + 2 * half, b.edge):
+                key = (score, y, x, rotated)
+                if best is None or key < best[0]:
+                    best = (key, w, h)
+            if b.w == b.l:
+                break
+        if best is None:
+            unplaced.append(i)
+            continue
+        (_, y, x, rotated), w, h = best
+        space.occupy((x, y, x + w + 2 * half, y + h + 2 * half))
+        placed.append(Placement(b.name, x + half, y + half, w, h, rotated))
+    return placed, unplaced
+
+
+def prove_infeasible(blocks: list, width: float, height: float, obstacles, channel: float) -> str:
+    """A violated necessary condition as text, or "" if none is found."""
+    half = channel / 2
+    empty = _space(width, height, obstacles, half)
+    for b in blocks:
+        if not any(True for w, h in ((b.w, b.l), (b.l, b.w))
+                   for _ in empty.candidates(w + channel, h + channel, b.edge)):
+            where = "along any board edge" if b.edge else "anywhere on the board"
+            return f"fit: {b.name} ({b.w:g}x{b.l:g} mm + {channel:g} mm channel) fits nowhere {where}"
+
+    # Every placement lies inside some free rectangle of the empty board it fits in
+    sizes = {(b.w + channel, b.l + channel) for b in blocks}
+    usable = [(fx0, fy0, fx1, fy1) for fx0, fy0, fx1, fy1 in empty.free
+              if any(min(w, h) <= min(fx1 - fx0, fy1 - fy0) + EPSILON
+                     and max(w, h) <= max(fx1 - fx0, fy1 - fy0) + EPSILON for w, h in sizes)]
+    available = _union_area(usable)
+    needed = sum((b.w + channel) * (b.l + channel) for b in blocks)
+    if needed > available + EPSILON:
+        return f"area: blocks with channels need {needed:.0f} mm^2, board has {available:.0f} mm^2 usable"
+
+    edge = [b for b in blocks if b.edge]
+    along = sum(min(b.w, b.l) + channel for b in edge)
+    perimeter = 2 * (width + height + 2 * channel)
+    if along > perimeter + EPSILON:
+        return (f"perimeter: {len(edge)} edge blocks need {along:.1f} mm of edge, "
+                f"board has {perimeter:.1f} mm")
+    return ""
+
+
+def solve(blocks: list, width: float, height: float, obstacles=(), channel: float = 0.0,
+          seed: int = 0, max_iterations: int = MAX_ITERATIONS, time_limit: float = TIME_LIMIT) -> Result:
+    """Place blocks on a width x height board; obstacles are (x0, y0, x1, y1) keep-outs."""
+    start = time.perf_counter()
+    proof = prove_infeasible(blocks, width, height, obstacles, channel)
+    if proof:
+        return Result("infeasible", [], [b.name for b in blocks], proof, 0, time.perf_counter() - start)
+
+    half = channel / 2
+    area = [(b.w + channel) * (b.l + channel) for b in blocks]
+    # Edge blocks first (they compete for the perimeter), then largest first
+    order = sorted(range(len(blocks)), key=lambda i: (not blocks[i].edge, -area[i]))
+
+    def cost(unplaced):
+        return sum(area[i] for i in unplaced)
+
+    placed, unplaced = _greedy(blocks, order, width, height, obstacles, half)
+    best = (cost(unplaced), placed, unplaced)
+    current = best[0]
+    rng = random.Random(seed)
+    iterations = 0
+    while best[2] and iterations < max_iterations and time.perf_counter() - start < time_limit:
+        iterations += 1
+        trial = order[:]
+        i, j = rng.randrange(len(trial)), rng.randrange(len(trial))
+        if rng.random() < 0.5:
+            trial[i], trial[j] = trial[j], trial[i]
+        else:
+            trial.insert(j, trial.pop(i))
+        placed, unplaced = _greedy(blocks, trial, width, height, obstacles, half)
+        c = cost(unplaced)
+        if c <= current:
+            order, current = trial, c
+            if c < best[0]:
+                best = (c, placed, unplaced)
+
+    _, placed, unplaced = best
+    status = "undecided" if unplaced else "feasible"
+    return Result(status, placed, [blocks[i].name for i in unplaced], "", iterations,
+                  time.perf_counter() - start)
+
+
+def render(result: Result, width: float, height: float, obstacles=(), cols: int = 80) -> list:
+    """ASCII map of a placement (top row = top edge) followed by a letter legend."""
+    scale = cols / width
+    rows = max(int(height * scale / 2), 1)  # Terminal cells are about twice as tall
+    grid = [["." for _ in range(cols)] for _ in range(rows)]
+
+    def fill(x0, y0, x1, y1, ch):
+        c0, c1 = int(x0 * scale), max(int(x1 * scale), int(x0 * scale) + 1)
+        r0, r1 = int(y0 * scale / 2), max(int(y1 * scale / 2), int(y0 * scale / 2) + 1)
+        for r in range(max(r0, 0), min(r1, rows)):
+            for c in range(max(c0, 0), min(c1, cols)):
+                grid[rows - 1 - r][c] = ch
+
+    for x0, y0, x1, y1 in obstacles:
+        fill(x0, y0, x1, y1, "#")
+    letters = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789"
+    legend = []
+    for k, p in enumerate(result.placements):
+        fill(p.x, p.y, p.x + p.w, p.y + p.l, letters[k % len(letters)])
+        legend.append(f"{letters[k % len(letters)]} = {p.name}")
+    return ["".join(row) for row in grid] + [""] + legend
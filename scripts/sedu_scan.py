@@ -0,0 +1,325 @@
+#!/usr/bin/env python3
+"""
+SEDU Repository Walker - Shared by all text-scanning checks
+
+One pass over the repository feeds every registered scanner:
+check_frozen_state_violations.py, check_policy_strings.py and
+check_docs_index.py. Each file is listed once and its text is read at most
+once, however many scanners look at it.
+
+Walker skip rules (apply to every scanner):
+- .git/, .sedu_cache/, __pycache__/ and .pytest_cache/ are never entered
+- Binary files have no text: known binary suffixes, or content sniffed as
+  binary (NUL byte or a magic number in the first 8 KiB)
+- Files over their type's size cap (SIZE_CAPS) are not scanned; each one
+  is reported as a warning after the scanners' reports
+- Files over MMAP_THRESHOLD are scanned through mmap with byte regexes,
+  so peak memory does not grow with the largest file in the repo
+
+Scanners are plain objects with two methods:
+    visit(repo_file)   called once per listed file, in sorted path order
+    report() -> int    prints results, returns the scanner's exit code
+and keep their own allowlists inside visit(). Scanners whose result for
+a file depends only on its content wrap the work in ResultCache.get(), so
+unchanged files are neither read nor rescanned on the next run.
+
+Usage:
+    python scripts/sedu_scan.py     # run all scanners in one pass
+
+Exit code: the highest exit code returned by any scanner.
+"""
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import mmap
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+import sedu_db
+
+ROOT = Path(__file__).resolve().parents[1]
+
+PRUNE_DIRS = {".git", ".sedu_cache", "__pycache__", ".pytest_cache"}
+BINARY_SUFFIXES = {
+    ".pdf", ".jpg", ".png", ".pyc", ".so", ".dll", ".exe",
+    ".zip", ".gz", ".7z",            # fabrication/release archives
+    ".step", ".stp", ".wrl",         # 3D models (text formats, but geometry only)
+}
+
+# Content sniffing: a NUL byte or a known signature in the first SNIFF_BYTES
+# marks a file binary whatever its suffix
+SNIFF_BYTES = 8192
+MAGIC_NUMBERS = (
+    b"%PDF-", b"\x89PNG", b"\xff\xd8\xff", b"GIF8",    # documents, images
+    b"PK\x03\x04", b"\x1f\x8b", b"7z\xbc\xaf", b"Rar!",  # archives
+    b"\x7fELF", b"\xca\xfe\xba\xbe",                   # executables
+    b"ISO-10303-21",                                    # STEP model
+)
+
+# Files above MMAP_THRESHOLD are scanned through mmap with byte regexes
+# instead of being decoded into memory
+MMAP_THRESHOLD = 4 * 1024 * 1024
+
+# Files above their type's cap are not scanned at all (reported instead)
+MiB = 1024 * 1024
+DEFAULT_SIZE_CAP = 32 * MiB
+SIZE_CAPS = {
+    ".kicad_pcb": 256 * MiB,
+    ".kicad_sch": 64 * MiB,
+    ".kicad_sym": 64 * MiB,
+    ".csv": 64 * MiB,
+    ".md": 16 * MiB,
+    ".txt": 16 * MiB,
+}
+
+
+class RepoFile:
+    """A listed file; content is read lazily and shared by all scanners.
+
+    Small files are read once into memory (data/text). Large files
+    (is_large) should be scanned via mapped(); their digest is computed
+    over the mapping so they are never copied into memory whole.
+    """
+
+    __slots__ = ("path", "rel", "_stat", "_head", "_data", "_text", "_digest", "_oversize")
+
+    def __init__(self, path: Path, rel: str):
+        self.path = path
+        self.rel = rel  # POSIX path relative to ROOT
+        self._stat = None
+        self._head = None
+        self._data = None
+        self._text = None
+        self._digest = None
+        self._oversize = None
+
+    @property
+    def stat(self) -> os.stat_result:
+        if self._stat is None:
+            self._stat = self.path.stat()
+        return self._stat
+
+    @property
+    def size(self) -> int:
+        try:
+            return self.stat.st_size
+        except OSError:
+            return 0
+
+    @property
+    def has_binary_suffix(self) -> bool:
+        """Cheap name-only test; scanners use it before allowlists."""
+        return self.path.suffix.lower() in BINARY_SUFFIXES
+
+    @property
+    def oversize(self) -> bool:
+        """True if the file exceeds its type's size cap (stat only, no read)."""
+        if self._oversize is None:
+            cap = SIZE_CAPS.get(self.path.suffix.lower(), DEFAULT_SIZE_CAP)
+            self._oversize = self.size > cap
+        return self._oversize
+
+    @property
+    def is_large(self) -> bool:
+        return self.size > MMAP_THRESHOLD
+
+    @property
+    def head(self) -> bytes:
+        """First SNIFF_BYTES of the file."""
+        if self._head is None:
+            if not self.is_large:
+                self._head = self.data[:SNIFF_BYTES]
+            else:
+                try:
+                    with open(self.path, "rb") as f:
+                        self._head = f.read(SNIFF_BYTES)
+                except OSError:
+                    self._head = b""
+        return self._head
+
+    @property
+    def is_binary(self) -> bool:
+        if self.has_binary_suffix:
+            return True
+        head = self.head
+        return b"\0" in head or head.startswith(MAGIC_NUMBERS)
+
+    @property
+    def data(self) -> bytes:
+        if self._data is None:
+            try:
+                self._data = self.path.read_bytes()
+            except OSError:
+                self._data = b""
+        return self._data
+
+    @property
+    def text(self) -> str | None:
+        """File content (UTF-8, undecodable bytes dropped, newlines as \\n); None for binaries."""
+        if self._text is None and not self.is_binary:
+            text = self.data.decode("utf-8", errors="ignore")
+            self._text = text.replace("\r\n", "\n").replace("\r", "\n")
+        return self._text
+
+    @contextlib.contextmanager
+    def mapped(self):
+        """Read-only mmap of the file (bytes for an empty file)."""
+        if self.size == 0:
+            yield b""
+            return
+        with open(self.path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield mm
+
+    @property
+    def digest(self) -> str:
+        if self._digest is None:
+            if self.is_large:
+                with self.mapped() as mm:
+                    self._digest = hashlib.sha256(mm).hexdigest()
+            else:
+                self._digest = hashlib.sha256(self.data).hexdigest()
+        return self._digest
+
+    def release(self) -> None:
+        self._head = None
+        self._data = None
+        self._text = None
+
+
+def list_files(root: Path = ROOT) -> list:
+    """Every file under root (pruned dirs excluded), sorted by relative path."""
+    files = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(d for d in dirnames if d not in PRUNE_DIRS)
+        base = Path(dirpath)
+        rel_base = base.relative_to(root).as_posix()
+        prefix = "" if rel_base == "." else rel_base + "/"
+        for name in sorted(filenames):
+            files.append(RepoFile(base / name, prefix + name))
+    return files
+
+
+def fingerprint(*rules) -> str:
+    """Stable hash of a scanner's rules (plus anything else that shapes results).
+
+    Scanners include source_digest(__file__) so edits to their matching
+    logic invalidate the cache as well.
+    """
+    canonical = json.dumps(rules, sort_keys=True, default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def source_digest(path) -> str:
+    return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+
+
+class ResultCache:
+    """
+    Per-file scan results keyed by content hash, stored in .sedu_cache/.
+
+    A file whose size and mtime are unchanged reuses its stored digest
+    without being read. The whole cache is discarded when the scanner's
+    ruleset fingerprint changes. Results must be JSON-serializable.
+    """
+
+    VERSION = 1
+
+    def __init__(self, name: str, ruleset: str):
+        self.path = sedu_db.CACHE_DIR / f"scan_{name}.json"
+        self.ruleset = ruleset
+        try:
+            stored = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            stored = {}
+        if stored.get("version") != self.VERSION or stored.get("ruleset") != ruleset:
+            stored = {"files": {}, "results": {}}
+        self.old_files = stored["files"]      # rel -> [size, mtime_ns, digest]
+        self.old_results = stored["results"]  # digest -> result
+        self.files = {}
+        self.results = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, repo_file: RepoFile, compute):
+        """Cached result for repo_file, calling compute(repo_file) on a miss."""
+        try:
+            st = repo_file.stat
+        except OSError:
+            return compute(repo_file)
+        known = self.old_files.get(repo_file.rel)
+        if known and known[0] == st.st_size and known[1] == st.st_mtime_ns:
+            digest = known[2]
+        else:
+            digest = repo_file.digest
+        self.files[repo_file.rel] = [st.st_size, st.st_mtime_ns, digest]
+
+        if digest in self.results:
+            self.hits += 1
+            return self.results[digest]
+        if digest in self.old_results:
+            self.hits += 1
+            result = self.old_results[digest]
+        else:
+            self.misses += 1
+            result = compute(repo_file)
+        self.results[digest] = result
+        return result
+
+    def save(self) -> None:
+        """Store this run's entries only, so deleted files drop out."""
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(".tmp")
+            tmp.write_text(json.dumps({
+                "version": self.VERSION,
+                "ruleset": self.ruleset,
+                "files": self.files,
+                "results": self.results,
+            }, sort_keys=True), encoding="utf-8")
+            os.replace(tmp, self.path)
+        except OSError as e:
+            print(f"[WARN] Could not write scan cache: {e}")
+
+
+def run_scanners(scanners, root: Path = ROOT) -> int:
+    """Walk the tree once, dispatch each file to every scanner, then report.
+
+    Returns the highest exit code of all scanners.
+    """
+    oversize = []
+    for repo_file in list_files(root):
+        for scanner in scanners:
+            scanner.visit(repo_file)
+        if repo_file._oversize:
+            oversize.append(repo_file)
+        repo_file.release()  # Keep peak memory at one file's text
+
+    rc = 0
+    for scanner in scanners:
+        rc = max(rc, scanner.report())
+
+    for repo_file in oversize:
+        print(f"[scan] WARNING: {repo_file.rel} not scanned "
+              f"({repo_file.size / MiB:.1f} MiB exceeds its size cap)")
+    return rc
+
+
+def default_scanners() -> list:
+    """One instance of each repository scanner, in report order."""
+    import check_frozen_state_violations
+    import check_policy_strings
+    import check_docs_index
+
+    return [
+        check_frozen_state_violations.FrozenStateScanner(),
+        check_policy_strings.PolicyScanner(),
+        check_docs_index.DocsIndexScanner(),
+    ]
+
+
+if __name__ == "__main__":
+    sys.exit(run_scanners(default_scanners()))
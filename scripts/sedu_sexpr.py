@@ -0,0 +1,460 @@
+#!/usr/bin/env python3
+"""
+SEDU S-Expression Parser - Shared reader for KiCad files
+
+Tokenizes .kicad_pcb, .kicad_sch and .kicad_sym (and .kicad_mod,
+fp-lib-table, ...) in place over the file's bytes (regex matching by
+offset, no per-node copies of the text) and builds a compact node tree:
+
+    Node    a list [head, child, ...]; children are str atoms or nodes
+    str     symbols, numbers and quoted strings (quotes removed,
+            escapes resolved) - convert numbers with float() as needed
+
+Lazy subtree skipping: with lazy_depth=N, every list nested N or more
+levels below the root is not tokenized; it is stored as a LazyNode (head
++ byte span). The root's children are split from KiCad's one-item-per-
+line layout, all spans verified by one C-level parenthesis check; other
+subtrees (and hand-formatted input) are skipped with one balanced-
+parenthesis regex match.
+It is parsed only when a query touches it. For a board that means one
+regex call per top-level item (segment, via, zone, footprint...), so
+checks that only need the outline never tokenize the copper.
+
+load() memoizes parsed files by (size, mtime), so in-process runners
+(run_all_verification.py --parallel, sedu_watch.py) keep trees warm.
+
+Usage:
+    import sedu_sexpr
+    board = sedu_sexpr.load(PCB)             # lazy below the top level
+    for fp in board.find_all("footprint"):
+        x, y = fp.floats("at")[:2]
+
+    python scripts/sedu_sexpr.py FILE...     # parse and print timing
+"""
+from __future__ import annotations
+
+import bisect
+import math
+import os
+import re
+import sys
+import time
+from pathlib import Path
+
+# One token per match: ( | ) | "string" | ;comment | atom
+_TOKEN = re.compile(rb"""
+    \s*
+    (?:
+        (\()                            # 1: open
+      | (\))                            # 2: close
+      | "((?:[^"\\]|\\.)*)"             # 3: quoted string (body)
+      | ;[^\n]*                         #    comment (KiCad ignores these)
+      | ([^\s()";]+)                    # 4: atom (symbol or number)
+    )
+""", re.VERBOSE | re.DOTALL)
+
+_HEAD = re.compile(rb'\(\s*(?:"((?:[^"\\]|\\.)*)"|([^\s()";]+))')
+
+_OPEN, _CLOSE, _STRING, _ATOM = 1, 2, 3, 4
+
+# Balanced-parenthesis matcher nested SKIP_DEPTH levels deep, used to skip a
+# lazy subtree in one C-level match. Deeper subtrees fall back to the tokenizer.
+SKIP_DEPTH = 12
+_STRING_RE = rb'"(?:[^"\\]|\\.)*"'
+_COMMENT_RE = rb';[^\n]*'
+
+
+def _balanced(depth: int) -> bytes:
+    group = rb'\((?:[^()";]|' + _STRING_RE + rb'|' + _COMMENT_RE + rb')*\)'
+    for _ in range(depth - 1):
+        group = rb'\((?:[^()";]|' + _STRING_RE + rb'|' + _COMMENT_RE + rb'|' + group + rb')*\)'
+    return group
+
+
+_SKIP = re.compile(_balanced(SKIP_DEPTH), re.DOTALL)
+
+_ESCAPE = re.compile(r'\\(.)', re.DOTALL)
+_ESCAPES = {"n": "\n", "t": "\t", "r": "\r"}
+
+
+class SExprError(ValueError):
+    """Malformed S-expression input."""
+
+
+def _unescape(raw: bytes) -> str:
+    text = raw.decode("utf-8", errors="replace")
+    if "\\" in text:
+        text = _ESCAPE.sub(lambda m: _ESCAPES.get(m.group(1), m.group(1)), text)
+    return text
+
+
+class Node(list):
+    """A parsed list: node[0] is the head atom, node[1:] the children."""
+
+    __slots__ = ()
+
+    @property
+    def head(self) -> str | None:
+        return self[0] if self and isinstance(self[0], str) else None
+
+    @property
+    def atoms(self) -> list:
+        """String children after the head (e.g. ["4", "4"] for (at 4 4))."""
+        return [c for c in self[1:] if isinstance(c, str)]
+
+    def nodes(self, head: str | None = None):
+        """Child nodes (optionally only those with the given head), parsing lazy ones."""
+        for i in range(1, len(self)):
+            child = self[i]
+            if isinstance(child, str):
+                continue
+            if head is not None and child.head != head:
+                continue  # LazyNode knows its head - no parse needed to filter
+            if isinstance(child, LazyNode):
+                child = self[i] = child.materialize()
+            yield child
+
+    def find_all(self, *heads: str) -> list:
+        if len(heads) == 1:
+            return list(self.nodes(heads[0]))
+        return [n for n in self.nodes() if n.head in heads]
+
+    def find(self, head: str):
+        """First child node with this head, or None."""
+        return next(self.nodes(head), None)
+
+    def value(self, head: str, default=None):
+        """First atom of the first child with this head: (layer "F.Cu") -> "F.Cu"."""
+        child = self.find(head)
+        if child is None or len(child) < 2 or not isinstance(child[1], str):
+            return default
+        return child[1]
+
+    def floats(self, head: str) -> tuple:
+        """Numeric atoms of a child node: (at 4 46 90) -> (4.0, 46.0, 90.0)."""
+        child = self.find(head)
+        if child is None:
+            return ()
+        values = []
+        for atom in child.atoms:
+            try:
+                values.append(float(atom))
+            except ValueError:
+                pass
+        return tuple(values)
+
+    def has_atom(self, atom: str) -> bool:
+        return atom in self.atoms
+
+    def walk(self, head: str | None = None):
+        """Depth-first iteration over all descendant nodes (parses lazy subtrees)."""
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            children = list(node.nodes())
+            for child in reversed(children):
+                if head is None or child.head == head:
+                    yield child
+                stack.append(child)
+
+
+class LazyNode:
+    """An unparsed subtree: its head and byte span in the shared source buffer."""
+
+    __slots__ = ("buf", "start", "end", "head")
+
+    def __init__(self, buf: bytes, start: int, end: int, head: str | None):
+        self.buf = buf
+        self.start = start
+        self.end = end
+        self.head = head
+
+    def materialize(self) -> Node:
+        return parse(self.buf, start=self.start, end=self.end)
+
+    def __repr__(self) -> str:
+        return f"<LazyNode {self.head!r} {self.end - self.start} bytes>"
+
+
+def _skip_subtree(buf: bytes, start: int, end: int) -> int:
+    """End offset of the list opening at buf[start]."""
+    m = _SKIP.match(buf, start, end)
+    if m:
+        return m.end()
+    # Nested deeper than SKIP_DEPTH: count parentheses token by token
+    depth, pos, match = 0, start, _TOKEN.match
+    while True:
+        m = match(buf, pos, end)
+        if m is None:
+            raise SExprError(f"unbalanced '(' at byte {start}")
+        pos = m.end()
+        if m.lastindex == _OPEN:
+            depth += 1
+        elif m.lastindex == _CLOSE:
+            depth -= 1
+            if depth == 0:
+                return pos
+
+
+_NOT_PARENS = bytes(b for b in range(256) if b not in b"()")
+_NOT_PARENS_QUOTES = bytes(b for b in range(256) if b not in b'()"')
+# Span boundary marks for _all_single_lists (control bytes KiCad never writes)
+_OPEN_MARK, _CLOSE_MARK = 1, 2
+_NOT_MARKS = bytes(b for b in range(256) if b not in b'()"\x01\x02')
+_QUOTED = re.compile(_STRING_RE + rb'|' + _COMMENT_RE)
+
+
+def _is_single_list(span: bytes) -> bool:
+    """True if span is exactly one balanced list, e.g. "(a (b) c)" but not "(a) (b)".
+
+    Keeps only the parentheses and peels innermost "()" pairs, all in C:
+    the inside must vanish completely (nesting depth = number of passes).
+
+    Parentheses inside strings do not count. Reduced to parentheses and
+    quotes, a string without parentheses is '""'; when dropping those
+    pairs leaves no quote, every string was such a pair. Otherwise (or
+    with escapes and comments) the strings are removed by regex, and a
+    quote left unclosed means the span ends inside a string.
+    """
+    parens = span.translate(None, _NOT_PARENS_QUOTES)
+    if b'"' in parens:
+        parens = parens.replace(b'""', b"")
+    if b'"' in parens or b"\\" in span or b";" in span:
+        stripped = _QUOTED.sub(b"", span)
+        if b'"' in stripped:
+            return False
+        parens = stripped.translate(None, _NOT_PARENS)
+    if parens[:1] != b"(" or parens[-1:] != b")":
+        return False
+    inner = parens[1:-1]
+    while inner:
+        peeled = inner.replace(b"()", b"")
+        if len(peeled) == len(inner):
+            return False
+        inner = peeled
+    return True
+
+
+def _all_single_lists(buf: bytes, items: list) -> bool:
+    """True if every LazyNode span in items is a single list - _is_single_list
+    for all of them in one pass over the region they cover.
+
+    Each span's outer parentheses become a mark pair that only matches
+    itself, so peeling "()" and mark pairs empties the region exactly when
+    every span is one balanced list. The few spans with escapes, comments
+    or stray mark bytes are checked alone and blanked out of the pass;
+    quotes that are not '""' pairs return False and the caller checks span
+    by span.
+    """
+    first, last = items[0].start, items[-1].end
+    region = bytearray(memoryview(buf)[first:last])
+    starts = None
+    for special in (b"\\", b";", b"\x01", b"\x02"):
+        at = region.find(special)
+        while at != -1:
+            if starts is None:
+                starts = [item.start for item in items]
+            span = items[bisect.bisect_right(starts, first + at) - 1]
+            start, stop = span.start, span.end
+            if not _is_single_list(buf[start:stop]):
+                return False
+            region[start - first:stop - first] = bytes(stop - start)
+            at = region.find(special, stop - first)
+    for item in items:
+        region[item.start - first] = _OPEN_MARK
+        region[item.end - 1 - first] = _CLOSE_MARK
+    marks = region.translate(None, _NOT_MARKS)
+    if b'"' in marks:
+        marks = marks.replace(b'""', b"")
+        if b'"' in marks:
+            return False
+    while marks:
+        peeled = marks.replace(b"()", b"").replace(b"\x01\x02", b"")
+        if len(peeled) == len(marks):
+            return False
+        marks = peeled
+    return True
+
+
+# Per indent: a line starting with at most N blanks, then "(head" or ")"
+_LINE_ITEM: dict = {}
+
+
+def _split_top_level(buf: bytes, first: int, end: int, head: str | None):
+    """Spans of consecutive root children laid out one per line, as KiCad writes them.
+
+    Starting at the item opening at buf[first] (which must begin its line),
+    a child ends where the next line starting at the same or a smaller
+    indent begins - including that line's ")" when it closes at the
+    child's own indent. Every span must be exactly one balanced list
+    (outside strings, so a line break inside a quoted string cannot end a
+    child) and the gaps between spans must be blank; at the first surprise
+    the split stops and the caller parses on from the returned offset.
+    The spans are verified together (_all_single_lists) and only checked
+    one by one when that fails.
+
+    Returns (items, resume) with items as LazyNode.
+    """
+    line_start = buf.rfind(b"\n", 0, first) + 1
+    indent = first - line_start
+    if buf[line_start:first].strip():
+        return [], first
+    pattern = _LINE_ITEM.get(indent)
+    if pattern is None:
+        pattern = _LINE_ITEM[indent] = re.compile(rb'\n([ \t]{0,%d})(?:(\()([^\s()";]*)|\))' % indent)
+
+    items = []
+    heads: dict = {}  # Head bytes -> str, decoded once per kind
+    current, resume = first, first
+    for m in pattern.finditer(buf, first, end):
+        lead, item = m.span(1)  # Indent, then the "(" or ")" at buf[item]
+        own_indent = item - lead == indent
+        opens = buf[item] == 0x28
+        line = lead - 1
+        if current is None:  # Previous child closed on its own ")" line
+            if not (opens and own_indent) or buf[resume:line].strip():
+                break
+            name = m.group(3)
+            if not name:
+                break  # Quoted or missing head - let the tokenizer read it
+            current = item
+            head = heads.get(name) or heads.setdefault(name, name.decode("utf-8"))
+            continue
+        if own_indent and not opens:
+            stop = item + 1
+            tail = buf.find(b"\n", stop, end)
+            if buf[stop:tail if tail != -1 else end].strip():
+                break
+        else:
+            stop = buf.rfind(b")", current, line) + 1
+            if not stop or (stop != line and buf[stop:line].strip()):
+                break
+        items.append(LazyNode(buf, current, stop, head))
+        resume = stop
+        if own_indent and opens:
+            name = m.group(3)
+            if not name:
+                break
+            current = item
+            head = heads.get(name) or heads.setdefault(name, name.decode("utf-8"))
+        elif own_indent:
+            current = None
+        else:
+            break  # Parent closes (or dedented content): the main loop takes over
+    if items and not _all_single_lists(buf, items):
+        for k, node in enumerate(items):
+            if not _is_single_list(buf[node.start:node.end]):
+                return items[:k], items[k - 1].end if k else first
+    return items, resume
+
+
+def parse(data, lazy_depth: int | None = None, start: int = 0, end: int | None = None) -> Node:
+    """Parse the first S-expression in data[start:end].
+
+    data: bytes (used in place) or any buffer - bytearray, mmap,
+    memoryview - which is copied to bytes once. LazyNode spans are offsets
+    into that one buffer, so deferring and materializing never copy text.
+
+    lazy_depth: lists nested at least this deep below the root (1 = the
+    root's children) are kept as LazyNode and parsed on first access
+    (None = parse everything).
+    """
+    buf = data if isinstance(data, bytes) else bytes(data)
+    if end is None:
+        end = len(buf)
+    match = _TOKEN.match
+    stack: list = []
+    pos = start
+    while True:
+        m = match(buf, pos, end)
+        if m is None:
+            if stack:
+                raise SExprError(f"unexpected input or end of file at byte {pos}")
+            raise SExprError("no S-expression found")
+        pos = m.end()
+        kind = m.lastindex
+        if kind == _OPEN:
+            if lazy_depth is not None and len(stack) >= lazy_depth > 0:
+                item = m.start(1)
+                h = _HEAD.match(buf, item, end)
+                head = None
+                if h:
+                    head = _unescape(h.group(1)) if h.lastindex == 1 else h.group(2).decode("utf-8")
+                if len(stack) == 1:
+                    items, pos = _split_top_level(buf, item, end, head)
+                    if items:
+                        stack[-1].extend(items)
+                        continue
+                pos = _skip_subtree(buf, item, end)
+                stack[-1].append(LazyNode(buf, item, pos, head))
+                continue
+            node = Node()
+            if stack:
+                stack[-1].append(node)
+            stack.append(node)
+        elif kind == _CLOSE:
+            if not stack:
+                raise SExprError(f"unbalanced ')' at byte {m.start(2)}")
+            node = stack.pop()
+            if not stack:
+                return node
+        elif kind == _ATOM:
+            if not stack:
+                raise SExprError(f"atom outside of a list at byte {m.start(4)}")
+            stack[-1].append(m.group(4).decode("utf-8", errors="replace"))
+        elif kind == _STRING:
+            if not stack:
+                raise SExprError(f"string outside of a list at byte {m.start(3)}")
+            stack[-1].append(_unescape(m.group(3)))
+        # else: comment
+
+
+# Parsed files: resolved path -> (size, mtime_ns, lazy_depth, tree)
+_memo: dict = {}
+
+
+def load(path, lazy_depth: int | None = 1) -> Node:
+    """Parse a KiCad file, reusing the in-process tree while the file is unchanged.
+
+    The default lazy_depth=1 keeps each of the root's children as a
+    LazyNode; queries parse only the items they touch.
+
+    Raises OSError if the file cannot be read, SExprError if it is malformed.
+    """
+    path = Path(path).resolve()
+    st = path.stat()
+    cached = _memo.get(path)
+    if cached and cached[:3] == (st.st_size, st.st_mtime_ns, lazy_depth):
+        return cached[3]
+    tree = parse(path.read_bytes(), lazy_depth)
+    _memo[path] = (st.st_size, st.st_mtime_ns, lazy_depth, tree)
+    return tree
+
+
+def clear_memo() -> None:
+    _memo.clear()
+
+
+def rotate(x: float, y: float, angle_deg: float) -> tuple:
+    """Rotate a point about the origin the way KiCad applies (at x y angle)."""
+    if not angle_deg:
+        return x, y
+    a = math.radians(-angle_deg)  # KiCad angles are clockwise in board coordinates
+    return x * math.cos(a) - y * math.sin(a), x * math.sin(a) + y * math.cos(a)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Usage: python scripts/sedu_sexpr.py FILE...")
+        sys.exit(1)
+    for name in sys.argv[1:]:
+        size = os.path.getsize(name)
+        t0 = time.perf_counter()
+        lazy = load(name)
+        t1 = time.perf_counter()
+        full = parse(Path(name).read_bytes())
+        t2 = time.perf_counter()
+        print(f"{name}: {size / 1e6:.2f} MB, root ({lazy.head}) with {len(lazy) - 1} children")
+        print(f"  lazy parse: {(t1 - t0) * 1000:8.1f} ms")
+        print(f"  full parse: {(t2 - t1) * 1000:8.1f} ms ({sum(1 for _ in full.walk())} nodes)")
+    sys.exit(0)
@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+SEDU Thermal Vias - Via census under exposed pads and via-array Rth
+
+For each placed exposed-pad power part (PARTS) this finds the exposed pad
+on the board model (sedu_fplib.exposed_pads), collects the vias whose
+centre lies inside the pad outline through a sedu_geometry.GridIndex over
+all vias, and computes:
+
+    via Rth     barrel conduction L / (k * pi * (r_o^2 - r_i^2)) per via,
+                plated PLATING thick, L = board thickness; the array is
+                the vias in parallel (unfilled vias - fill is ignored)
+    Rth(j-a)    Rth_bare || (Rth_vias + Rth_plane): heat leaves the pad
+                through the top copper (Rth_bare, the no-via figure) or
+                down the vias into the planes. Rth_plane is calibrated so
+                the documented reference array (REF_VIAS x REF_DRILL on
+                REF_THICKNESS) reproduces the documented Rth(j-a).
+
+The reference figures are those in THERMAL_VIA_VERIFICATION_SUMMARY.txt
+(LMR33630 60/40 C/W, DRV8873 60/30 C/W without/with 8 vias). Parts with
+no documented figures (DRV8353RS) get the census and via Rth only.
+
+thermal_analysis.py and thermal_verification_detailed.py take Rth(j-a)
+from junction_rth(), which falls back to the documented constant while
+the part has no vias on the board.
+
+Usage:
+    import sedu_thermal
+    rth, source = sedu_thermal.junction_rth("LMR33630", 40)
+
+    python scripts/sedu_thermal.py [PCB]     # census table
+"""
+from __future__ import annotations
+
+import math
+import sys
+from pathlib import Path
+from typing import NamedTuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+import sedu_board
+import sedu_fplib
+import sedu_geometry
+import sedu_sexpr
+
+K_COPPER = 0.385      # W/(mm*K)
+PLATING = 0.025       # mm barrel plating (IPC class 2 average)
+
+# Documented reference array: 8x vias, 0.3 mm drill, 1.6 mm board
+REF_VIAS = 8
+REF_DRILL = 0.3
+REF_THICKNESS = 1.6
+
+
+class ThermalPart(NamedTuple):
+    name: str               # matched against footprint value / lib_id
+    min_vias: int           # required vias under the exposed pad
+    rth_bare: float | None  # documented Rth(j-a) without vias, C/W
+    rth_ref: float | None   # documented Rth(j-a) with the reference array, C/W
+
+
+PARTS = (
+    ThermalPart("LMR33630", 8, 60.0, 40.0),
+    ThermalPart("DRV8873", 8, 60.0, 30.0),
+    ThermalPart("DRV8353", 9, None, None),   # hardware/README.md: 3x3 minimum
+)
+
+
+class ViaCensus(NamedTuple):
+    ref: str
+    part: ThermalPart
+    pad: object             # sedu_board.Pad (exposed pad)
+    vias: tuple             # sedu_board.Via records inside the pad
+    foreign: tuple          # vias inside the pad on another net
+    rth_vias: float | None  # via array Rth, C/W (None without vias)
+    rth_ja: float | None    # modelled Rth(j-a), C/W (None if uncalibrated)
+
+
+def via_rth(drill: float, length: float) -> float:
+    """Conduction Rth (C/W) of one plated via barrel."""
+    r_o = drill / 2
+    r_i = max(r_o - PLATING, 0.0)
+    return length / (K_COPPER * math.pi * (r_o * r_o - r_i * r_i))
+
+
+def array_rth(drills, length: float) -> float | None:
+    """Rth (C/W) of vias in parallel; None for an empty array."""
+    conductance = sum(1 / via_rth(d, length) for d in drills if d > 0)
+    return 1 / conductance if conductance else None
+
+
+def _parallel(a: float, b: float) -> float:
+    return a * b / (a + b)
+
+
+def _parallel_inverse(total: float, a: float) -> float:
+    """b such that a || b == total."""
+    return 1 / (1 / total - 1 / a)
+
+
+def model_rth_ja(part: ThermalPart, rth_vias: float | None) -> float | None:
+    """Rth(j-a) with the given via array, or None if the part is uncalibrated."""
+    if part.rth_bare is None or part.rth_ref is None:
+        return None
+    if rth_vias is None:
+        return part.rth_bare
+    ref_vias = array_rth([REF_DRILL] * REF_VIAS, REF_THICKNESS)
+    rth_plane = _parallel_inverse(part.rth_ref, part.rth_bare) - ref_vias
+    return _parallel(part.rth_bare, rth_vias + max(rth_plane, 0.0))
+
+
+def _part(fp) -> ThermalPart | None:
+    for part in PARTS:
+        if part.name in fp.value or part.name in fp.lib_id:
+            return part
+    return None
+
+
+def _inside(pad, x: float, y: float) -> bool:
+    lx, ly = sedu_sexpr.rotate(x - pad.x, y - pad.y, -pad.angle)
+    return abs(lx) <= pad.size[0] / 2 and abs(ly) <= pad.size[1] / 2
+
+
+def census(board) -> list:
+    """ViaCensus for the exposed pad(s) of every placed PARTS footprint."""
+    vias = list({id(v): v for vs in board.vias_by_layer.values() for v in vs}.values())
+    index = sedu_geometry.GridIndex(1.0)  # About the via pitch under a pad
+    for i, v in enumerate(vias):
+        index.insert(i, (v.x, v.y, v.x, v.y))
+
+    results = []
+    for fp in board.all_footprints():
+        part = _part(fp)
+        if part is None:
+            continue
+        smd = [(p.number, p.x, p.y, p.size[0], p.size[1], p)
+               for p in fp.pads
+               if p.kind == "smd" and p.number and len(p.size) >= 2
+               and any(layer.endswith(".Cu") for layer in p.layers)]
+        for *_, pad in sedu_fplib.exposed_pads(smd):
+            corners = sedu_geometry.to_board(pad, (-pad.size[0] / 2, -pad.size[1] / 2,
+                                                   pad.size[0] / 2, pad.size[1] / 2))
+            inside = [vias[i] for i in sorted(index.query(sedu_geometry.bounds(corners)))
+                      if _inside(pad, vias[i].x, vias[i].y)]
+            foreign = tuple(v for v in inside if v.net and pad.net and v.net != pad.net)
+            rth_vias = array_rth([v.drill for v in inside], board.thickness)
+            results.append(ViaCensus(fp.ref or fp.lib_id, part, pad, tuple(inside), foreign,
+                                     rth_vias, model_rth_ja(part, rth_vias)))
+    return results
+
+
+def junction_rth(name: str, documented: float, path: Path = sedu_board.PCB) -> tuple:
+    """(Rth(j-a), source) for a PARTS name.
+
+    Uses the board's via array when the part is placed with vias under its
+    exposed pad, else the documented constant.
+    """
+    try:
+        board = sedu_board.load_board(path)
+    except (OSError, sedu_sexpr.SExprError):
+        return documented, "documented; board unreadable"
+    for entry in census(board):
+        if entry.part.name == name and entry.vias and entry.rth_ja is not None:
+            return entry.rth_ja, f"{entry.ref}: {len(entry.vias)} vias on board"
+    return documented, "documented; no via array on board yet"
+
+
+def print_report(results: list) -> int:
+    """Print the census; return 1 if a part is under-via'd or has foreign-net vias."""
+    rc = 0
+    placed = {r.part.name for r in results}
+    for part in PARTS:
+        if part.name not in placed:
+            print(f"  [--]   {part.name}: not placed on board yet")
+    for r in results:
+        drills = sorted({v.drill for v in r.vias})
+        sizes = ", ".join(f"{d:g}" for d in drills) or "-"
+        rth_vias = f"{r.rth_vias:.1f} C/W" if r.rth_vias is not None else "-"
+        rth_ja = f"{r.rth_ja:.1f} C/W" if r.rth_ja is not None else "n/a"
+        ok = len(r.vias) >= r.part.min_vias and not r.foreign
+        if not ok:
+            rc = 1
+        print(f"  {'[OK]  ' if ok else '[FAIL]'} {r.ref} {r.part.name} pad {r.pad.number} "
+              f"({r.pad.size[0]:g}x{r.pad.size[1]:g} mm): {len(r.vias)}/{r.part.min_vias} vias, drill {sizes} mm, "
+              f"array {rth_vias}, Rth(j-a) {rth_ja}")
+        for v in r.foreign:
+            print(f"         via at ({v.x:g},{v.y:g}) on {v.net}, pad is {r.pad.net}")
+    return rc
+
+
+if __name__ == "__main__":
+    path = Path(sys.argv[1]) if len(sys.argv) > 1 else sedu_board.PCB
+    try:
+        board = sedu_board.load_board(path)
+    except (OSError, sedu_sexpr.SExprError) as e:
+        print(f"[FAIL] {path}: {e}")
+        sys.exit(1)
+    print(f"Thermal via census: {path.name} ({board.thickness:g} mm board)")
+    sys.exit(print_report(census(board)))
@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+SEDU Tolerance Engine - Monte Carlo and worst-case spread of design equations
+
+A Param is a value with its limits: a component with a tolerance
+(tolerance "1%" in design_database.yaml) or an IC threshold with datasheet
+min/typ/max (thresholds in the ics section). A design equation is a plain
+function of named params, e.g.
+
+    def ilim(RS_IN, V_ILIM):
+        return V_ILIM / RS_IN
+
+analyse() evaluates it two ways:
+
+    Monte Carlo  every param drawn from a normal distribution centred on
+                 its nominal with the limits at 3 sigma, clipped to the
+                 limits; SAMPLES builds evaluated at once (NumPy arrays).
+                 Params shared by several equations (RS_IN in ILIM and the
+                 circuit breaker) come from the same draw per build.
+    Worst case   the equation at every min/max corner of its params -
+                 exact for equations monotonic in each param, which the
+                 divider and threshold equations here are.
+
+and reports the distribution, the worst-case range and the yield (share
+of builds inside the Spec window).
+
+Without NumPy the same draws run in pure Python with SAMPLES_PURE builds.
+
+Usage:
+    import sedu_tolerance as tol
+    params = {"RS_IN": tol.Param.relative("RS_IN", 3e-3, "1%")}
+    builds = tol.sample(params)
+    stat = tol.analyse("ILIM", "A", ilim, params, builds, tol.Spec(None, 30.0))
+"""
+from __future__ import annotations
+
+import inspect
+import itertools
+import math
+import random
+from typing import NamedTuple
+
+try:
+    import numpy as np
+except ImportError:  # Optional: pure-Python path below
+    np = None
+
+SAMPLES = 1_000_000
+SAMPLES_PURE = 20_000
+SEED = 0
+SIGMAS = 3.0                # limits sit at +/- SIGMAS standard deviations
+TAIL = 0.135                # % in each tail of the reported range (3 sigma)
+
+
+class Param(NamedTuple):
+    name: str
+    nominal: float
+    low: float
+    high: float
+    source: str             # where the spread comes from
+
+    @classmethod
+    def relative(cls, name: str, nominal: float, tolerance, source: str = "") -> "Param":
+        """Param with a symmetric tolerance ("1%", 0.01)."""
+        spread = abs(nominal) * parse_tolerance(tolerance)
+        return cls(name, nominal, nominal - spread, nominal + spread,
+                   source or f"{tolerance}")
+
+    @classmethod
+    def limits(cls, name: str, values, source: str = "") -> "Param":
+        """Param from datasheet [min, typ, max]."""
+        low, typ, high = (float(v) for v in values)
+        return cls(name, typ, low, high, source or "datasheet min/max")
+
+
+class Spec(NamedTuple):
+    low: float | None
+    high: float | None
+    source: str = ""
+
+    def contains(self, value) -> bool:
+        return ((self.low is None or value >= self.low)
+                and (self.high is None or value <= self.high))
+
+
+class Stat(NamedTuple):
+    name: str
+    unit: str
+    nominal: float
+    mean: float
+    std: float
+    p_low: float            # TAIL percentile
+    p_high: float           # 100 - TAIL percentile
+    wc_low: float           # worst-case corners
+    wc_high: float
+    spec: Spec
+    yield_pct: float        # % of builds inside spec
+    samples: int
+
+
+def parse_tolerance(tolerance) -> float:
+    """Fraction from "1%", "0.5 %" or a number (0.01)."""
+    if isinstance(tolerance, str):
+        text = tolerance.strip()
+        if text.endswith("%"):
+            return float(text[:-1]) / 100
+        return float(text)
+    return float(tolerance)
+
+
+def backend() -> str:
+    return "NumPy" if np is not None else "pure Python"
+
+
+def sample(params: dict, n: int | None = None, seed: int = SEED) -> dict:
+    """name -> n draws (NumPy array, or list without NumPy)."""
+    if n is None:
+        n = SAMPLES if np is not None else SAMPLES_PURE
+    if np is not None:
+        rng = np.random.default_rng(seed)
+        builds = {}
+        for name, p in params.items():
+            sigma = max(p.nominal - p.low, p.high - p.nominal) / SIGMAS
+            builds[name] = np.clip(rng.normal(p.nominal, sigma, n), p.low, p.high)
+        return builds
+
+    rng = random.Random(seed)
+    builds = {}
+    for name, p in params.items():
+        sigma = max(p.nominal - p.low, p.high - p.nominal) / SIGMAS
+        builds[name] = [min(max(rng.gauss(p.nominal, sigma), p.low), p.high) for _ in range(n)]
+    return builds
+
+
+def _arguments(func) -> list:
+    return list(inspect.signature(func).parameters)
+
+
+def evaluate(func, builds: dict):
+    """func over every build (array in, array out with NumPy)."""
+    names = _arguments(func)
+    if np is not None:
+        return func(**{name: builds[name] for name in names})
+    columns = [builds[name] for name in names]
+    return [func(*row) for row in zip(*columns)]
+
+
+def worst_case(func, params: dict) -> tuple:
+    """(min, max) of func over the min/max corners of its params."""
+    names = _arguments(func)
+    values = [func(**dict(zip(names, corner)))
+              for corner in itertools.product(*((params[n].low, params[n].high) for n in names))]
+    return min(values), max(values)
+
+
+def _percentile(ordered: list, pct: float) -> float:
+    k = (len(ordered) - 1) * pct / 100
+    lo, hi = math.floor(k), math.ceil(k)
+    return ordered[lo] + (ordered[hi] - ordered[lo]) * (k - lo)
+
+
+def analyse(name: str, unit: str, func, params: dict, builds: dict, spec: Spec) -> Stat:
+    """Distribution, worst case and yield of one design equation."""
+    nominal = func(**{n: params[n].nominal for n in _arguments(func)})
+    wc_low, wc_high = worst_case(func, params)
+    values = evaluate(func, builds)
+    if np is not None:
+        inside = np.ones(values.shape, bool)
+        if spec.low is not None:
+            inside &= values >= spec.low
+        if spec.high is not None:
+            inside &= values <= spec.high
+        p_low, p_high = np.percentile(values, [TAIL, 100 - TAIL])
+        return Stat(name, unit, nominal, float(values.mean()), float(values.std()),
+                    float(p_low), float(p_high), wc_low, wc_high, spec,
+                    100.0 * float(inside.mean()), int(values.size))
+
+    n = len(values)
+    mean = sum(values) / n
+    std = math.sqrt(sum((v - mean) ** 2 for v in values) / n)
+    ordered = sorted(values)
+    inside = sum(1 for v in values if spec.contains(v))
+    return Stat(name, unit, nominal, mean, std, _percentile(ordered, TAIL),
+                _percentile(ordered, 100 - TAIL), wc_low, wc_high, spec, 100.0 * inside / n, n)
+
+
+def format_spec(spec: Spec) -> str:
+    if spec.low is not None and spec.high is not None:
+        return f"{spec.low:.4g} .. {spec.high:.4g}"
+    if spec.low is not None:
+        return f">= {spec.low:.4g}"
+    if spec.high is not None:
+        return f"<= {spec.high:.4g}"
+    return "-"
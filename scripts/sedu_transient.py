@@ -0,0 +1,372 @@
+#!/usr/bin/env python3
+"""
+SEDU Transient Thermal - RC network simulation of timeout-protected parts
+
+Steady-state Tj = Tamb + P * Rth(j-a) overstates short bursts: the
+check_power_budget THERMAL_LIMITS entry accepts the DRV8873 at 217 C
+because of ACTUATOR_TIMEOUT_MS, and thermal_analysis.py calls the 20 A
+phase-MOSFET peak "OK (<1s)". This module simulates Tj(t) instead.
+
+Networks (thermal impedance Zth(t) of a part on the board):
+    Foster   parallel RC stages, Zth(t) = sum R_i (1 - exp(-t/tau_i)) -
+             the form datasheets publish Zth curves in. Updated exactly
+             for power held constant over a step.
+    Cauer    RC ladder from junction to ambient (physical nodes),
+             backward-Euler with the step matrix inverted once.
+
+simulate() advances any number of scenarios at once: power(k) returns one
+value per scenario for step k (NumPy arrays, or lists without NumPy), so
+thousands of duty-cycle profiles run in one batch. It returns per-scenario
+peak Tj, the first time Tj exceeds a limit and, on request, decimated Tj
+traces.
+
+Part networks (PARTS) are representative package + board estimates, not
+measured curves: the last stage (board to ambient) is scaled so the total
+matches the Rth(j-a) the steady-state scripts use (sedu_thermal.junction_rth
+for the DRV8873, so a routed via array carries through). Ambient, the
+DRV8873 on-resistance, current and documented Rth(j-a) are calculation
+graph nodes (sedu_calc.py).
+
+Usage:
+    python scripts/sedu_transient.py            # timeout verdicts
+    python scripts/sedu_transient.py --trace    # plus Tj traces (1 s steps)
+"""
+from __future__ import annotations
+
+import argparse
+import math
+import sys
+import time
+from pathlib import Path
+from typing import NamedTuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+import sedu_calc
+import sedu_db
+import sedu_thermal
+import thermal_analysis
+from check_power_budget import THERMAL_LIMITS
+
+try:
+    import numpy as np
+except ImportError:  # Optional: pure-Python path below
+    np = None
+
+_design = sedu_calc.load()
+
+TAMB = _design["TAMB"]                      # °C, worst case
+DT = 0.05                                   # s (Foster stages are exact for any step)
+DT_PURE = 0.1                               # s, coarser step without NumPy
+DRV8873_RDS_TOTAL = _design["DRV_RDS_ON"]   # Ω, 2x internal FETs in series
+DRV8873_CURRENT = _design["I_ACTUATOR"]     # A, ILIM setting
+DRV8873_RTH_JA = _design["DRV_RTH_JA"]      # °C/W, documented (without a routed via array)
+
+
+class Foster(NamedTuple):
+    r: tuple                # °C/W per stage
+    tau: tuple              # s per stage
+
+    @property
+    def rth(self) -> float:
+        return sum(self.r)
+
+
+class Cauer(NamedTuple):
+    r: tuple                # °C/W, node k to node k+1 (last: to ambient)
+    c: tuple                # J/°C at node k (node 0 = junction)
+
+    @property
+    def rth(self) -> float:
+        return sum(self.r)
+
+
+class Part(NamedTuple):
+    name: str
+    network: Foster
+    tj_max: float
+    loss: object            # callable: current (A) -> W
+    note: str
+
+
+def scaled(network: Foster, rth: float) -> Foster:
+    """Network with the last (board to ambient) stage set so the total is rth."""
+    rest = sum(network.r[:-1])
+    if rth <= rest:
+        raise ValueError(f"Rth(j-a) {rth:g} C/W below the package stages ({rest:g} C/W)")
+    return Foster(network.r[:-1] + (rth - rest,), network.tau)
+
+
+def _drv8873_loss(current):
+    return sedu_calc.drv_loss(current, DRV8873_RDS_TOTAL)
+
+
+def _fet_loss(current):
+    # Switching loss doubled above the average current, as in thermal_analysis.py
+    sw = thermal_analysis.fet_switching_loss(thermal_analysis.VIN, thermal_analysis.FET_FSW)
+    factor = thermal_analysis.PEAK_SW_FACTOR
+    if np is not None:
+        return thermal_analysis.fet_conduction_loss(current) + sw * np.where(
+            np.asarray(current) > thermal_analysis.I_PHASE_AVG, factor, 1)
+    return thermal_analysis.fet_conduction_loss(current) + sw * (
+        factor if current > thermal_analysis.I_PHASE_AVG else 1)
+
+
+def parts() -> dict:
+    """Name -> Part, Rth(j-a) from the steady-state scripts."""
+    drv_rth, drv_source = sedu_thermal.junction_rth("DRV8873", DRV8873_RTH_JA)
+    return {
+        # HTSSOP-28 PowerPAD: die/pad, pad-to-board spreading, board to ambient
+        "DRV8873": Part("DRV8873", scaled(Foster((1.5, 8.5, 20.0), (0.01, 1.0, 60.0)), drv_rth),
+                        THERMAL_LIMITS["DRV8873"]["max_junction_temp"], _drv8873_loss,
+                        f"Rth(j-a) {drv_rth:.0f} C/W, {drv_source}"),
+        # SuperSO8: junction-case (~0.9 C/W), case-to-board, board to ambient
+        "BSC016N06NS": Part("BSC016N06NS",
+                            scaled(Foster((0.1, 0.3, 0.5, 20.0, 129.1), (1e-4, 1e-3, 1e-2, 1.0, 30.0)),
+                                   thermal_analysis.FET_RTH_JA),
+                            thermal_analysis.FET_TJ_MAX, _fet_loss,
+                            f"Rth(j-a) {thermal_analysis.FET_RTH_JA} C/W, thermal_analysis.py"),
+    }
+
+
+def _invert(m: list) -> list:
+    """Gauss-Jordan inverse of a small dense matrix."""
+    n = len(m)
+    a = [row[:] + [1.0 if i == j else 0.0 for j in range(n)] for i, row in enumerate(m)]
+    for col in range(n):
+        pivot = max(range(col, n), key=lambda r: abs(a[r][col]))
+        a[col], a[pivot] = a[pivot], a[col]
+        p = a[col][col]
+        a[col] = [v / p for v in a[col]]
+        for r in range(n):
+            if r != col and a[r][col]:
+                f = a[r][col]
+                a[r] = [v - f * w for v, w in zip(a[r], a[col])]
+    return [row[n:] for row in a]
+
+
+def _cauer_step(network: Cauer, dt: float) -> list:
+    """Inverse of the backward-Euler step matrix (C/dt + G)."""
+    n = len(network.r)
+    g = [[0.0] * n for _ in range(n)]
+    for k, r in enumerate(network.r):
+        g[k][k] += 1 / r + network.c[k] / dt
+        if k + 1 < n:
+            g[k][k + 1] -= 1 / r
+            g[k + 1][k] -= 1 / r
+            g[k + 1][k + 1] += 1 / r
+    return _invert(g)
+
+
+class Simulation(NamedTuple):
+    peak: list              # max Tj per scenario
+    crossing: list          # first time (s) Tj > limit per scenario, inf if never
+    traces: list            # [(t, Tj per scenario)] every record_every steps
+    steps: int
+    elapsed: float          # s
+
+
+def simulate(network, power, scenarios: int, steps: int, dt: float = DT, tamb: float = TAMB,
+             initial: float = 0.0, limit: float = math.inf, record_every: int = 0) -> Simulation:
+    """Tj(t) for `scenarios` power profiles; power(k) -> W per scenario at step k.
+
+    initial is the power the part ran at before t = 0 (steady state).
+    """
+    start = time.perf_counter()
+    foster = isinstance(network, Foster)
+    n = len(network.r)
+    if foster:
+        decay = [math.exp(-dt / tau) for tau in network.tau]
+        gain = [r * (1 - a) for r, a in zip(network.r, decay)]
+        state0 = [initial * r for r in network.r]
+    else:
+        inverse = _cauer_step(network, dt)
+        c_dt = [c / dt for c in network.c]
+        state0 = [initial * sum(network.r[k:]) for k in range(n)]
+
+    traces = []
+    if np is not None:
+        state = np.tile(np.asarray(state0, float)[:, None], (1, scenarios))  # (stages, scenarios)
+        peak = np.full(scenarios, -math.inf)
+        crossing = np.full(scenarios, math.inf)
+        if foster:
+            decay_v, gain_v = np.asarray(decay)[:, None], np.asarray(gain)[:, None]
+        else:
+            inverse_v, c_dt_v = np.asarray(inverse), np.asarray(c_dt)[:, None]
+        for k in range(steps):
+            p = np.asarray(power(k), float)
+            if foster:
+                state *= decay_v
+                state += gain_v * p
+                tj = tamb + state.sum(axis=0)
+            else:
+                rhs = state * c_dt_v
+                rhs[0] += p
+                state = inverse_v @ rhs
+                tj = tamb + state[0]
+            np.maximum(peak, tj, out=peak)
+            if peak.max() > limit:
+                hit = (tj > limit) & np.isinf(crossing)
+                crossing[hit] = (k + 1) * dt
+            if record_every and (k + 1) % record_every == 0:
+                traces.append(((k + 1) * dt, tj.tolist()))
+        return Simulation(peak.tolist(), crossing.tolist(), traces, steps, time.perf_counter() - start)
+
+    states = [state0[:] for _ in range(scenarios)]
+    peak = [-math.inf] * scenarios
+    crossing = [math.inf] * scenarios
+    for k in range(steps):
+        p = power(k)
+        p = p if isinstance(p, (list, tuple)) else [p] * scenarios
+        tjs = []
+        for s, state in enumerate(states):
+            if foster:
+                state = [x * a + p[s] * g for x, a, g in zip(state, decay, gain)]
+                tj = tamb + sum(state)
+            else:
+                rhs = [x * c for x, c in zip(state, c_dt)]
+                rhs[0] += p[s]
+                state = [sum(m * v for m, v in zip(row, rhs)) for row in inverse]
+                tj = tamb + state[0]
+            states[s] = state
+            tjs.append(tj)
+            if tj > peak[s]:
+                peak[s] = tj
+            if tj > limit and crossing[s] == math.inf:
+                crossing[s] = (k + 1) * dt
+        if record_every and (k + 1) % record_every == 0:
+            traces.append(((k + 1) * dt, tjs))
+    return Simulation(peak, crossing, traces, steps, time.perf_counter() - start)
+
+
+def pulse_train(loss, current_on, on_s, off_s, dt: float = DT, current_off=0.0, cycles=None):
+    """power(k) for repeated on/off current pulses; arguments may be per-scenario lists."""
+    if np is not None:
+        on, off = np.asarray(on_s, float), np.asarray(off_s, float)
+        p_on = loss(np.asarray(current_on, float))
+        p_off = loss(np.asarray(current_off, float))
+        horizon = (on + off) * cycles if cycles is not None else np.inf
+
+        def power(k):
+            t = k * dt
+            active = (np.mod(t, on + off) < on) & (t < horizon)
+            return np.where(active, p_on, p_off)
+        return power
+
+    lists = [v for v in (on_s, off_s, current_on, current_off) if isinstance(v, (list, tuple))]
+    n = len(lists[0]) if lists else 1
+
+    def column(v):
+        return list(v) if isinstance(v, (list, tuple)) else [v] * n
+    on, off = column(on_s), column(off_s)
+    p_on = [loss(i) for i in column(current_on)]
+    p_off = [loss(i) for i in column(current_off)]
+
+    def power(k):
+        t = k * dt
+        return [p_on[s] if (t % (on[s] + off[s]) < on[s]
+                            and (cycles is None or t < (on[s] + off[s]) * cycles)) else p_off[s]
+                for s in range(n)]
+    return power
+
+
+def profile(loss, segments, dt: float = DT):
+    """power(k) for one arbitrary profile [(duration_s, current_A), ...]; last segment holds."""
+    edges, powers, t = [], [], 0.0
+    for duration, current in segments:
+        t += duration
+        edges.append(t)
+        powers.append(loss(current))
+
+    def power(k):
+        t = k * dt
+        for edge, p in zip(edges, powers):
+            if t < edge:
+                return p
+        return powers[-1]
+    return power
+
+
+def _format_time(seconds: float) -> str:
+    return "never" if math.isinf(seconds) else f"{seconds:.2f} s"
+
+
+def _trace(sim: Simulation) -> None:
+    for t, tj in sim.traces:
+        print(f"      t = {t:6.1f} s   Tj = {tj[0]:6.1f} C")
+
+
+def report(trace: bool = False) -> int:
+    db = sedu_db.load_database()
+    timeout_s = db.get("firmware_constants", {}).get("ACTUATOR_TIMEOUT_MS", 10000) / 1000
+    dt = DT if np is not None else DT_PURE
+    record = int(round(1.0 / dt)) if trace else 0
+    catalog = parts()
+    rc = 0
+
+    print(f"[transient] Foster RC simulation, Tamb {TAMB:g} C, dt {dt * 1000:g} ms "
+          f"({'NumPy' if np is not None else 'pure Python'})")
+
+    # DRV8873: firmware timeout
+    drv = catalog["DRV8873"]
+    p_on = drv.loss(DRV8873_CURRENT)
+    print(f"[transient] DRV8873 @ {DRV8873_CURRENT:g} A ({p_on:.2f} W), {drv.note}, Tj max {drv.tj_max:g} C")
+    print(f"            steady state would be {TAMB + p_on * drv.network.rth:.1f} C")
+    single = simulate(drv.network, pulse_train(drv.loss, DRV8873_CURRENT, timeout_s, 1e9, dt, cycles=1),
+                      1, int(round(3 * timeout_s / dt)), dt, limit=drv.tj_max, record_every=record)
+    ok = single.peak[0] <= drv.tj_max
+    rc |= 0 if ok else 1
+    print(f"  [{'OK' if ok else 'FAIL'}] single {timeout_s:g} s run (ACTUATOR_TIMEOUT_MS): "
+          f"peak Tj {single.peak[0]:.1f} C")
+    if trace:
+        _trace(single)
+    longest = simulate(drv.network, lambda k: p_on, 1, int(round(600 / dt)), dt, limit=drv.tj_max)
+    print(f"         longest continuous run under {drv.tj_max:g} C: {_format_time(longest.crossing[0])}")
+
+    # Repeated timeout-length runs: minimum rest between runs, batched over on/off grid
+    shown = [2, 4, 6, 8, 10, 12, 15, 20]
+    if np is not None:
+        on_times, off_times = list(range(1, 21)), [o / 2 for o in range(0, 601, 5)]
+    else:
+        on_times, off_times = shown, list(range(0, 301, 20))
+    grid = [(on, off) for on in on_times for off in off_times]
+    horizon = int(round(900 / dt))
+    batch = simulate(drv.network,
+                     pulse_train(drv.loss, DRV8873_CURRENT, [g[0] for g in grid], [g[1] for g in grid], dt),
+                     len(grid), horizon, dt, limit=drv.tj_max)
+    print(f"         repeated runs, {len(grid)} on/off scenarios x {horizon * dt:g} s "
+          f"in {batch.elapsed:.1f} s - minimum rest between runs:")
+    rest_at_timeout = None
+    for on in shown:
+        safe = [off for (o, off), peak in zip(grid, batch.peak) if o == on and peak <= drv.tj_max]
+        rest = min(safe) if safe else None
+        if on == timeout_s:
+            rest_at_timeout = rest
+        print(f"           {on:4g} s on: " + (f">= {rest:g} s off" if rest is not None
+                                              else f"> {max(off_times):g} s off"))
+    if rest_at_timeout is None or rest_at_timeout > 0:
+        need = f">= {rest_at_timeout:g} s" if rest_at_timeout is not None else f"> {max(off_times):g} s"
+        print(f"  [WARN] back-to-back {timeout_s:g} s runs need {need} rest; "
+              f"firmware_constants has no actuator cool-down")
+
+    # Phase MOSFETs: 20 A burst from 12 A steady state
+    fet = catalog["BSC016N06NS"]
+    i_avg, i_peak = thermal_analysis.I_PHASE_AVG, thermal_analysis.I_PHASE_PEAK
+    print(f"[transient] BSC016N06NS @ {i_peak:g} A burst from {i_avg:g} A, {fet.note}, Tj max {fet.tj_max:g} C")
+    burst = simulate(fet.network, profile(fet.loss, [(1.0, i_peak), (1e9, i_avg)], dt), 1, int(round(10 / dt)), dt,
+                     initial=fet.loss(i_avg), limit=fet.tj_max, record_every=record)
+    ok = burst.peak[0] <= fet.tj_max
+    rc |= 0 if ok else 1
+    print(f"  [{'OK' if ok else 'FAIL'}] 1 s burst (thermal_analysis.py '<1s'): peak Tj {burst.peak[0]:.1f} C")
+    if trace:
+        _trace(burst)
+    held = simulate(fet.network, lambda k: fet.loss(i_peak), 1, int(round(600 / dt)), dt,
+                    initial=fet.loss(i_avg), limit=fet.tj_max)
+    print(f"         {i_peak:g} A held: Tj {held.peak[0]:.1f} C after {held.steps * dt:g} s, "
+          f"limit crossed {_format_time(held.crossing[0])}")
+    return rc
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--trace", action="store_true", help="print Tj traces of the headline runs")
+    sys.exit(report(parser.parse_args().trace))
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+SEDU Units - One parser for the value strings in design_database.yaml
+
+Accepted forms (whitespace between parts allowed, sign optional):
+
+    3.0m  43.2k  1M       number + SI prefix, unit implied by the caller
+    47nF  10uH  10µH  5W  number + prefix + unit (F H W V A Hz s)
+    2.5mOhm  600Ω  22R    ohms written as Ohm/ohm/Ω or a trailing R
+    4R7  4k7  2u2         prefix (or R) in place of the decimal point
+    600R@100MHz           condition after '@' is ignored
+    60  6.3               plain numbers (YAML ints/floats too)
+
+Anything else (part numbers such as "SMBJ33A", "JST-GH 8-pos") is not a
+quantity and parses to None.
+
+parse(text, unit) returns a Quantity; unit is the quantity expected when
+the text carries none (the database writes resistors as bare "3.0m",
+"140k"), and Quantity.implied records that it was filled in. Results are
+memoized per string.
+
+component_values() parses the components' value field into a column
+{ref: Quantity | None}; sedu_db builds it once per loaded database.
+
+Usage:
+    import sedu_units
+    sedu_units.parse("4R7")            # Quantity(4.7, 'Ω', False)
+    sedu_units.parse("3.0m", "Ω")      # Quantity(0.003, 'Ω', True)
+    sedu_units.parse("5W", "W").value  # 5.0
+"""
+from __future__ import annotations
+
+import math
+import re
+from functools import lru_cache
+from typing import NamedTuple
+
+# Decimal exponents: float("47e-9") is exact where 47 * 1e-9 is not
+PREFIXES = {"p": -12, "n": -9, "u": -6, "µ": -6, "μ": -6, "m": -3,
+            "": 0, "k": 3, "K": 3, "M": 6, "G": 9}
+UNITS = {"Ω": "Ω", "ohm": "Ω", "ohms": "Ω", "Ohm": "Ω", "Ohms": "Ω", "R": "Ω",
+         "F": "F", "H": "H", "W": "W", "V": "V", "A": "A", "Hz": "Hz", "s": "s"}
+OHM = "Ω"
+
+_PREFIX = "[pnuµμmkKMG]"
+_UNIT = "|".join(sorted((re.escape(u) for u in UNITS), key=len, reverse=True))
+_PLAIN = re.compile(rf"([-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)\s*({_PREFIX}?)\s*({_UNIT})?")
+_INFIX = re.compile(rf"([-+]?\d+)({_PREFIX}|R)(\d+)\s*({_UNIT})?")   # 4R7, 4k7, 2u2F
+
+
+class Quantity(NamedTuple):
+    value: float
+    unit: str           # "" when neither the text nor the caller gave one
+    implied: bool       # unit came from the caller, not the text
+
+
+def _scaled(number: str, prefix: str) -> float:
+    exponent = PREFIXES[prefix]
+    if "e" in number.lower():
+        return float(number) * 10.0**exponent
+    return float(f"{number}e{exponent}")
+
+
+@lru_cache(maxsize=None)
+def _parse(text: str):
+    """(value, unit or None) from a value string, or None."""
+    text = text.split("@", 1)[0].strip()
+    match = _PLAIN.fullmatch(text)
+    if match:
+        number, prefix, unit = match.groups()
+        return _scaled(number, prefix), UNITS.get(unit)
+    match = _INFIX.fullmatch(text)
+    if match:
+        whole, mark, fraction, unit = match.groups()
+        if mark == "R":
+            if unit not in (None, "R") and UNITS[unit] != OHM:
+                return None
+            return float(f"{whole}.{fraction}"), OHM
+        return _scaled(f"{whole}.{fraction}", mark), UNITS.get(unit)
+    return None
+
+
+def parse(text, unit: str = "") -> Quantity | None:
+    """Quantity from a database value; unit applies when the text has none."""
+    if text is None or isinstance(text, bool):
+        return None
+    if isinstance(text, (int, float)):
+        return Quantity(float(text), unit, bool(unit))
+    parsed = _parse(str(text))
+    if parsed is None:
+        return None
+    value, found = parsed
+    if found is None:
+        return Quantity(value, unit, bool(unit))
+    return Quantity(value, found, False)
+
+
+def value(text, unit: str = "") -> float | None:
+    """Number only, None if text is not a quantity."""
+    q = parse(text, unit)
+    return None if q is None else q.value
+
+
+def same(a: Quantity | None, b: Quantity | None, rel: float = 1e-9) -> bool:
+    """Equal quantities ("1.00k" == "1k" == "1000R"); units must match when both are known."""
+    if a is None or b is None:
+        return False
+    if a.unit and b.unit and a.unit != b.unit:
+        return False
+    return math.isclose(a.value, b.value, rel_tol=rel, abs_tol=0.0)
+
+
+def label(text, q: Quantity | None) -> str:
+    """The database text with an implied unit written out: "3.0m" -> "3.0mΩ"."""
+    return f"{text}{q.unit}" if q is not None and q.implied and q.unit else str(text)
+
+
+def component_values(components: dict) -> dict:
+    """{ref: Quantity | None} for each component's value (bare values are ohms)."""
+    return {ref: parse(data.get("value"), OHM) for ref, data in components.items()}
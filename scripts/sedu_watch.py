@@ -0,0 +1,309 @@
+#!/usr/bin/env python3
+"""
+SEDU Watch Daemon - Incremental regeneration and verification on save
+
+Watches the design sources and, on every save, reruns only the generators
+and checks whose inputs changed. Everything runs in this one process, so
+the parsed design database (sedu_db memo) and the imported check modules
+stay warm between edits instead of paying interpreter start-up and YAML
+parsing for every script.
+
+Watched:
+    design_database.yaml
+    hardware/*.csv, hardware/*.kicad_*
+    firmware/src/*, firmware/include/* (top level only, inotify is not recursive)
+    scripts/*.py (a changed check or generator is reloaded and rerun)
+
+verify_power_calcs.py runs without its Monte Carlo tolerance section
+(WATCH_ARGS); its yield warnings never fail the check, and a full
+run_all_verification.py or verify_power_calcs.py run still prints them.
+
+Change detection uses Linux inotify (via ctypes, no extra packages) and
+falls back to stat polling on other platforms or with --poll.
+
+Staleness decisions reuse generate_all.py / run_all_verification.py
+manifests, so the watcher, `generate_all.py` and `run_all_verification.py`
+all agree on what is up to date.
+
+Usage:
+    python scripts/sedu_watch.py            # watch until Ctrl-C
+    python scripts/sedu_watch.py --once     # one incremental pass, then exit
+    python scripts/sedu_watch.py --poll --interval 0.5
+
+Exit codes (--once): 0 = all passed, 1 = a generator or check failed
+"""
+from __future__ import annotations
+
+import argparse
+import ctypes
+import ctypes.util
+import fnmatch
+import importlib
+import os
+import select
+import struct
+import sys
+import time
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_DIR))
+
+try:
+    import sedu_db
+    import generate_all
+    import run_all_verification as verification
+except ImportError as e:
+    print(f"[ERROR] Failed to import SEDU scripts: {e}")
+    print("Ensure scripts/ directory contains generate_all.py and run_all_verification.py")
+    sys.exit(1)
+
+ROOT = SCRIPTS_DIR.parent
+
+# Directories watched (relative to ROOT) and the files inside them that matter
+WATCH_DIRS = [".", "hardware", "firmware/src", "firmware/include", "scripts", "docs"]
+WATCH_PATTERNS = [
+    "design_database.yaml",
+    "hardware/*.csv",
+    "hardware/*.kicad_*",
+    "firmware/src/*",
+    "firmware/include/*",
+    "scripts/*.py",
+    "docs/*.md",
+]
+
+# Entry point arguments for checks run on every save
+WATCH_ARGS = {
+    "verify_power_calcs.py": {"tolerance": False},
+}
+
+# Editors save in bursts (temp file, rename, chmod) - wait this long for quiet
+DEBOUNCE = 0.05
+
+
+def is_watched(rel_path: str) -> bool:
+    if Path(rel_path).name.startswith("."):
+        return False  # Editor swap files and atomic-write temp files
+    return any(fnmatch.fnmatch(rel_path, pattern) for pattern in WATCH_PATTERNS)
+
+
+class InotifyWatcher:
+    """Linux inotify on the watched directories (non-recursive)."""
+
+    IN_MODIFY = 0x00000002
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    IN_NONBLOCK = 0o4000
+    IN_CLOEXEC = 0o2000000
+    MASK = IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE | IN_DELETE
+    EVENT_HEADER = struct.Struct("iIII")
+
+    def __init__(self, directories):
+        libc_name = ctypes.util.find_library("c")
+        if not sys.platform.startswith("linux") or not libc_name:
+            raise OSError("inotify not available")
+        libc = ctypes.CDLL(libc_name, use_errno=True)
+        self.fd = libc.inotify_init1(self.IN_NONBLOCK | self.IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.dirs = {}
+        for directory in directories:
+            path = ROOT / directory
+            if not path.is_dir():
+                continue
+            wd = libc.inotify_add_watch(self.fd, os.fsencode(path), self.MASK)
+            if wd < 0:
+                os.close(self.fd)
+                raise OSError(ctypes.get_errno(), f"inotify_add_watch failed for {path}")
+            self.dirs[wd] = path
+
+    def _read_events(self, changed: set) -> None:
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return
+        offset = 0
+        while offset < len(data):
+            wd, _, _, length = self.EVENT_HEADER.unpack_from(data, offset)
+            offset += self.EVENT_HEADER.size
+            name = data[offset:offset + length].rstrip(b"\0")
+            offset += length
+            if wd in self.dirs and name:
+                path = self.dirs[wd] / os.fsdecode(name)
+                rel = path.relative_to(ROOT).as_posix()
+                if is_watched(rel):
+                    changed.add(rel)
+
+    def wait(self) -> set:
+        """Block until watched files change; return their relative paths."""
+        changed = set()
+        while not changed:
+            select.select([self.fd], [], [])
+            self._read_events(changed)
+        # Collect the rest of the save burst
+        while select.select([self.fd], [], [], DEBOUNCE)[0]:
+            self._read_events(changed)
+        return changed
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+class PollingWatcher:
+    """Portable fallback: compare (size, mtime) snapshots every interval."""
+
+    def __init__(self, directories, interval: float = 0.25):
+        self.directories = directories
+        self.interval = interval
+        self.state = self._snapshot()
+
+    def _snapshot(self) -> dict:
+        state = {}
+        for directory in self.directories:
+            path = ROOT / directory
+            if not path.is_dir():
+                continue
+            for entry in os.scandir(path):
+                if not entry.is_file():
+                    continue
+                rel = Path(entry.path).relative_to(ROOT).as_posix()
+                if is_watched(rel):
+                    st = entry.stat()
+                    state[rel] = (st.st_size, st.st_mtime_ns)
+        return state
+
+    def wait(self) -> set:
+        while True:
+            time.sleep(self.interval)
+            current = self._snapshot()
+            changed = {p for p in current.keys() | self.state.keys()
+                       if current.get(p) != self.state.get(p)}
+            self.state = current
+            if changed:
+                return changed
+
+    def close(self) -> None:
+        pass
+
+
+class WarmSession:
+    """Holds the parsed database, imported modules and both manifests."""
+
+    def __init__(self):
+        self.gen_manifest = generate_all.load_manifest()
+        self.check_manifest = verification.load_manifest()
+
+    def reload_scripts(self, changed: set) -> None:
+        """Re-import changed generator/check modules so edits take effect."""
+        reloaded = False
+        for rel in sorted(changed):
+            if not rel.startswith("scripts/") or not rel.endswith(".py"):
+                continue
+            module = sys.modules.get(Path(rel).stem)
+            if module is not None and module.__name__ != "__main__":
+                try:
+                    importlib.reload(module)
+                    reloaded = True
+                except Exception as e:
+                    print(f"  [FAIL] reload {rel}: {e}")
+        if reloaded:
+            # GENERATORS holds function references - rebind them
+            importlib.reload(generate_all)
+
+    def run_generators(self, db) -> bool:
+        up_to_date = generate_all.plan_generators(db, self.gen_manifest)
+        stale = [g for g in generate_all.GENERATORS if g[0] not in up_to_date]
+        if not stale:
+            return True
+        results = generate_all.run_pipeline(db, stale, len(stale))
+        ok_all = True
+        for name, module, _, _ in stale:
+            ok, message = results[name]
+            generate_all.record_output(db, self.gen_manifest, module, ok)
+            print(f"  [{'OK' if ok else 'FAIL'}] {name}: {message}")
+            ok_all &= ok
+        generate_all.save_manifest(self.gen_manifest)
+        return ok_all
+
+    def run_checks(self) -> bool:
+        input_hashes, unchanged = verification.plan_checks(self.check_manifest)
+        ok_all = True
+        for name in verification.VERIFICATION_SCRIPTS:
+            if name in unchanged or not (SCRIPTS_DIR / name).exists():
+                continue
+            _, rc, output, elapsed = verification.run_in_process(name, WATCH_ARGS.get(name))
+            verification.record_result(self.check_manifest, name, rc,
+                                       input_hashes[name], elapsed)
+            if rc == 0:
+                print(f"  [OK]   {name:30s} {elapsed * 1000:8.1f} ms")
+            else:
+                ok_all = False
+                print(f"  [FAIL] {name:30s} {elapsed * 1000:8.1f} ms")
+                for line in output.rstrip().splitlines():
+                    print(f"         {line}")
+        verification.save_manifest(self.check_manifest)
+        return ok_all
+
+    def update(self, changed: set | None = None) -> bool:
+        start = time.perf_counter()
+        if changed:
+            print(f"Changed: {', '.join(sorted(changed))}")
+            self.reload_scripts(changed)
+        try:
+            db = sedu_db.load_database()
+        except Exception as e:
+            print(f"  [FAIL] design_database.yaml: {e}")
+            return False
+        ok = self.run_generators(db)
+        ok = self.run_checks() and ok
+        status = "[PASS]" if ok else "[FAIL]"
+        print(f"{status} Update finished in {(time.perf_counter() - start) * 1000:.1f} ms")
+        print()
+        return ok
+
+
+def make_watcher(poll: bool, interval: float):
+    if not poll:
+        try:
+            return InotifyWatcher(WATCH_DIRS), "inotify"
+        except OSError as e:
+            print(f"[!] inotify unavailable ({e}), falling back to polling")
+    return PollingWatcher(WATCH_DIRS, interval), f"polling every {interval:g} s"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Watch SEDU sources and rerun affected generators/checks")
+    parser.add_argument("--poll", action="store_true",
+                        help="use stat polling instead of inotify")
+    parser.add_argument("--interval", type=float, default=0.25,
+                        help="polling interval in seconds (default: 0.25)")
+    parser.add_argument("--once", action="store_true",
+                        help="run one incremental pass and exit")
+    args = parser.parse_args(argv)
+
+    session = WarmSession()
+    print("=" * 70)
+    print("SEDU WATCH - incremental generators and verification")
+    print("=" * 70)
+    ok = session.update()
+    if args.once:
+        return 0 if ok else 1
+
+    watcher, mode = make_watcher(args.poll, args.interval)
+    print(f"Watching {', '.join(WATCH_PATTERNS)} ({mode}) - Ctrl-C to stop")
+    print()
+    try:
+        while True:
+            session.update(watcher.wait())
+    except KeyboardInterrupt:
+        print("\nStopped.")
+    finally:
+        watcher.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,207 +3,379 @@
 """
 Supplemental Power & Thermal Analysis for SEDU Single-PCB
 Agent 1: Power & Thermal Analysis Expert
+
+The loss and junction-temperature models below are functions of ambient
+temperature, load current, input voltage and PWM frequency that take
+scalars or NumPy arrays, so a whole operating grid is one call. Without
+NumPy a sweep evaluates the grid point by point. The design-point values
+and the loss equations come from the calculation graph (sedu_calc.py).
+
+Usage:
+    python scripts/thermal_analysis.py                    # report at the design points
+    python scripts/thermal_analysis.py --sweep mosfet --tamb 25:85:15 --current 4:24:4
+    python scripts/thermal_analysis.py --sweep mosfet --tamb 60 --vin 18,24,25.2 --fsw 20k,40k
+    python scripts/thermal_analysis.py --sweep buck --tamb 40:85:15 --current 0.5:3:0.5
+
+A sweep prints the Tj surface (ambient x current, '*' above Tj max) for
+every input voltage / PWM frequency combination and the safe-operating
+boundary: the largest continuous current that keeps Tj at or below Tj max.
+The LMR33630 model is efficiency based, so its input voltage and switching
+frequency axes do not change the result.
 """
 
-import sys
+import argparse
 import io
+import itertools
+import math
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+import sedu_calc
+import sedu_thermal
+import sedu_units
+
+try:
+    import numpy as np
+except ImportError:  # Optional: point-by-point sweep below
+    np = None
+
+_design = sedu_calc.load()
+
+TAMB = _design['TAMB']              # °C, worst case
+VIN = _design['VIN']                # V, nominal battery
+
+# LMR33630 (24V->3.3V single-stage)
+BUCK_VOUT = _design['BUCK_VOUT']
+BUCK_IOUT = _design['BUCK_IOUT']            # A, peak capability
+BUCK_IOUT_TYP = _design['BUCK_IOUT_TYP']    # A, typical load
+BUCK_ETA = _design['BUCK_ETA']              # Efficiency at full load
+BUCK_FSW = 400e3                            # Hz
+BUCK_RTH_JA = _design['BUCK_RTH_JA']        # °C/W (HSOIC-8 with thermal vias), documented
+BUCK_TJ_MAX = 150
+
+# BSC016N06NS phase MOSFETs
+FET_RDS_ON_125C = _design['FET_RDS_ON_125C']    # Ω
+FET_RTH_JA = _design['FET_RTH_JA']              # °C/W (SuperSO8, minimal airflow)
+FET_DUTY = _design['FET_DUTY']                  # 50% duty (sinusoidal avg)
+FET_FSW = _design['FET_FSW']                    # Hz, PWM
+FET_COSS = _design['FET_COSS']                  # F, output capacitance
+FET_TJ_MAX = 175
+I_PHASE_AVG = _design['I_MOTOR_AVG']            # A RMS
+I_PHASE_PEAK = _design['I_MOTOR_PEAK']          # A RMS
+PEAK_SW_FACTOR = _design['PEAK_SW_FACTOR']      # Assume 2× sw loss at peak
+
+
+def _sqrt(x):
+    return np.sqrt(x) if np is not None else math.sqrt(x)
+
+
+def _clip(x, low, high):
+    return np.clip(x, low, high) if np is not None else min(max(x, low), high)
+
+
+def buck_loss(iout, eta=BUCK_ETA, vout=BUCK_VOUT):
+    """LMR33630 loss (W) from the full-load efficiency."""
+    return sedu_calc.buck_loss(sedu_calc.buck_p_out(vout, iout), eta)
+
+
+def buck_tj(tamb, iout, rth_ja=BUCK_RTH_JA, eta=BUCK_ETA):
+    """LMR33630 junction temperature (°C)."""
+    return sedu_calc.buck_tj(tamb, buck_loss(iout, eta), rth_ja)
+
+
+def buck_max_current(tamb, rth_ja=BUCK_RTH_JA, eta=BUCK_ETA):
+    """Largest output current (A, up to BUCK_IOUT) with Tj <= BUCK_TJ_MAX."""
+    return _clip((BUCK_TJ_MAX - tamb) / rth_ja / buck_loss(1.0, eta), 0.0, BUCK_IOUT)
+
+
+def fet_conduction_loss(i_rms, rds_on=FET_RDS_ON_125C, duty=FET_DUTY):
+    return sedu_calc.fet_p_cond_avg(i_rms, rds_on, duty)
+
+
+def fet_switching_loss(vds, fsw, coss=FET_COSS):
+    return sedu_calc.fet_p_sw(coss, vds, fsw)
+
+
+def fet_tj(tamb, i_rms, vds=VIN, fsw=FET_FSW, sw_factor=1):
+    """Phase MOSFET junction temperature (°C)."""
+    return sedu_calc.fet_tj_peak(tamb, fet_conduction_loss(i_rms), fet_switching_loss(vds, fsw),
+                                 sw_factor, FET_RTH_JA)
+
+
+def fet_max_current(tamb, vds=VIN, fsw=FET_FSW):
+    """Largest continuous phase current (A RMS) with Tj <= FET_TJ_MAX."""
+    headroom = (FET_TJ_MAX - tamb) / FET_RTH_JA - fet_switching_loss(vds, fsw)
+    return _sqrt(_clip(headroom, 0.0, math.inf) / fet_conduction_loss(1.0))
+
+
+def grid(func, axes: list):
+    """func over the Cartesian product of axes [(name, values)], indexed [i][j]..."""
+    names = [name for name, _ in axes]
+    if np is not None:
+        mesh = np.meshgrid(*(np.asarray(v, float) for _, v in axes), indexing='ij')
+        return func(**dict(zip(names, mesh)))
+
+    def build(depth, point):
+        if depth == len(axes):
+            return func(**point)
+        name, values = axes[depth]
+        return [build(depth + 1, {**point, name: v}) for v in values]
+    return build(0, {})
+
+
+def print_report(g, rth_source):
+    rth_ja = g['BUCK_RTH_JA']
+    print('='*70)
+    print('SUPPLEMENTAL POWER & THERMAL ANALYSIS')
+    print('='*70)
+    print()
+
+    # 1. LMR33630 Thermal Analysis (24V->3.3V single-stage)
+    print('1. LMR33630 BUCK CONVERTER THERMAL ANALYSIS (24V->3.3V)')
+    print('-'*70)
+    D = BUCK_VOUT / VIN  # Duty cycle
+    P_loss_total = g['BUCK_LOSS']
+    Tj = g['BUCK_TJ']
+
+    print(f'   Input voltage:      {VIN:.1f} V')
+    print(f'   Output:             {BUCK_VOUT:.1f} V @ {BUCK_IOUT:.1f} A (peak)')
+    print(f'   Typical load:       {BUCK_IOUT_TYP:.1f} A ({BUCK_IOUT_TYP/BUCK_IOUT*100:.0f}% utilization)')
+    print(f'   Efficiency:         {BUCK_ETA*100:.0f}%')
+    print(f'   Duty cycle:         {D*100:.1f}%')
+    print(f'   Power loss:         {P_loss_total:.2f} W')
+    print(f'   Rth(j-a):           {rth_ja:.0f} °C/W ({rth_source})')
+    print(f'   Ambient temp:       {TAMB:.0f} °C')
+    print(f'   Junction temp:      {Tj:.1f} °C')
+    print(f'   Tj max:             {BUCK_TJ_MAX} °C')
+    print(f'   Margin:             {(BUCK_TJ_MAX-Tj)/BUCK_TJ_MAX*100:.1f}%')
+    print(f'   Status:             {"OK" if Tj < BUCK_TJ_MAX else "FAIL"}')
+    print()
+    print(f'   NOTE: 8× thermal vias (Ø0.3mm) under PowerPAD MANDATORY')
+    print(f'   NOTE: Typical load ({BUCK_IOUT_TYP}A): P_loss = {g["BUCK_LOSS_TYP"]:.2f}W, '
+          f'Tj = {g["BUCK_TJ_TYP"]:.1f}°C')
+    print()
+
+    # 2. Phase MOSFET Detailed Thermal
+    print('2. PHASE MOSFET THERMAL ANALYSIS (BSC016N06NS)')
+    print('-'*70)
+    P_cond_avg = g['FET_P_COND_AVG']
+    P_cond_peak = g['FET_P_COND_PEAK']
+    P_sw_est = g['FET_P_SW']
+
+    P_total_avg = P_cond_avg + P_sw_est
+    P_total_peak = P_cond_peak + P_sw_est * PEAK_SW_FACTOR
+
+    Tj_avg = g['FET_TJ_AVG']
+    Tj_peak = g['FET_TJ_PEAK']
+
+    print(f'   Rds(on) @ 125°C:    {FET_RDS_ON_125C*1e3:.1f} mΩ')
+    print(f'   Phase current (avg):{I_PHASE_AVG:.0f} A RMS')
+    print(f'   Phase current (pk): {I_PHASE_PEAK:.0f} A RMS')
+    print(f'   PWM frequency:      {FET_FSW/1e3:.0f} kHz')
+    print()
+    print(f'   At 12A average:')
+    print(f'     Conduction loss:  {P_cond_avg:.3f} W')
+    print(f'     Switching loss:   {P_sw_est:.3f} W')
+    print(f'     Total loss:       {P_total_avg:.3f} W')
+    print(f'     Junction temp:    {Tj_avg:.1f} °C')
+    print(f'     Margin:           {(FET_TJ_MAX-Tj_avg)/FET_TJ_MAX*100:.1f}%')
+    print()
+    print(f'   At 20A peak (brief <1s):')
+    print(f'     Conduction loss:  {P_cond_peak:.3f} W')
+    print(f'     Switching loss:   {P_sw_est*PEAK_SW_FACTOR:.3f} W (est)')
+    print(f'     Total loss:       {P_total_peak:.3f} W')
+    print(f'     Junction temp:    {Tj_peak:.1f} °C')
+    print(f'     Status:           {"OK (<1s)" if Tj_peak < FET_TJ_MAX else "CRITICAL"}')
+    print()
+
+    # 3. Total Board Power Dissipation
+    print('3. TOTAL BOARD POWER DISSIPATION ANALYSIS')
+    print('-'*70)
+
+    # Operating modes
+    print('   Operating Mode Analysis:')
+    print('   -' * 68)
+    print('   Mode              | Motor | Actuator | Logic | Total | Status')
+    print('   -' * 68)
+
+    # Idle
+    P_logic_idle = 0.5  # W
+    print(f'   Idle              | 0.0 W |  0.0 W   | {P_logic_idle:.1f} W | {P_logic_idle:.1f} W  | Continuous')
+
+    # Motor only (average)
+    P_motor_avg = 6 * P_total_avg  # 6 FETs
+    P_logic = 0.3  # Buck + ESP32
+    P_total_motor_avg = P_motor_avg + P_logic
+    print(f'   Motor (avg 12A)   | {P_motor_avg:.1f} W |  0.0 W   | {P_logic:.1f} W | {P_total_motor_avg:.1f} W | <5s bursts')
+
+    # Motor peak
+    P_motor_peak = 6 * P_total_peak
+    P_total_motor_peak = P_motor_peak + P_logic
+    print(f'   Motor (peak 20A)  | {P_motor_peak:.1f} W |  0.0 W   | {P_logic:.1f} W | {P_total_motor_peak:.1f} W | <1s brief')
+
+    # Actuator only
+    P_actuator = g['DRV_LOSS']  # From DRV8873 thermal calc
+    P_total_actuator = P_actuator + P_logic
+    print(f'   Actuator (3.3A)   | 0.0 W |  {P_actuator:.1f} W   | {P_logic:.1f} W | {P_total_actuator:.1f} W | <10s (TIMEOUT)')
+
+    print('   -' * 68)
+    print()
+    print(f'   Board area:         75mm × 55mm = 4125 mm²')
+    print(f'   Typical dissipation:{P_total_motor_avg:.1f} W')
+    print(f'   Power density:      {P_total_motor_avg/4.125:.2f} W/cm²')
+    print(f'   Required thermal:   {P_total_motor_avg/(85-25):.2f} W/°C (60°C rise)')
+    print()
+
+    # 4. Connector Voltage Drop Analysis
+    print('4. CONNECTOR & WIRE VOLTAGE DROP ANALYSIS')
+    print('-'*70)
+
+    # Battery connector
+    print('   Battery Path (J_BAT + 14 AWG wire, 0.5m):')
+    R_wire_14awg = 8.28e-3  # Ω/m @ 80°C
+    L_cable = 0.5  # meters
+    R_total_bat = 2 * R_wire_14awg * L_cable  # Round trip
+    I_peak = 20.0
+    V_drop_bat = I_peak * R_total_bat
+    P_loss_bat = I_peak**2 * R_total_bat
+
+    print(f'     Wire resistance:  {R_total_bat*1e3:.2f} mΩ (round-trip)')
+    print(f'     At 20A peak:      {V_drop_bat*1e3:.1f} mV drop')
+    print(f'     Power loss:       {P_loss_bat:.2f} W')
+    print(f'     Efficiency loss:  {V_drop_bat/24*100:.2f}%')
+    print()
+
+    # Motor phase wires
+    print('   Motor Phase Path (J_MOT + 14 AWG wire, 0.3m):')
+    L_phase = 0.3
+    R_total_phase = 2 * R_wire_14awg * L_phase
+    V_drop_phase = I_peak * R_total_phase
+    P_loss_phase = I_peak**2 * R_total_phase
+
+    print(f'     Wire resistance:  {R_total_phase*1e3:.2f} mΩ (round-trip)')
+    print(f'     At 20A peak:      {V_drop_phase*1e3:.1f} mV drop')
+    print(f'     Power loss:       {P_loss_phase:.2f} W (per phase)')
+    print(f'     Total 3 phases:   {3*P_loss_phase:.2f} W')
+    print()
+
+    # 5. Board Area Thermal Capacity
+    print('5. BOARD THERMAL CAPACITY VERIFICATION')
+    print('-'*70)
+
+    board_w = 75  # mm
+    board_h = 55  # mm
+    board_area_mm2 = board_w * board_h
+    board_area_cm2 = board_area_mm2 / 100
+
+    # Thermal conductivity targets
+    copper_area_frac = 0.40  # 40% copper coverage (typical for 4-layer)
+    thermal_cond = 470  # mm²/W (target from docs)
+
+    print(f'   Board dimensions:   {board_w}mm × {board_h}mm')
+    print(f'   Total area:         {board_area_mm2:.0f} mm² ({board_area_cm2:.2f} cm²)')
+    print(f'   Copper coverage:    {copper_area_frac*100:.0f}% (est)')
+    print(f'   Effective Cu area:  {board_area_mm2*copper_area_frac:.0f} mm²')
+    print()
+    print(f'   Target thermal:     {thermal_cond:.0f} mm²/W')
+    print(f'   Available thermal:  {board_area_mm2*copper_area_frac:.0f} mm²')
+    print(f'   Max dissipation:    {board_area_mm2*copper_area_frac/thermal_cond:.2f} W (60°C rise)')
+    print()
+    print(f'   Actual peak:        {P_total_motor_peak:.1f} W (brief)')
+    print(f'   Actual average:     {P_total_motor_avg:.1f} W (typical)')
+    print(f'   Thermal margin:     {(board_area_mm2*copper_area_frac/thermal_cond - P_total_motor_avg)/(board_area_mm2*copper_area_frac/thermal_cond)*100:.1f}%')
+    print(f'   Status:             {"ADEQUATE" if P_total_motor_avg < board_area_mm2*copper_area_frac/thermal_cond else "INSUFFICIENT"}')
+    print()
+
+    print('='*70)
+    print('END OF SUPPLEMENTAL ANALYSIS')
+    print('='*70)
+
+
+def parse_axis(text: str) -> list:
+    """'25:85:10' (inclusive range), '18,24,25.2' or '60'; SI prefixes allowed (20k)."""
+    def number(s):
+        value = sedu_units.value(s)
+        if value is None:
+            raise ValueError(f'not a number: {s.strip()!r}')
+        return value
+    if ':' in text:
+        start, stop, step = (number(s) for s in text.split(':'))
+        if step <= 0:
+            raise ValueError(f'step must be positive: {text!r}')
+        if stop < start:
+            raise ValueError(f'empty range, stop below start: {text!r}')
+        count = int(math.floor((stop - start) / step + 1e-9)) + 1
+        return [round(start + i * step, 9) for i in range(count)]
+    return [number(s) for s in text.split(',')]
+
+
+def print_sweep(part, tambs, currents, vins, fsws, rth_ja, rth_source):
+    """Tj surfaces and safe-operating boundary over the sweep grid."""
+    if part == 'mosfet':
+        title = f'BSC016N06NS phase MOSFET, Rth(j-a) {FET_RTH_JA} °C/W, Tj max {FET_TJ_MAX} °C'
+        tj_max = FET_TJ_MAX
+        surface = grid(lambda tamb, i, vin, fsw: fet_tj(tamb, i, vin, fsw),
+                       [('tamb', tambs), ('i', currents), ('vin', vins), ('fsw', fsws)])
+        boundary = grid(lambda tamb, vin, fsw: fet_max_current(tamb, vin, fsw),
+                        [('tamb', tambs), ('vin', vins), ('fsw', fsws)])
+    else:
+        title = f'LMR33630, Rth(j-a) {rth_ja:.0f} °C/W ({rth_source}), Tj max {BUCK_TJ_MAX} °C'
+        tj_max = BUCK_TJ_MAX
+        surface = grid(lambda tamb, i, vin, fsw: buck_tj(tamb, i, rth_ja),
+                       [('tamb', tambs), ('i', currents), ('vin', vins), ('fsw', fsws)])
+        boundary = grid(lambda tamb, vin, fsw: buck_max_current(tamb, rth_ja),
+                        [('tamb', tambs), ('vin', vins), ('fsw', fsws)])
+
+    print('='*70)
+    print(f'THERMAL SWEEP: {title}')
+    print(f'{len(tambs) * len(currents) * len(vins) * len(fsws)} operating points '
+          f'({"NumPy" if np is not None else "pure Python"})')
+    print('='*70)
+    for (k, vin), (m, fsw) in itertools.product(enumerate(vins), enumerate(fsws)):
+        print()
+        print(f'Vin {vin:g} V, PWM {fsw/1e3:g} kHz - Tj (°C), * = above Tj max:')
+        print('   Tamb \\ I [A]' + ''.join(f'{i:>8g}' for i in currents))
+        for a, tamb in enumerate(tambs):
+            cells = ''
+            for b in range(len(currents)):
+                tj = float(surface[a][b][k][m])
+                cells += f'{tj:7.1f}{"*" if tj > tj_max else " "}'
+            print(f'   {tamb:>12g}' + cells)
+        limits = ', '.join(f'{tamb:g} °C: {float(boundary[a][k][m]):.1f} A' for a, tamb in enumerate(tambs))
+        print(f'   Max continuous current: {limits}')
+
+
+def main():
+    # Set UTF-8 encoding for output
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--sweep', choices=['mosfet', 'buck'], help='print Tj surfaces instead of the report')
+    parser.add_argument('--tamb', default='25:85:15', help='ambient °C (default 25:85:15)')
+    parser.add_argument('--current', help='load current A (default 4:24:4 mosfet, 0.5:3:0.5 buck)')
+    parser.add_argument('--vin', default=str(VIN), help=f'input voltage V (default {VIN:g})')
+    parser.add_argument('--fsw', help='PWM/switching frequency Hz, k suffix allowed (default part nominal)')
+    args = parser.parse_args()
+
+    # °C/W (HSOIC-8 with thermal vias): modelled from the board's via array once routed
+    rth_ja, rth_source = sedu_thermal.junction_rth('LMR33630', BUCK_RTH_JA)
+    if args.sweep is None:
+        g = sedu_calc.load()
+        g.set('BUCK_RTH_JA', rth_ja)
+        print_report(g, rth_source)
+        return 0
+
+    default_current = '4:24:4' if args.sweep == 'mosfet' else '0.5:3:0.5'
+    default_fsw = FET_FSW if args.sweep == 'mosfet' else BUCK_FSW
+    try:
+        axes = [parse_axis(args.tamb), parse_axis(args.current or default_current),
+                parse_axis(args.vin), parse_axis(args.fsw) if args.fsw else [default_fsw]]
+    except ValueError as e:
+        parser.error(f'bad range: {e}')
+    print_sweep(args.sweep, *axes, rth_ja, rth_source)
+    return 0
+
 
-# Set UTF-8 encoding for output
-sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
-
-print('='*70)
-print('SUPPLEMENTAL POWER & THERMAL ANALYSIS')
-print('='*70)
-print()
-
-# 1. LMR33630 Thermal Analysis (24V->3.3V single-stage)
-print('1. LMR33630 BUCK CONVERTER THERMAL ANALYSIS (24V->3.3V)')
-print('-'*70)
-Vin = 24.0
-Vout = 3.3
-Iout = 3.0  # Peak capability
-Iout_typ = 0.7  # Typical load
-eta = 0.88  # Efficiency at full load
-Rth_ja = 40  # °C/W (HSOIC-8 with thermal vias)
-Tamb = 85  # Worst case
-
-# Switching losses
-Fsw = 400e3  # 400kHz
-Qg = 10e-9  # Gate charge (internal FET)
-P_sw = Qg * Vin * Fsw * 1e3  # mW
-
-# Conduction losses
-Rds_on = 0.120  # 120mΩ typical for internal FET
-D = Vout / Vin  # Duty cycle
-Irms_hs = Iout * (D**0.5)  # HS FET RMS current
-Irms_ls = Iout * ((1-D)**0.5)  # LS FET RMS current
-P_cond = (Irms_hs**2 + Irms_ls**2) * Rds_on
-
-# Total loss
-P_loss_total = (Vout * Iout) * (1/eta - 1)
-Tj = Tamb + P_loss_total * Rth_ja
-
-print(f'   Input voltage:      {Vin:.1f} V')
-print(f'   Output:             {Vout:.1f} V @ {Iout:.1f} A (peak)')
-print(f'   Typical load:       {Iout_typ:.1f} A ({Iout_typ/Iout*100:.0f}% utilization)')
-print(f'   Efficiency:         {eta*100:.0f}%')
-print(f'   Duty cycle:         {D*100:.1f}%')
-print(f'   Power loss:         {P_loss_total:.2f} W')
-print(f'   Rth(j-a):           {Rth_ja:.0f} °C/W')
-print(f'   Ambient temp:       {Tamb:.0f} °C')
-print(f'   Junction temp:      {Tj:.1f} °C')
-print(f'   Tj max:             150 °C')
-print(f'   Margin:             {(150-Tj)/150*100:.1f}%')
-print(f'   Status:             {"OK" if Tj < 150 else "FAIL"}')
-print()
-print(f'   NOTE: 8× thermal vias (Ø0.3mm) under PowerPAD MANDATORY')
-print(f'   NOTE: Typical load ({Iout_typ}A): P_loss = {(Vout*Iout_typ)*(1/eta-1):.2f}W, Tj = {Tamb + (Vout*Iout_typ)*(1/eta-1)*Rth_ja:.1f}°C')
-print()
-
-# 2. Phase MOSFET Detailed Thermal
-print('2. PHASE MOSFET THERMAL ANALYSIS (BSC016N06NS)')
-print('-'*70)
-Rds_on_25C = 1.6e-3  # 1.6mΩ @ 25°C
-Rds_on_125C = 2.5e-3  # 2.5mΩ @ 125°C
-I_phase_avg = 12.0  # RMS current
-I_phase_peak = 20.0
-Rth_ja = 150  # °C/W (SuperSO8, minimal airflow)
-D_motor = 0.5  # 50% duty (sinusoidal avg)
-
-# Conduction loss
-P_cond_avg = I_phase_avg**2 * Rds_on_125C * D_motor
-P_cond_peak = I_phase_peak**2 * Rds_on_125C * D_motor
-
-# Switching loss (20kHz PWM)
-Fsw_motor = 20e3
-Coss = 1500e-12  # Output capacitance
-Vds = 24
-P_sw_est = 0.5 * Coss * Vds**2 * Fsw_motor
-
-P_total_avg = P_cond_avg + P_sw_est
-P_total_peak = P_cond_peak + P_sw_est * 2  # Assume 2× sw loss at peak
-
-Tj_avg = Tamb + P_total_avg * Rth_ja
-Tj_peak = Tamb + P_total_peak * Rth_ja
-
-print(f'   Rds(on) @ 125°C:    {Rds_on_125C*1e3:.1f} mΩ')
-print(f'   Phase current (avg):{I_phase_avg:.0f} A RMS')
-print(f'   Phase current (pk): {I_phase_peak:.0f} A RMS')
-print(f'   PWM frequency:      {Fsw_motor/1e3:.0f} kHz')
-print()
-print(f'   At 12A average:')
-print(f'     Conduction loss:  {P_cond_avg:.3f} W')
-print(f'     Switching loss:   {P_sw_est:.3f} W')
-print(f'     Total loss:       {P_total_avg:.3f} W')
-print(f'     Junction temp:    {Tj_avg:.1f} °C')
-print(f'     Margin:           {(175-Tj_avg)/175*100:.1f}%')
-print()
-print(f'   At 20A peak (brief <1s):')
-print(f'     Conduction loss:  {P_cond_peak:.3f} W')
-print(f'     Switching loss:   {P_sw_est*2:.3f} W (est)')
-print(f'     Total loss:       {P_total_peak:.3f} W')
-print(f'     Junction temp:    {Tj_peak:.1f} °C')
-print(f'     Status:           {"OK (<1s)" if Tj_peak < 175 else "CRITICAL"}')
-print()
-
-# 3. Total Board Power Dissipation
-print('3. TOTAL BOARD POWER DISSIPATION ANALYSIS')
-print('-'*70)
-
-# Operating modes
-print('   Operating Mode Analysis:')
-print('   -' * 68)
-print('   Mode              | Motor | Actuator | Logic | Total | Status')
-print('   -' * 68)
-
-# Idle
-P_logic_idle = 0.5  # W
-print(f'   Idle              | 0.0 W |  0.0 W   | {P_logic_idle:.1f} W | {P_logic_idle:.1f} W  | Continuous')
-
-# Motor only (average)
-P_motor_avg = 6 * P_total_avg  # 6 FETs
-P_logic = 0.3  # Buck + ESP32
-P_total_motor_avg = P_motor_avg + P_logic
-print(f'   Motor (avg 12A)   | {P_motor_avg:.1f} W |  0.0 W   | {P_logic:.1f} W | {P_total_motor_avg:.1f} W | <5s bursts')
-
-# Motor peak
-P_motor_peak = 6 * P_total_peak
-P_total_motor_peak = P_motor_peak + P_logic
-print(f'   Motor (peak 20A)  | {P_motor_peak:.1f} W |  0.0 W   | {P_logic:.1f} W | {P_total_motor_peak:.1f} W | <1s brief')
-
-# Actuator only
-P_actuator = 4.4  # From DRV8873 thermal calc
-P_total_actuator = P_actuator + P_logic
-print(f'   Actuator (3.3A)   | 0.0 W |  {P_actuator:.1f} W   | {P_logic:.1f} W | {P_total_actuator:.1f} W | <10s (TIMEOUT)')
-
-print('   -' * 68)
-print()
-print(f'   Board area:         75mm × 55mm = 4125 mm²')
-print(f'   Typical dissipation:{P_total_motor_avg:.1f} W')
-print(f'   Power density:      {P_total_motor_avg/4.125:.2f} W/cm²')
-print(f'   Required thermal:   {P_total_motor_avg/(85-25):.2f} W/°C (60°C rise)')
-print()
-
-# 4. Connector Voltage Drop Analysis
-print('4. CONNECTOR & WIRE VOLTAGE DROP ANALYSIS')
-print('-'*70)
-
-# Battery connector
-print('   Battery Path (J_BAT + 14 AWG wire, 0.5m):')
-R_wire_14awg = 8.28e-3  # Ω/m @ 80°C
-L_cable = 0.5  # meters
-R_total_bat = 2 * R_wire_14awg * L_cable  # Round trip
-I_peak = 20.0
-V_drop_bat = I_peak * R_total_bat
-P_loss_bat = I_peak**2 * R_total_bat
-
-print(f'     Wire resistance:  {R_total_bat*1e3:.2f} mΩ (round-trip)')
-print(f'     At 20A peak:      {V_drop_bat*1e3:.1f} mV drop')
-print(f'     Power loss:       {P_loss_bat:.2f} W')
-print(f'     Efficiency loss:  {V_drop_bat/24*100:.2f}%')
-print()
-
-# Motor phase wires
-print('   Motor Phase Path (J_MOT + 14 AWG wire, 0.3m):')
-L_phase = 0.3
-R_total_phase = 2 * R_wire_14awg * L_phase
-V_drop_phase = I_peak * R_total_phase
-P_loss_phase = I_peak**2 * R_total_phase
-
-print(f'     Wire resistance:  {R_total_phase*1e3:.2f} mΩ (round-trip)')
-print(f'     At 20A peak:      {V_drop_phase*1e3:.1f} mV drop')
-print(f'     Power loss:       {P_loss_phase:.2f} W (per phase)')
-print(f'     Total 3 phases:   {3*P_loss_phase:.2f} W')
-print()
-
-# 5. Board Area Thermal Capacity
-print('5. BOARD THERMAL CAPACITY VERIFICATION')
-print('-'*70)
-
-board_w = 75  # mm
-board_h = 55  # mm
-board_area_mm2 = board_w * board_h
-board_area_cm2 = board_area_mm2 / 100
-
-# Thermal conductivity targets
-copper_area_frac = 0.40  # 40% copper coverage (typical for 4-layer)
-thermal_cond = 470  # mm²/W (target from docs)
-
-print(f'   Board dimensions:   {board_w}mm × {board_h}mm')
-print(f'   Total area:         {board_area_mm2:.0f} mm² ({board_area_cm2:.2f} cm²)')
-print(f'   Copper coverage:    {copper_area_frac*100:.0f}% (est)')
-print(f'   Effective Cu area:  {board_area_mm2*copper_area_frac:.0f} mm²')
-print()
-print(f'   Target thermal:     {thermal_cond:.0f} mm²/W')
-print(f'   Available thermal:  {board_area_mm2*copper_area_frac:.0f} mm²')
-print(f'   Max dissipation:    {board_area_mm2*copper_area_frac/thermal_cond:.2f} W (60°C rise)')
-print()
-print(f'   Actual peak:        {P_total_motor_peak:.1f} W (brief)')
-print(f'   Actual average:     {P_total_motor_avg:.1f} W (typical)')
-print(f'   Thermal margin:     {(board_area_mm2*copper_area_frac/thermal_cond - P_total_motor_avg)/(board_area_mm2*copper_area_frac/thermal_cond)*100:.1f}%')
-print(f'   Status:             {"ADEQUATE" if P_total_motor_avg < board_area_mm2*copper_area_frac/thermal_cond else "INSUFFICIENT"}')
-print()
-
-print('='*70)
-print('END OF SUPPLEMENTAL ANALYSIS')
-print('='*70)
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,11 +2,19 @@
 """
 Comprehensive Thermal Verification - Manual Math Check
 Verifies ALL thermal calculations for aviation safety critical components
+Shared quantities come from the calculation graph (sedu_calc.py)
 """
 
 import math
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+import sedu_calc
+import sedu_thermal
 
 def verify_thermal_calculations():
+    g = sedu_calc.load()
     print('=' * 80)
     print('COMPREHENSIVE THERMAL VERIFICATION - MANUAL CALCULATION CHECK')
     print('=' * 80)
@@ -18,14 +26,14 @@ def verify_thermal_calculations():
     # 1. LM5069-1 RS_IN Sense Resistor
     print('1. LM5069-1 RS_IN SENSE RESISTOR (WSLP2728)')
     print('-' * 80)
-    R_RS_IN = 0.003  # 3.0 mOhm
-    I_ILIM = 18.3  # A
-    I_CB = 35.0  # A
-    P_ILIM = I_ILIM**2 * R_RS_IN
-    P_CB = I_CB**2 * R_RS_IN
+    R_RS_IN = g['RS_IN']
+    I_ILIM = g['ILIM']
+    I_CB = g['I_CB']
+    P_ILIM = g['P_RS_IN_ILIM']
+    P_CB = g['P_RS_IN_CB']
     print(f'Resistance: {R_RS_IN*1000:.1f} mOhm')
-    print(f'Power @ ILIM ({I_ILIM}A): {P_ILIM:.3f} W')
-    print(f'Power @ CB ({I_CB}A): {P_CB:.3f} W (brief <100ms)')
+    print(f'Power @ ILIM ({I_ILIM:.1f}A): {P_ILIM:.3f} W')
+    print(f'Power @ CB ({I_CB:.1f}A): {P_CB:.3f} W (brief <100ms)')
     print(f'Rating: 3W pulse')
     print(f'Margin @ ILIM: {(3.0 - P_ILIM)/3.0*100:.1f}%')
     if P_ILIM >= 3.0:
@@ -36,17 +44,14 @@ def verify_thermal_calculations():
     # 2. Phase Shunts RS_U/V/W
     print('2. PHASE SHUNTS RS_U/V/W (CSS2H-2512K-2L00F)')
     print('-' * 80)
-    R_PHASE = 0.002  # 2.0 mOhm
-    I_12A = 12.0
-    I_20A = 20.0
-    I_25A = 25.0
-    P_12A = I_12A**2 * R_PHASE
-    P_20A = I_20A**2 * R_PHASE
-    P_25A = I_25A**2 * R_PHASE
+    R_PHASE = g['R_PHASE']
+    P_12A = g['P_SHUNT_AVG']
+    P_20A = g['P_SHUNT_PEAK']
+    P_25A = g['P_SHUNT_FAULT']
     print(f'Resistance: {R_PHASE*1000:.1f} mOhm')
-    print(f'Power @ 12A RMS: {P_12A:.3f} W')
-    print(f'Power @ 20A peak: {P_20A:.3f} W')
-    print(f'Power @ 25A fault: {P_25A:.3f} W')
+    print(f'Power @ {g["I_MOTOR_AVG"]:g}A RMS: {P_12A:.3f} W')
+    print(f'Power @ {g["I_MOTOR_PEAK"]:g}A peak: {P_20A:.3f} W')
+    print(f'Power @ {g["I_PHASE_FAULT"]:g}A fault: {P_25A:.3f} W')
     print(f'Rating: 5W (K suffix verified)')
     print(f'Margin @ 20A: {(5.0 - P_20A)/5.0*100:.1f}% (525% safety factor)')
     if P_20A >= 5.0:
@@ -87,21 +92,18 @@ def verify_thermal_calculations():
     # 4. Phase MOSFETs (BSC016N06NS, 6x SuperSO8)
     print('4. PHASE MOSFETS Qx (6x BSC016N06NS)')
     print('-' * 80)
-    Rds_125C_phase = 0.0025  # 2.5 mOhm @ 125C
-    Rth_ja_phase = 150  # C/W (SuperSO8, no heatsink)
-    Ta = 85  # C
-    I_phase_12A = 12.0
-    I_phase_20A = 20.0
+    Rds_125C_phase = g['FET_RDS_ON_125C']
+    Rth_ja_phase = g['FET_RTH_JA']  # C/W (SuperSO8, no heatsink)
     # Conduction loss (50% duty assumed)
-    P_cond_12A = 0.5 * I_phase_12A**2 * Rds_125C_phase
-    P_sw_12A = 0.009  # W estimated from Coss switching loss
+    P_cond_12A = g['FET_P_COND_AVG']
+    P_sw_12A = g['FET_P_SW']  # Coss switching loss
     P_total_12A = P_cond_12A + P_sw_12A
-    Tj_12A = Ta + (P_total_12A * Rth_ja_phase)
+    Tj_12A = g['FET_TJ_AVG']
 
-    P_cond_20A = 0.5 * I_phase_20A**2 * Rds_125C_phase
-    P_sw_20A = 0.017  # W estimated
+    P_cond_20A = g['FET_P_COND_PEAK']
+    P_sw_20A = g['FET_P_SW'] * g['PEAK_SW_FACTOR']
     P_total_20A = P_cond_20A + P_sw_20A
-    Tj_20A = Ta + (P_total_20A * Rth_ja_phase)
+    Tj_20A = g['FET_TJ_PEAK']
 
     print(f'Rds(on) @ 125C: {Rds_125C_phase*1000:.2f} mOhm')
     print(f'Rth(j-a): {Rth_ja_phase} C/W per FET')
@@ -124,26 +126,25 @@ def verify_thermal_calculations():
     # 5. LMR33630 Buck Converter
     print('5. LMR33630 BUCK CONVERTER (24V->3.3V)')
     print('-' * 80)
-    V_in = 24.0
-    V_out = 3.3
-    I_out_typ = 0.7  # A typical
-    I_out_peak = 3.0  # A peak
-    eff = 0.88
-    Rth_ja = 40  # C/W with thermal vias
-    Ta = 85
+    V_in = g['VIN']
+    V_out = g['BUCK_VOUT']
+    I_out_typ = g['BUCK_IOUT_TYP']  # A typical
+    I_out_peak = g['BUCK_IOUT']  # A peak
+    eff = g['BUCK_ETA']
+    # C/W with thermal vias: modelled from the board's via array once routed
+    Rth_ja, Rth_source = sedu_thermal.junction_rth('LMR33630', g['BUCK_RTH_JA'])
+    g.set('BUCK_RTH_JA', Rth_ja)
 
     P_out_typ = V_out * I_out_typ
-    P_in_typ = P_out_typ / eff
-    P_loss_typ = P_in_typ - P_out_typ
-    Tj_typ = Ta + (P_loss_typ * Rth_ja)
+    P_loss_typ = g['BUCK_LOSS_TYP']
+    Tj_typ = g['BUCK_TJ_TYP']
 
-    P_out_peak = V_out * I_out_peak
-    P_in_peak = P_out_peak / eff
-    P_loss_peak = P_in_peak - P_out_peak
-    Tj_peak = Ta + (P_loss_peak * Rth_ja)
+    P_out_peak = g['BUCK_P_OUT']
+    P_loss_peak = g['BUCK_LOSS']
+    Tj_peak = g['BUCK_TJ']
 
     print(f'Input: {V_in}V, Output: {V_out}V, Efficiency: {eff*100:.0f}%')
-    print(f'Rth(j-a): {Rth_ja} C/W (HSOIC-8 with 8x thermal vias)')
+    print(f'Rth(j-a): {Rth_ja:.0f} C/W (HSOIC-8 with thermal vias; {Rth_source})')
     print()
     print(f'@ Typical load ({I_out_typ}A):')
     print(f'  P_out: {P_out_typ:.2f} W, P_loss: {P_loss_typ:.3f} W')
@@ -162,12 +163,13 @@ def verify_thermal_calculations():
     # 6. DRV8873 Actuator H-Bridge (CRITICAL)
     print('6. DRV8873 ACTUATOR H-BRIDGE (HTSSOP-28) - CRITICAL THERMAL')
     print('-' * 80)
-    Rds_total = 0.4  # Ohm (2x internal FETs in series)
-    I_act = 3.3  # A continuous
-    Rth_ja = 30  # C/W with thermal vias
-    Ta = 85
-    P_loss = I_act**2 * Rds_total
-    Tj_continuous = Ta + (P_loss * Rth_ja)
+    Rds_total = g['DRV_RDS_ON']  # Ohm (2x internal FETs in series)
+    I_act = g['I_ACTUATOR']  # A continuous
+    Rth_ja, Rth_source = sedu_thermal.junction_rth('DRV8873', g['DRV_RTH_JA'])  # C/W with thermal vias
+    g.set('DRV_RTH_JA', Rth_ja)
+    Ta = g['TAMB']
+    P_loss = g['DRV_LOSS']
+    Tj_continuous = g['DRV_TJ']
 
     # With 10s timeout, 17% duty cycle
     duty = 0.17  # 10s ON / 50s OFF
@@ -176,7 +178,7 @@ def verify_thermal_calculations():
 
     print(f'Rds(on) total: {Rds_total:.2f} Ohm (2x FETs in series)')
     print(f'Current: {I_act} A continuous')
-    print(f'Rth(j-a): {Rth_ja} C/W (with thermal vias)')
+    print(f'Rth(j-a): {Rth_ja:.0f} C/W (with thermal vias; {Rth_source})')
     print()
     print(f'CONTINUOUS OPERATION (NOT ALLOWED):')
     print(f'  Power: {P_loss:.2f} W')
@@ -315,5 +317,4 @@ def verify_thermal_calculations():
         return 0
 
 if __name__ == '__main__':
-    import sys
     sys.exit(verify_thermal_calculations())
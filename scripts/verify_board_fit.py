@@ -2,25 +2,63 @@
 """
 Physical verification of 80x50mm board layout.
 Checks if all components fit with required routing channels.
+
+Mounting hole positions come from the PCB via the cached board model
+(sedu_board.py); the frozen positions are used if the board cannot be read.
+Placed footprints are checked for courtyard overlaps and antenna/hole
+keep-out intrusions by sedu_geometry.py.
+
+The component table is packed onto the outline by sedu_placer.py, which
+returns a concrete placement or an infeasibility proof. Any FAIL issue makes
+the verdict FAIL; an undecided search makes it INCONCLUSIVE, never PASS.
+Explore other outlines and routing channels with:
+
+    python scripts/verify_board_fit.py --size 75x50 --channel 2.5 --map
 """
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+import sedu_board
+import sedu_geometry
+import sedu_placer
+import sedu_sexpr
+
+parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+parser.add_argument('--size', default='80x50', help='board outline WxH in mm (default 80x50)')
+parser.add_argument('--channel', type=float, default=3.0,
+                    help='routing channel between components in mm (default 3.0)')
+parser.add_argument('--map', action='store_true', help='print an ASCII map of the placement')
+args = parser.parse_args()
 
 print('=' * 80)
-print('SEDU PCB 80x50mm PHYSICAL VERIFICATION')
+print(f'SEDU PCB {args.size}mm PHYSICAL VERIFICATION')
 print('=' * 80)
 
 # Board dimensions
-board_w = 80  # mm
-board_h = 50  # mm
+board_w, board_h = (float(v) for v in args.size.lower().split('x'))  # mm (frozen: 80x50)
 board_area = board_w * board_h
-print(f'\nBoard: {board_w}x{board_h} mm = {board_area} mm^2')
+print(f'\nBoard: {board_w:g}x{board_h:g} mm = {board_area:g} mm^2')
 
 # Mounting holes with keep-out
 hole_dia = 3.2  # mm finished
 hole_keepout = 1.5  # mm annulus
 hole_total = hole_dia + 2 * hole_keepout
-hole_area = 4 * (hole_total ** 2)
-print(f'Mounting holes: 4x M3 (3.2mm) with 1.5mm keep-out = {hole_total}mm each')
-print(f'  Positions: (4,4), (76,4), (4,46), (76,46)')
+hole_inset = 4  # mm from each corner
+try:
+    board = sedu_board.load_board()
+    holes = board.mounting_holes(hole_dia)
+except (OSError, sedu_sexpr.SExprError) as e:
+    print(f'[!] PCB not readable ({e}), using frozen hole positions')
+    board = None
+    holes = []
+if not holes or (board_w, board_h) != (80, 50):
+    holes = [(hole_inset, hole_inset), (board_w - hole_inset, hole_inset),
+             (hole_inset, board_h - hole_inset), (board_w - hole_inset, board_h - hole_inset)]
+hole_area = len(holes) * (hole_total ** 2)
+print(f'Mounting holes: {len(holes)}x M3 (3.2mm) with 1.5mm keep-out = {hole_total}mm each')
+print(f"  Positions: {', '.join(f'({x:g},{y:g})' for x, y in holes)}")
 print(f'  Total exclusion area: {hole_area:.1f} mm^2')
 
 print('\n' + '-' * 80)
@@ -40,9 +78,9 @@ components = {
     'Phase shunts 2512': {'w': 3.2, 'l': 6.4, 'qty': 3, 'note': 'Kelvin sense'},
     'RS_IN shunt 2728': {'w': 7.0, 'l': 7.1, 'qty': 1, 'note': 'LM5069 sense'},
     'Inductor 1008': {'w': 10.0, 'l': 10.0, 'qty': 1, 'note': 'Buck L4'},
-    'XT30 connectors': {'w': 12.5, 'l': 16.0, 'qty': 4, 'note': 'Battery + 3× phases'},
-    'MicroFit 2P': {'w': 10.0, 'l': 7.0, 'qty': 1, 'note': 'J_ACT'},
-    'JST-GH-8P': {'w': 11.5, 'l': 5.5, 'qty': 2, 'note': 'J_LCD + J_UI'},
+    'XT30 connectors': {'w': 12.5, 'l': 16.0, 'qty': 4, 'note': 'Battery + 3× phases', 'edge': True},
+    'MicroFit 2P': {'w': 10.0, 'l': 7.0, 'qty': 1, 'note': 'J_ACT', 'edge': True},
+    'JST-GH-8P': {'w': 11.5, 'l': 5.5, 'qty': 2, 'note': 'J_LCD + J_UI', 'edge': True},
     'SMBJ33A TVS': {'w': 5.0, 'l': 5.8, 'qty': 2, 'note': 'DO-214AA'},
 }
 
@@ -123,10 +161,82 @@ print('  H3: (4,46) - corner, near UI connector edge')
 print('  H4: (76,46) - corner, near motor phase zone')
 
 # Calculate usable width/height accounting for hole positions
-inner_w = 76 - 4 - hole_total  # Between holes minus keep-out
-inner_h = 46 - 4 - hole_total  # Between holes minus keep-out
+hole_xs = [x for x, _ in holes]
+hole_ys = [y for _, y in holes]
+inner_w = max(hole_xs) - min(hole_xs) - hole_total  # Between holes minus keep-out
+inner_h = max(hole_ys) - min(hole_ys) - hole_total  # Between holes minus keep-out
 print(f'\nUsable interior rectangle (between holes): {inner_w:.1f}x{inner_h:.1f} mm = {inner_w*inner_h:.1f} mm^2')
 
+print('\n' + '-' * 80)
+print('PLACED FOOTPRINTS (PCB courtyards):')
+print('-' * 80)
+placement_rc = 0
+if board is not None:
+    placement = sedu_geometry.check_placement(board, hole_dia, hole_keepout)
+    placement_rc = sedu_geometry.print_report(placement)
+else:
+    print('Skipped (PCB not readable)')
+
+print('\n' + '-' * 80)
+print('PLACEMENT FEASIBILITY (packing solver):')
+print('-' * 80)
+
+
+def placement_blocks(channel):
+    """One block per component instance; connectors must sit on an edge.
+
+    The ESP32 block includes its antenna keep-out. The keep-out only has to
+    stay clear of component bodies, so it is shrunk by the half channel the
+    solver grows every block by.
+    """
+    blocks = []
+    for name, specs in components.items():
+        w, l = specs['w'], specs['l']
+        if name.startswith('ESP32'):
+            w += 2 * max(antenna_sides - channel / 2, 0)
+            l += max(antenna_forward - channel / 2, 0)
+        for i in range(specs['qty']):
+            label = name if specs['qty'] == 1 else f"{name} #{i + 1}"
+            blocks.append(sedu_placer.Block(label, w, l, specs.get('edge', False)))
+    return blocks
+
+
+blocks = placement_blocks(args.channel)
+hole_squares = [(x - hole_total / 2, y - hole_total / 2, x + hole_total / 2, y + hole_total / 2)
+                for x, y in holes]
+
+placement_result = sedu_placer.solve(blocks, board_w, board_h, hole_squares, args.channel)
+print(f'{len(blocks)} blocks, {args.channel:g}mm routing channel, '
+      f'{len(holes)} hole keep-outs ({hole_total:g}mm squares)')
+if placement_result.status == 'feasible':
+    print(f'[OK] FEASIBLE: concrete placement found ({placement_result.iterations} local-search moves)')
+    print(f"  {'Block':<35} {'x':>6} {'y':>6} {'Size':>13}")
+    for p in placement_result.placements:
+        size = f'{p.w:g}x{p.l:g}'
+        print(f"  {p.name:<35} {p.x:6.1f} {p.y:6.1f} {size:>13}{' (rotated)' if p.rotated else ''}")
+elif placement_result.status == 'infeasible':
+    print(f'[FAIL] INFEASIBLE: {placement_result.proof}')
+else:
+    print(f'[!] UNDECIDED: best attempt leaves {len(placement_result.unplaced)} block(s) unplaced '
+          f"after {placement_result.iterations} moves: {', '.join(placement_result.unplaced)}")
+    print('    (inconclusive: no bound proves infeasibility; try a larger outline or narrower channel)')
+
+# Widest channel that still packs, in 0.5mm steps
+widest = None
+channel = 0.0
+while channel <= 5.0:
+    trial = placement_result if channel == args.channel else sedu_placer.solve(
+        placement_blocks(channel), board_w, board_h, hole_squares, channel)
+    if trial.status != 'feasible':
+        break
+    widest = channel
+    channel += 0.5
+stop = f' ({channel:g}mm {trial.status})' if channel <= 5.0 else ''
+print(f"Widest feasible routing channel: {f'{widest:g}mm' if widest is not None else 'none'}{stop}")
+if args.map and placement_result.placements:
+    print()
+    print('\n'.join(sedu_placer.render(placement_result, board_w, board_h, hole_squares)))
+
 print('\n' + '=' * 80)
 print('VERDICT:')
 print('=' * 80)
@@ -151,11 +261,25 @@ print(f'\nConnector edge utilization: {edge_connectors_width:.1f}mm / {perimeter
 if connector_utilization > 70:
     issues.append(f'WARNING: Connector utilization {connector_utilization:.1f}% may be tight for edge placement')
 
+if placement_result.status == 'infeasible':
+    issues.append(f'FAIL: No placement with {args.channel:g}mm routing channels ({placement_result.proof})')
+
+if placement_rc:
+    issues.append('FAIL: Placed footprints violate courtyard or keep-out rules (see above)')
+
 if issues:
     print('\n'.join(issues))
+
+# An undecided search proves nothing either way: never a PASS, never a size FAIL
+if any(issue.startswith('FAIL') for issue in issues):
+    print(f'\nFAIL: {args.size}mm BOARD DOES NOT FIT - SEE FAILURES ABOVE')
+elif placement_result.status == 'undecided':
+    print(f'\nINCONCLUSIVE: {args.size}mm BOARD NOT VERIFIED - packing search found no placement with '
+          f'{args.channel:g}mm routing channels, no bound proves infeasibility')
+elif issues:
     print('\nWARNING: BOARD SIZE MARGINAL - TIGHT FIT WITH POTENTIAL ISSUES')
 else:
-    print('PASS: 80x50mm BOARD PHYSICALLY VERIFIED - ALL COMPONENTS FIT')
+    print(f'PASS: {args.size}mm BOARD PHYSICALLY VERIFIED - ALL COMPONENTS FIT')
     print(f'   Component density: {utilization:.1f}% (raw), {effective_utilization:.1f}% (with routing)')
     print(f'   Usable interior: {inner_w:.1f}x{inner_h:.1f} mm')
     print('   All placement zones feasible with proper layout planning')
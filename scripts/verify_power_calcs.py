@@ -5,11 +5,24 @@ SEDU Power System Verification Calculations (Database-Driven)
 UPDATED: Now reads all power calculation values from design_database.yaml
 
 Verifies all power calculations, component ratings, and margins
+Values and equations come from the calculation graph (sedu_calc.py)
+Tolerance analysis (section 9): Monte Carlo and worst-case spread of the
+protection thresholds, dividers and buck output from the database component
+tolerances and IC thresholds (sedu_tolerance.py); yield warnings do not fail
+the check. main(tolerance=False) checks the tolerance data is present but
+skips the Monte Carlo run (sedu_watch.py, on every save)
 Exit codes: 0 = all calculations verified, 1 = calculation mismatch
 """
 
+import math
 import sys
 import yaml
+
+import sedu_calc
+import sedu_db
+import sedu_tolerance as tol
+import sedu_units
+from check_power_budget import POWER_REQUIREMENTS
 from pathlib import Path
 
 ROOT = Path(__file__).resolve().parents[1]
@@ -23,84 +36,66 @@ def load_database():
         sys.exit(1)
 
     try:
-        with open(DATABASE, 'r', encoding='utf-8') as f:
-            return yaml.safe_load(f)
+        return sedu_db.load_database(DATABASE)
     except yaml.YAMLError as e:
         print(f"[power_calcs] ERROR: Failed to parse database: {e}")
         sys.exit(1)
 
 
-def get_locked_value(db, component_ref):
-    """Get locked value from verification_rules section."""
-    locked_values = db.get('verification_rules', {}).get('locked_values', [])
-
-    for entry in locked_values:
-        if entry.get('component') == component_ref:
-            value_str = entry.get('value', '')
-            # Parse value string (e.g., "3.0m" -> 0.003, "140k" -> 140000)
-            if value_str.endswith('m'):  # milliohms
-                return float(value_str[:-1]) / 1000
-            elif value_str.endswith('k'):  # kilohms
-                return float(value_str[:-1]) * 1000
-            elif value_str.endswith('nF'):  # nanofarads
-                return float(value_str[:-2]) * 1e-9
-            elif value_str.endswith('uH'):  # microhenrys
-                return float(value_str[:-2]) * 1e-6
-            else:
-                return float(value_str)
-    return None
-
-
-def get_component_value(db, ref):
-    """Get component value from components section."""
+# Locked resistors whose database tolerance enters the tolerance analysis
+TOLERANCE_REFS = ['RS_IN', 'RUV_TOP', 'RUV_BOT', 'ROV_TOP', 'ROV_BOT',
+                  'R_VBAT_TOP', 'R_VBAT_BOT', 'RFBT', 'RFBB']
+
+
+def tolerance_params(db, g):
+    """Return ({name: tol.Param}, [missing]) from component tolerances and IC thresholds."""
     components = db.get('components', {})
-    if ref in components:
-        value_str = components[ref].get('value', '')
-        # Parse value (same logic as locked values)
-        if value_str.endswith('m'):
-            return float(value_str[:-1]) / 1000
-        elif value_str.endswith('k'):
-            return float(value_str[:-1]) * 1000
-        elif value_str.endswith('R'):
-            return float(value_str[:-1])
-        else:
-            try:
-                return float(value_str)
-            except ValueError:
-                return None
-    return None
-
-
-def main():
+    params, missing = {}, []
+    for ref in TOLERANCE_REFS:
+        value = g[ref]
+        tolerance = components.get(ref, {}).get('tolerance')
+        if value is None or tolerance is None:
+            missing.append(ref)
+            continue
+        params[ref] = tol.Param.relative(ref, value, tolerance, f"{ref} {tolerance}")
+    for ic_ref, ic_data in db.get('ics', {}).items():
+        for name, limits in (ic_data.get('thresholds') or {}).items():
+            params[name] = tol.Param.limits(name, limits, f"{ic_data.get('part', ic_ref)} min/max")
+    for name in ('V_ILIM', 'V_CB', 'V_UV', 'V_OV', 'V_FB'):
+        if name not in params:
+            missing.append(name)
+    # Fixed operating point of the divider equation
+    params['VBAT_MAX'] = tol.Param('VBAT_MAX', g['VBAT_MAX'], g['VBAT_MAX'], g['VBAT_MAX'], 'firmware constant')
+    return params, missing
+
+
+def main(tolerance=True):
     # Load database
     db = load_database()
+    g = sedu_calc.load(db)
 
     # Extract firmware constants
     fw_const = db.get('firmware_constants', {})
 
-    # Extract locked values
-    RS_IN = get_locked_value(db, 'RS_IN')
-    R_VBAT_TOP = get_locked_value(db, 'R_VBAT_TOP')
-    R_VBAT_BOT = get_locked_value(db, 'R_VBAT_BOT')
-    R_ILIM = get_locked_value(db, 'R_ILIM')
-    R_IPROPI = get_locked_value(db, 'R_IPROPI')
-    RS_U = get_locked_value(db, 'RS_U')  # All phase shunts should be same value
+    # Extract component values
+    RS_IN = g['RS_IN']
+    R_VBAT_TOP = g['R_VBAT_TOP']
+    R_VBAT_BOT = g['R_VBAT_BOT']
+    R_ILIM = g['R_ILIM']
+    R_IPROPI = g['R_IPROPI']
 
     # Extract firmware constants
-    VBAT_MIN = fw_const.get('VBAT_MIN', 18.0)
-    VBAT_MAX = fw_const.get('VBAT_MAX', 25.2)
-    CSA_GAIN = fw_const.get('CSA_GAIN', 20.0)
-    PHASE_SHUNT_R = fw_const.get('PHASE_SHUNT_R', 0.002)
+    VBAT_MIN = g['VBAT_MIN']
+    VBAT_MAX = g['VBAT_MAX']
+    CSA_GAIN = g['CSA_GAIN']
+    PHASE_SHUNT_R = g['R_PHASE']
 
     # Extract IC data
-    ics = db.get('ics', {})
-    u4_data = ics.get('U4', {})
-    V_out_buck = u4_data.get('output_voltage', 3.3)
+    V_out_buck = g['BUCK_VOUT']
 
     # Get MOSFET voltage rating from components
     components = db.get('components', {})
-    q1_data = components.get('Q1', {})
-    V_mosfet_rating = q1_data.get('voltage_rating', 60)
+    V_mosfet_rating = g['FET_V_RATING']
 
     print('='*70)
     print('SEDU POWER SYSTEM VERIFICATION (Database-Driven)')
@@ -115,12 +110,12 @@ def main():
     print('-'*70)
 
     if RS_IN is None:
-        print('[ERROR] RS_IN not found in database locked_values')
+        print('[ERROR] RS_IN not found in database')
         return 1
 
     Rsense = RS_IN
-    V_ILIM = 55e-3   # 55 mV typical threshold (from LM5069 datasheet)
-    I_LIM = V_ILIM / Rsense
+    V_ILIM = g['V_ILIM']   # Typical threshold (LM5069 datasheet)
+    I_LIM = g['ILIM']
 
     print(f'   Rsense (database): {Rsense*1000:.1f} mOhm')
     print(f'   V_ILIM threshold:  {V_ILIM*1000:.1f} mV')
@@ -132,8 +127,8 @@ def main():
     print()
 
     # Circuit Breaker
-    V_CB = 105e-3  # 105 mV circuit breaker threshold
-    I_CB = V_CB / Rsense
+    V_CB = g['V_CB']  # Circuit breaker threshold
+    I_CB = g['I_CB']
     print(f'   Circuit Breaker:')
     print(f'   V_CB threshold:   {V_CB*1000:.1f} mV')
     print(f'   I_CB calculated:  {I_CB:.1f} A')
@@ -144,9 +139,8 @@ def main():
     print()
 
     # Power dissipation in sense resistor
-    I_peak = 18.3
-    P_sense_peak = I_peak**2 * Rsense
-    P_sense_CB = I_CB**2 * Rsense
+    P_sense_peak = g['P_RS_IN_ILIM']
+    P_sense_CB = g['P_RS_IN_CB']
     print(f'   Power dissipation in Rsense:')
     print(f'   At ILIM ({I_LIM:.1f}A): {P_sense_peak:.2f} W')
     print(f'   At CB ({I_CB:.1f}A):    {P_sense_CB:.2f} W (brief)')
@@ -169,9 +163,9 @@ def main():
     V_bat_max = VBAT_MAX
     V_bat_min = VBAT_MIN
 
-    V_adc_max = V_bat_max * R_low / (R_high + R_low)
-    V_adc_min = V_bat_min * R_low / (R_high + R_low)
-    V_adc_fullscale = 3.5  # ADC_11db full scale (conservative)
+    V_adc_max = g['V_ADC_VBAT_MAX']
+    V_adc_min = g['V_ADC_VBAT_MIN']
+    V_adc_fullscale = g['V_ADC_FS']  # ADC_11db full scale (conservative)
 
     print(f'   Divider (database): {R_high/1000:.1f}kOhm / {R_low/1000:.1f}kOhm')
     print(f'   At V_bat_max ({V_bat_max}V): {V_adc_max:.3f} V')
@@ -188,14 +182,14 @@ def main():
     print('-'*70)
 
     if R_ILIM is None:
-        print('[ERROR] R_ILIM not found in database locked_values')
+        print('[ERROR] R_ILIM not found in database')
         return 1
 
-    K_ILIM = 5200    # V from datasheet
-    I_lim_act = K_ILIM / R_ILIM
+    K_ILIM = g['K_ILIM']    # V from datasheet
+    I_lim_act = g['ACT_ILIM']
 
     print(f'   R_ILIM (database): {R_ILIM/1000:.2f} kOhm')
-    print(f'   I_ILIM = 5200/R:   {I_lim_act:.2f} A')
+    print(f'   I_ILIM = {K_ILIM:.0f}/R:   {I_lim_act:.2f} A')
     print(f'   Expected:          3.29 A')
     match_act_ilim = abs(I_lim_act - 3.29) < 0.01
     print(f'   [{"OK" if match_act_ilim else "FAIL"}] MATCH: {match_act_ilim}')
@@ -207,22 +201,21 @@ def main():
     print('-'*70)
 
     if R_IPROPI is None:
-        print('[ERROR] R_IPROPI not found in database locked_values')
+        print('[ERROR] R_IPROPI not found in database')
         return 1
 
-    K_IPROPI = 1100    # A/A gain from datasheet
-    I_act_max = 3.3    # Max actuator current
+    K_IPROPI = g['K_IPROPI']    # A/A gain from datasheet
 
     # V_IPROPI = (I_act / K_IPROPI) * R_IPROPI
-    V_IPROPI_at_3A = (3.0 * R_IPROPI) / K_IPROPI
-    V_IPROPI_at_33A = (3.3 * R_IPROPI) / K_IPROPI
-    V_ADC_max = 3.5
+    V_IPROPI_at_3A = sedu_calc.v_ipropi(3.0, K_IPROPI, R_IPROPI)
+    V_IPROPI_at_33A = g['V_IPROPI']
+    V_ADC_max = V_adc_fullscale
 
     print(f'   R_IPROPI (database): {R_IPROPI/1000:.2f} kOhm')
     print(f'   At 3.0A:             {V_IPROPI_at_3A:.3f} V')
-    print(f'   At 3.3A:             {V_IPROPI_at_33A:.3f} V')
+    print(f'   At {g["I_ACTUATOR"]}A:             {V_IPROPI_at_33A:.3f} V')
     print(f'   ADC max (11dB):      {V_ADC_max} V')
-    print(f'   Margin at 3.3A:      {((V_ADC_max - V_IPROPI_at_33A)/V_ADC_max)*100:.1f}%')
+    print(f'   Margin at {g["I_ACTUATOR"]}A:      {((V_ADC_max - V_IPROPI_at_33A)/V_ADC_max)*100:.1f}%')
     within_range_ipropi = V_IPROPI_at_33A < V_ADC_max
     print(f'   [{"OK" if within_range_ipropi else "FAIL"}] WITHIN RANGE: {within_range_ipropi}')
     all_ok = all_ok and within_range_ipropi
@@ -234,14 +227,14 @@ def main():
 
     R_shunt = PHASE_SHUNT_R
     CSA_gain_val = CSA_GAIN
-    I_phase_max = 25  # Peak phase current
+    I_phase_max = g['I_PHASE_FAULT']  # Peak phase current
 
     V_shunt_max = I_phase_max * R_shunt
-    V_CSA_out = V_shunt_max * CSA_gain_val
+    V_CSA_out = g['V_CSA_FAULT']
 
     print(f'   Shunt resistance (database): {R_shunt*1000:.1f} mOhm')
     print(f'   CSA gain (database):         {CSA_gain_val:.0f} V/V')
-    print(f'   At I_phase_max ({I_phase_max}A):')
+    print(f'   At I_phase_max ({I_phase_max:g}A):')
     print(f'   V_shunt:                     {V_shunt_max*1000:.1f} mV')
     print(f'   V_CSA_out:                   {V_CSA_out:.2f} V')
     print(f'   ADC range:                   0 - {V_ADC_max} V')
@@ -251,8 +244,8 @@ def main():
     print()
 
     # Power in shunt at peak
-    P_shunt_peak = I_phase_max**2 * R_shunt
-    print(f'   Power in shunt at {I_phase_max}A: {P_shunt_peak:.2f} W')
+    P_shunt_peak = g['P_SHUNT_FAULT']
+    print(f'   Power in shunt at {I_phase_max:g}A: {P_shunt_peak:.2f} W')
     print(f'   Shunt rating:     >=5 W pulse')
     adequate_shunt = P_shunt_peak < 5.0
     print(f'   [{"OK" if adequate_shunt else "FAIL"}] ADEQUATE: {adequate_shunt}')
@@ -264,13 +257,13 @@ def main():
     print('-'*70)
 
     # LMR33630 (24V->3.3V) - Single-stage conversion
-    V_in_buck = 24.0
-    I_out_buck = 3.0  # Max output current (all logic)
-    eta_buck = 0.88   # 88% efficiency (lower due to large voltage step)
+    V_in_buck = g['VIN']
+    I_out_buck = g['BUCK_IOUT']  # Max output current (all logic)
+    eta_buck = g['BUCK_ETA']     # Lower due to large voltage step
 
-    P_out_buck = V_out_buck * I_out_buck
-    P_in_buck = P_out_buck / eta_buck
-    P_loss_buck = P_in_buck - P_out_buck
+    P_out_buck = g['BUCK_P_OUT']
+    P_loss_buck = g['BUCK_LOSS']
+    P_in_buck = P_out_buck + P_loss_buck
 
     print(f'   LMR33630 (24V->{V_out_buck}V @ 400kHz) - Single-stage:')
     print(f'   Input:            {V_in_buck}V')
@@ -292,17 +285,16 @@ def main():
     print('-'*70)
 
     # Motor
-    I_motor_peak_phase = 20.0  # Peak phase current (datasheet)
+    I_motor_peak_phase = g['I_MOTOR_PEAK']  # Peak phase current
     duty_cycle = 0.90          # High duty at spin-up
     eta_motor = 0.90           # Motor + driver efficiency
     I_motor_battery = (I_motor_peak_phase * duty_cycle) / eta_motor
 
     # Actuator
-    I_actuator = 3.3  # ILIM setting
+    I_actuator = g['I_ACTUATOR']  # ILIM setting
 
     # Buck converter (reflected to 24V)
-    P_logic = P_out_buck  # Total logic power (single buck now)
-    I_buck_reflected = P_logic / V_in_buck
+    I_buck_reflected = g['BUCK_I_IN']
 
     # Total
     I_total_worst = I_motor_battery + I_actuator + I_buck_reflected
@@ -332,7 +324,7 @@ def main():
     print('8. COMPONENT VOLTAGE RATINGS')
     print('-'*70)
     V_system_max = VBAT_MAX
-    V_system_nominal = 24.0
+    V_system_nominal = g['VIN']
 
     print(f'   System voltage (database):')
     print(f'   - Nominal:        {V_system_nominal}V')
@@ -340,9 +332,9 @@ def main():
     print()
 
     # MOSFETs
-    margin_mosfet = ((V_mosfet_rating - V_system_max) / V_system_max) * 100
+    margin_mosfet = g['FET_V_MARGIN']
     print(f'   MOSFETs (database):')
-    print(f'   - Rating:         {V_mosfet_rating}V')
+    print(f'   - Rating:         {V_mosfet_rating:g}V')
     print(f'   - Margin:         {margin_mosfet:.0f}%')
     adequate_mosfet = margin_mosfet > 100
     print(f'   [{"OK" if adequate_mosfet else "FAIL"}] ADEQUATE: {adequate_mosfet}')
@@ -350,16 +342,66 @@ def main():
     print()
 
     # TVS
-    V_tvs_standoff = 33
+    V_tvs_standoff = g['TVS_STANDOFF']
     V_tvs_clamp = 53.3  # Typical clamping at 1A
     print(f'   TVS (SMBJ33A):')
-    print(f'   - Standoff:       {V_tvs_standoff}V')
+    print(f'   - Standoff:       {V_tvs_standoff:g}V')
     print(f'   - Clamp (typ):    {V_tvs_clamp}V')
     adequate_tvs = V_tvs_standoff > V_system_max
     print(f'   [{"OK" if adequate_tvs else "FAIL"}] ADEQUATE: {adequate_tvs}')
     all_ok = all_ok and adequate_tvs
     print()
 
+    # 9. Tolerance Analysis
+    print('9. TOLERANCE ANALYSIS (Monte Carlo + worst case)')
+    print('-'*70)
+
+    params, missing = tolerance_params(db, g)
+    if missing:
+        print(f'[ERROR] No tolerance/threshold data in database for: {", ".join(missing)}')
+        return 1
+    if not tolerance:
+        print('   Skipped (run verify_power_calcs.py for the Monte Carlo analysis)')
+        print()
+        return finish(all_ok)
+
+    rs_rating = sedu_units.value(components.get('RS_IN', {}).get('power_rating', '5W'), 'W')
+    rail_3v3 = db.get('power_rails', {}).get('VDD_3V3', {})
+    rail_nom, rail_tol = rail_3v3.get('nominal', 3.3), rail_3v3.get('tolerance', 0.033)
+    analyses = [
+        ('LM5069 ILIM', 'A', sedu_calc.ilim,
+         tol.Spec(None, POWER_REQUIREMENTS['J_BAT']['current_rating'], 'J_BAT connector rating')),
+        ('LM5069 circuit breaker', 'A', sedu_calc.circuit_breaker,
+         tol.Spec(None, math.sqrt(rs_rating / Rsense), f'RS_IN {rs_rating:g} W rating')),
+        ('LM5069 UV turn-on', 'V', sedu_calc.uv_turn_on,
+         tol.Spec(VBAT_MIN, fw_const.get('VBAT_UV_THRESHOLD', 19.5), 'VBAT_MIN .. firmware VBAT_UV_THRESHOLD')),
+        ('LM5069 OV trip', 'V', sedu_calc.ov_trip,
+         tol.Spec(VBAT_MAX, V_tvs_standoff, 'VBAT_MAX .. TVS standoff')),
+        (f'VBAT divider at {VBAT_MAX}V', 'V', sedu_calc.v_adc_vbat_max,
+         tol.Spec(None, V_adc_fullscale * 0.9, '90% of ADC full scale')),
+        ('LMR33630 output', 'V', sedu_calc.buck_output,
+         tol.Spec(rail_nom - rail_tol, rail_nom + rail_tol, 'VDD_3V3 rail tolerance')),
+    ]
+
+    builds = tol.sample(params)
+    print(f'   {len(next(iter(builds.values()))):,} builds ({tol.backend()}), '
+          f'limits at {tol.SIGMAS:g} sigma; range = {100 - 2 * tol.TAIL:.2f}% of builds')
+    for name, unit, func, spec in analyses:
+        s = tol.analyse(name, unit, func, params, builds, spec)
+        worst_ok = spec.contains(s.wc_low) and spec.contains(s.wc_high)
+        print(f'   {name} ({unit}):')
+        print(f'   - Nominal / mean / sigma: {s.nominal:.3f} / {s.mean:.3f} / {s.std:.3f}')
+        print(f'   - Monte Carlo range:      {s.p_low:.3f} .. {s.p_high:.3f}')
+        print(f'   - Worst case:             {s.wc_low:.3f} .. {s.wc_high:.3f}')
+        print(f'   - Spec:                   {tol.format_spec(spec)} ({spec.source})')
+        print(f'   [{"OK" if worst_ok else "WARNING"}] YIELD: {s.yield_pct:.2f}%'
+              + ('' if worst_ok else ' (worst case outside spec)'))
+    print()
+    return finish(all_ok)
+
+
+def finish(all_ok):
+    """Print the verdict banner and return the exit code."""
     print('='*70)
     if all_ok:
         print('[PASS] ALL POWER CALCULATIONS VERIFIED')
@@ -0,0 +1,70 @@
+"""BannedMatcher's literal prefilter must never hide a plain re.search hit."""
+import re
+
+import pytest
+
+import check_frozen_state_violations as frozen
+
+# Lines that match (and nearly match) each BANNED_PATTERNS entry
+BANNED_LINES = [
+    "RS_IN: CSS2H-2728R-L003F (3 mOhm)",
+    "Phase shunts CSS2H-2512R-L200F x3",
+    "Divider top 49.9k, bottom 6.8 k",
+    "Divider top 49.9 K / 6.8K",
+    "Board 80x60 mm outline",
+    "Board 80 × 60mm outline",
+    "resized from 80x60 mm",
+    "Board 75×55 mm",
+    "was 75x55 mm",
+    "24V → 5V → 3.3V chain",
+    "24V→3.3V single stage",
+    "TPS62133 buck",
+    "",
+]
+
+# Patterns whose literal was once wrong, with lines every match variant covers
+EXTRA_CASES = {
+    r"(CSS2H-)?2512R": ["2512R-L200F", "CSS2H-2512R", "2512K"],
+    r"a\d{2}bc": ["a12bc", "a1bc", "xa99bcx"],
+    r"foo(?:bar)?baz": ["foobaz", "foobarbaz", "fooba"],
+    r"colou?r": ["color", "colour", "colr"],
+    r"ab+c": ["abc", "abbbc", "ac"],
+    r"x{2,3}?yz": ["xxyz", "xyz"],
+    r"[]a]bc": ["]bc", "abc", "bc"],
+    r"a\(b\)?c": ["a(bc", "a(b)c", "abc"],
+    r"49(?=\.9)": ["49.9", "49.8"],
+}
+
+CASES = [(pattern, BANNED_LINES) for pattern in frozen.BANNED_PATTERNS]
+CASES += list(EXTRA_CASES.items())
+
+
+def expected_hits(pattern, lines):
+    flags = re.IGNORECASE if pattern.startswith(r"\b") else 0
+    return [(i, pattern) for i, line in enumerate(lines) if re.search(pattern, line, flags)]
+
+
+@pytest.mark.parametrize("pattern,lines", CASES)
+def test_find_matches_plain_search(pattern, lines):
+    matcher = frozen.BannedMatcher({pattern: {}})
+    assert matcher.find("\n".join(lines)) == expected_hits(pattern, lines)
+
+
+@pytest.mark.parametrize("pattern,lines", CASES)
+def test_find_bytes_matches_plain_search(pattern, lines):
+    matcher = frozen.BannedMatcher({pattern: {}})
+    hits = matcher.find_bytes("\n".join(lines).encode("utf-8"))
+    assert [(i, p) for i, _, p in hits] == expected_hits(pattern, lines)
+
+
+@pytest.mark.parametrize("pattern,literal", [
+    (r"(CSS2H-)?2512R", "2512R"),
+    (r"a\d{2}bc", "bc"),
+    (r"foo(?:bar)?baz", "foo"),
+    (r"colou?r", "colo"),
+    (r"\b49\.9\s*k", "49.9"),
+    (r"24V\s*→\s*5V\s*→\s*3\.3V", "3.3V"),
+    (r"CSS2H|TPS", ""),
+])
+def test_required_literal(pattern, literal):
+    assert frozen.required_literal(pattern) == literal
@@ -0,0 +1,76 @@
+"""Copper clearance on small synthetic boards (sedu_drc.check_clearance).
+
+The GPIO1 arc is a half circle of radius 5 mm about (10, 10), from (5, 10)
+over (10, 5) to (15, 10). Its chords through the midpoint pass 1.46 mm
+inside the curve at 45 deg, so a via near the bulge there was missed.
+"""
+import math
+
+import pytest
+
+import sedu_board
+import sedu_drc
+
+RULES = sedu_drc.Rules({"Default": sedu_drc.NetClass("Default", 0.2, 0.25)}, {})
+
+ARC = b'(arc (start 5 10) (mid 10 5) (end 15 10) (width 0.25) (layer "F.Cu") (net 1))\n'
+VIA_RADIUS = 0.3
+TRACK_HALF = 0.125
+
+
+def board(*items):
+    raw = (b'(kicad_pcb (version 20221018) (generator pcbnew)\n'
+           b'(net 0 "") (net 1 "GPIO1") (net 2 "GND")\n'
+           + b"".join(items) + b")\n")
+    return sedu_board.build_board(raw)
+
+
+def via_off_arc(angle_deg, gap):
+    """GND via outside the arc at the given angle, gap mm edge to edge."""
+    d = 5 + TRACK_HALF + gap + VIA_RADIUS
+    a = math.radians(angle_deg)
+    x, y = 10 + d * math.cos(a), 10 + d * math.sin(a)
+    return (f'(via (at {x:.6f} {y:.6f}) (size {2 * VIA_RADIUS}) (drill 0.3) '
+            f'(layers "F.Cu" "B.Cu") (net 2))\n').encode()
+
+
+def test_via_near_arc_bulge_is_a_violation():
+    result = sedu_drc.check_clearance(board(ARC, via_off_arc(-135, 0.10)), RULES)
+    [(gap, required, a, b)] = result["clearance"]
+    assert gap == pytest.approx(0.10, abs=1e-5)
+    assert required == 0.2
+    assert {a.label, b.label} == {"arc", "via"}
+
+
+def test_via_clear_of_arc_passes():
+    result = sedu_drc.check_clearance(board(ARC, via_off_arc(-135, 0.25)), RULES)
+    assert result["clearance"] == []
+
+
+def test_via_past_arc_end_measures_to_the_end():
+    # Below the chord line y = 10 the closest copper is the arc's end at (15, 10)
+    via = b'(via (at 15 10.6) (size 0.6) (drill 0.3) (layers "F.Cu" "B.Cu") (net 2))\n'
+    [(gap, _, _, _)] = sedu_drc.check_clearance(board(ARC, via), RULES)["clearance"]
+    assert gap == pytest.approx(0.6 - TRACK_HALF - VIA_RADIUS)
+
+
+def test_track_crossing_arc_touches():
+    track = b'(segment (start 10 0) (end 10 8) (width 0.25) (layer "F.Cu") (net 2))\n'
+    [(gap, _, _, _)] = sedu_drc.check_clearance(board(ARC, track), RULES)["clearance"]
+    assert gap == 0.0
+
+
+def test_concentric_arcs():
+    inner = b'(arc (start 5.3 10) (mid 10 5.3) (end 14.7 10) (width 0.25) (layer "F.Cu") (net 2))\n'
+    [(gap, _, _, _)] = sedu_drc.check_clearance(board(ARC, inner), RULES)["clearance"]
+    assert gap == pytest.approx(0.3 - 2 * TRACK_HALF)
+
+
+def test_arc_distance_off_centre():
+    # Unit circle about the origin, upper half (y < 0), and the same arc moved 3 mm right
+    p = sedu_drc.make_arc((-1, 0), (0, -1), (1, 0))
+    q = sedu_drc.make_arc((2, 0), (3, -1), (4, 0))
+    assert sedu_drc.arc_distance(p, q) == pytest.approx(1.0)
+    far = sedu_drc.make_arc((3, 0), (4, 1), (5, 0))
+    assert sedu_drc.arc_distance(p, far) == pytest.approx(2.0)
+    assert sedu_drc.make_arc((0, 0), (1, 1), (2, 2)) is None
@@ -0,0 +1,46 @@
+"""Placement checks on small synthetic boards (sedu_geometry.check_placement)."""
+import sedu_board
+import sedu_geometry
+
+HEADER = b'(kicad_pcb (version 20221018) (generator pcbnew)\n'
+
+
+def hole(ref, x, y):
+    """Stock MountingHole_3.2mm_M3: its F.CrtYd circle (r 3.45) surrounds the hole."""
+    return (
+        f'(footprint "MountingHole:MountingHole_3.2mm_M3" (layer "F.Cu") (at {x} {y})\n'
+        f'  (property "Reference" "{ref}" (at 0 -4.2) (layer "F.SilkS"))\n'
+        '  (fp_circle (center 0 0) (end 3.45 0) (stroke (width 0.05) (type solid)) (layer "F.CrtYd"))\n'
+        '  (pad "" np_thru_hole circle (at 0 0) (size 3.2 3.2) (drill 3.2) (layers "*.Cu" "*.Mask")))\n'
+    ).encode()
+
+
+def part(ref, x, y, half=1.0):
+    """Square courtyard of side 2 * half centred on (x, y)."""
+    return (
+        f'(footprint "Resistor_SMD:R_0603_1608Metric" (layer "F.Cu") (at {x} {y})\n'
+        f'  (property "Reference" "{ref}" (at 0 -1.5) (layer "F.SilkS"))\n'
+        f'  (fp_rect (start {-half} {-half}) (end {half} {half}) (stroke (width 0.05) (type solid)) (layer "F.CrtYd")))\n'
+    ).encode()
+
+
+def check(*items):
+    return sedu_geometry.check_placement(sedu_board.build_board(HEADER + b"".join(items) + b")\n"))
+
+
+def test_hole_courtyard_is_not_its_own_intruder():
+    result = check(hole("H1", 4, 4), part("R1", 20, 20))
+    assert result["holes"] == []
+    assert result["checked"] == 2
+
+
+def test_part_inside_hole_keepout_is_reported():
+    # Keep-out radius 1.6 + 1.5 = 3.1 mm; R1's courtyard starts 2.0 mm from the hole
+    result = check(hole("H1", 4, 4), part("R1", 7, 4))
+    assert result["holes"] == [((4.0, 4.0), "R1")]
+    assert result["overlaps"] == [("H1", "R1")]
+
+
+def test_other_hole_courtyard_in_keepout_is_reported():
+    result = check(hole("H1", 4, 4), hole("H2", 9, 4))
+    assert result["holes"] == [((4.0, 4.0), "H2"), ((9.0, 4.0), "H1")]
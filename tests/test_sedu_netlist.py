@@ -0,0 +1,61 @@
+"""Hierarchical net extraction on a three-sheet fixture (tests/fixtures/netlist).
+
+top.kicad_sch places sheets "Power" and "MCU". Their VOUT pins are wired
+together under the local label RAIL, Power's EN pin goes to R1. The
+children join VBAT by global label, GND and +3V3 by power symbol, and
+MCU's two SENSE local labels join within the sheet.
+"""
+from pathlib import Path
+
+import pytest
+
+import sedu_netlist
+
+FIXTURE = Path(__file__).resolve().parent / "fixtures" / "netlist"
+TOP = "top.kicad_sch"
+
+# name -> (labels, pins)
+EXPECTED_NETS = {
+    "/RAIL": ({"RAIL", "VOUT"}, (("R2", "1"), ("R4", "1"))),
+    "/EN": ({"EN"}, (("R1", "1"), ("R3", "1"))),
+    "/MCU/SENSE": ({"SENSE"}, (("R4", "2"), ("R8", "2"))),
+    "VBAT": ({"VBAT"}, (("R3", "2"), ("R5", "1"))),
+    "GND": ({"GND"}, (("R1", "2"), ("R2", "2"), ("R5", "2"))),
+    "+3V3": ({"+3V3"}, (("R7", "1"), ("R8", "1"))),
+    "Net-(R7-Pad2)": (set(), (("R7", "2"),)),
+}
+
+
+@pytest.fixture(scope="module")
+def netlist():
+    sheets = {p.name: sedu_netlist.build_sheet(p.read_bytes(), p.name)
+              for p in FIXTURE.glob("*.kicad_sch")}
+    return sedu_netlist.Netlist(sheets, TOP)
+
+
+def test_hierarchy(netlist):
+    assert netlist.instances == [("/", TOP), ("/Power/", "power.kicad_sch"),
+                                 ("/MCU/", "mcu.kicad_sch")]
+    assert netlist.missing == []
+    assert netlist.unreferenced == []
+    assert netlist.symbol_count == 12
+
+
+def test_nets(netlist):
+    nets = {name: (set(net.labels), net.pins) for name, net in netlist.nets.items()}
+    assert nets == EXPECTED_NETS
+
+
+def test_net_sheets(netlist):
+    assert netlist.nets["/RAIL"].sheets == ("/", "/MCU/", "/Power/")
+    assert netlist.nets["VBAT"].sheets == ("/MCU/", "/Power/")
+    assert netlist.nets["/MCU/SENSE"].sheets == ("/MCU/",)
+
+
+def test_label_names(netlist):
+    assert netlist.label_names() == {"RAIL", "VOUT", "EN", "SENSE", "VBAT", "GND", "+3V3"}
+
+
+def test_extract_matches_direct_build(netlist):
+    extracted = sedu_netlist.extract(FIXTURE, TOP, jobs=1)
+    assert extracted.nets == netlist.nets
@@ -0,0 +1,35 @@
+"""Infeasibility bounds and packing of sedu_placer.solve on small boards."""
+import sedu_placer
+
+CORNER_HOLE = [(1.0, 1.0, 3.0, 3.0)]
+
+
+def squares(n, side):
+    return [sedu_placer.Block(f"B{i}", side, side) for i in range(n)]
+
+
+def test_strips_around_a_corner_hole_are_not_usable():
+    # The 1 mm strips between the hole and the edges take no 3 mm block:
+    # 91 mm^2 usable, not the 96 mm^2 the hole alone leaves
+    result = sedu_placer.solve(squares(10, 3.05), 10, 10, CORNER_HOLE)
+    assert result.status == "infeasible"
+    assert result.proof.startswith("area:")
+    assert "91 mm^2 usable" in result.proof
+
+
+def test_narrow_blocks_can_use_the_strips():
+    blocks = squares(2, 3.0) + [sedu_placer.Block("strip", 1.0, 9.0)]
+    result = sedu_placer.solve(blocks, 10, 10, CORNER_HOLE)
+    assert result.status == "feasible"
+    assert result.unplaced == []
+
+
+def test_channel_is_kept_between_blocks():
+    result = sedu_placer.solve(squares(4, 4.0), 10, 10, channel=2.0)
+    assert result.status == "feasible"
+    for a in result.placements:
+        for b in result.placements:
+            if a is not b:
+                gap_x = max(b.x - (a.x + a.w), a.x - (b.x + b.w))
+                gap_y = max(b.y - (a.y + a.l), a.y - (b.y + b.l))
+                assert max(gap_x, gap_y) >= 2.0 - 1e-9
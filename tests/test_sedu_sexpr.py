@@ -0,0 +1,45 @@
+"""Lazy (split top-level) parsing must give the same tree as a full parse."""
+from pathlib import Path
+
+import pytest
+
+import sedu_sexpr
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+
+
+def materialized(node):
+    """Plain nested lists with every LazyNode parsed."""
+    if isinstance(node, sedu_sexpr.LazyNode):
+        node = node.materialize()
+    if isinstance(node, list):
+        return [materialized(child) for child in node]
+    return node
+
+
+CASES = [
+    # Quoted strings with a line break before an indented "(" or ")"
+    b'(kicad_pcb\n  (b "p)\n  (q" "x\n  )" (b 1 "x\n  (y" 2.5))\n  (a "x\n  )" 1 (b))\n)',
+    b'(kicad_sch\n  (text "line one\n  (line two)" (at 1 2))\n  (wire (pts (xy 0 0) (xy 1 0)))\n)',
+    # Unbalanced parentheses inside strings, two items on one line
+    b'(kicad_pcb\n  (a "(") (b ")")\n  (c "x(")\n  (d ")")\n)',
+    # Escaped quotes and comments
+    b'(kicad_pcb\n  (a "say \\"(hi\\"")\n  (b 1) ; comment (\n  (c 2)\n)',
+    # Spans checked one by one inside a verified run: a comment holding
+    # parentheses, a control byte in a string, then two items on one line
+    b'(kicad_pcb\n  (a 1)\n  (b 2\n    (c 3))\n\n  ; note (x)\n  (d "\x01" 4)\n  (e 5) (f 6)\n  (g 7)\n)',
+    # KiCad's usual layout, children closing on their own line
+    b'(kicad_pcb\n  (footprint "R"\n    (at 1 2)\n    (pad "1" smd)\n  )\n  (segment (start 0 0) (end 1 1))\n)',
+]
+
+
+@pytest.mark.parametrize("data", CASES)
+def test_lazy_parse_matches_full_parse(data):
+    lazy = sedu_sexpr.parse(data, lazy_depth=1)
+    assert materialized(lazy) == sedu_sexpr.parse(data)
+
+
+@pytest.mark.parametrize("name", ["SEDU_PCB.kicad_pcb", "SEDU_PCB.kicad_sch", "Power_In.kicad_sch"])
+def test_lazy_parse_matches_full_parse_on_project_files(name):
+    data = (ROOT_DIR / "hardware" / name).read_bytes()
+    assert materialized(sedu_sexpr.parse(data, lazy_depth=1)) == sedu_sexpr.parse(data)
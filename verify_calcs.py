@@ -2,9 +2,20 @@
 """
 SEDU Electrical Design Verification Script
 Verifies all critical calculations, component ratings, and safety margins
+
+Shared quantities (ILIM, dissipations, ADC scaling, buck loss) come from the
+calculation graph in scripts/sedu_calc.py, seeded from design_database.yaml.
+Each Result line prints its terms with enough digits to reproduce the
+printed result (BUCK_I_IN is 0.41 A, not 0.4 A).
 """
 
-import math
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent / 'scripts'))
+import sedu_calc
+
+g = sedu_calc.load()
 
 print('='*80)
 print('SEDU ELECTRICAL DESIGN VERIFICATION REPORT')
@@ -18,47 +29,47 @@ print('1. CURRENT LIMITS AND PROTECTION')
 print('-'*80)
 
 # LM5069 ILIM
-RS_IN = 3.0e-3  # 3.0 milliohm
-ILIM_threshold = 55e-3  # 55 mV
-ILIM_calc = ILIM_threshold / RS_IN
+RS_IN = g['RS_IN']
+ILIM_threshold = g['V_ILIM']
+ILIM_calc = g['ILIM']
 print('Calculation: LM5069 ILIM')
 print('Formula: ILIM = V_threshold / RS_IN')
-print(f'Result: ILIM = 55mV / 3.0mohm = {ILIM_calc:.2f} A')
+print(f'Result: ILIM = {ILIM_threshold*1e3:g}mV / {RS_IN*1e3:.1f}mohm = {ILIM_calc:.2f} A')
 print('Expected: 18.33 A')
 status = 'CORRECT' if abs(ILIM_calc - 18.33) < 0.1 else 'ERROR'
 print(f'Status: {status}')
 print()
 
 # Circuit breaker
-CB_threshold = 105e-3  # 105 mV
-CB_calc = CB_threshold / RS_IN
+CB_threshold = g['V_CB']
+CB_calc = g['I_CB']
 print('Calculation: LM5069 Circuit Breaker')
 print('Formula: I_CB = V_CB_threshold / RS_IN')
-print(f'Result: I_CB = 105mV / 3.0mohm = {CB_calc:.2f} A')
+print(f'Result: I_CB = {CB_threshold*1e3:g}mV / {RS_IN*1e3:.1f}mohm = {CB_calc:.2f} A')
 print('Expected: 35 A')
 status = 'CORRECT' if abs(CB_calc - 35.0) < 1.0 else 'ERROR'
 print(f'Status: {status}')
 print()
 
 # DRV8873 ILIM
-R_ILIM = 1580  # 1.58kohm
-DRV8873_ILIM_calc = 5200 / R_ILIM
+R_ILIM = g['R_ILIM']
+DRV8873_ILIM_calc = g['ACT_ILIM']
 print('Calculation: DRV8873 Actuator ILIM')
-print('Formula: I_LIMIT = 5200V / R_ILIM')
-print(f'Result: I_LIMIT = 5200 / 1580ohm = {DRV8873_ILIM_calc:.2f} A')
+print(f'Formula: I_LIMIT = {g["K_ILIM"]:.0f}V / R_ILIM')
+print(f'Result: I_LIMIT = {g["K_ILIM"]:.0f} / {R_ILIM:.0f}ohm = {DRV8873_ILIM_calc:.2f} A')
 print('Expected: 3.29 A')
 status = 'CORRECT' if abs(DRV8873_ILIM_calc - 3.29) < 0.05 else 'ERROR'
 print(f'Status: {status}')
 print()
 
 # Worst case current check
-motor_peak = 20.0  # A
-actuator_continuous = 3.3  # A
-buck_current = 0.4  # A
-total_worst = motor_peak + actuator_continuous + buck_current
+motor_peak = g['I_MOTOR_PEAK']
+actuator_continuous = g['I_ACTUATOR']
+buck_current = g['BUCK_I_IN']
+total_worst = g['I_TOTAL_WORST']
 print('Calculation: Worst-Case Total Current')
 print('Formula: I_total = I_motor_peak + I_actuator + I_buck')
-print(f'Result: I_total = 20A + 3.3A + 0.4A = {total_worst:.2f} A')
+print(f'Result: I_total = {motor_peak:g}A + {actuator_continuous:g}A + {buck_current:.2f}A = {total_worst:.2f} A')
 print('Expected: 23.7 A (exceeds ILIM)')
 print('Status: MARGINAL - Firmware interlock required')
 print()
@@ -70,23 +81,22 @@ print('2. VOLTAGE RATINGS AND MARGINS')
 print('-'*80)
 
 # MOSFETs
-V_battery_max = 25.2  # V
-V_mosfet_rating = 60  # V
-mosfet_margin = (V_mosfet_rating - V_battery_max) / V_battery_max * 100
+V_battery_max = g['VBAT_MAX']
+V_mosfet_rating = g['FET_V_RATING']
+mosfet_margin = g['FET_V_MARGIN']
 print('Calculation: Phase MOSFET Voltage Margin')
 print('Formula: Margin = (V_rating - V_applied) / V_applied * 100%')
-print(f'Result: Margin = (60V - 25.2V) / 25.2V = {mosfet_margin:.1f}%')
+print(f'Result: Margin = ({V_mosfet_rating:g}V - {V_battery_max:g}V) / {V_battery_max:g}V = {mosfet_margin:.1f}%')
 print('Expected: 138% (adequate)')
 print('Status: CORRECT')
 print()
 
 # TVS clamp
-V_tvs_standoff = 33  # V
-V_tvs_clamp = 53.3  # V (typical)
-tvs_margin = (V_tvs_standoff - V_battery_max) / V_battery_max * 100
+V_tvs_standoff = g['TVS_STANDOFF']
+tvs_margin = g['TVS_MARGIN']
 print('Calculation: TVS SMBJ33A Standoff Voltage')
 print('Formula: Margin = (V_standoff - V_battery_max) / V_battery_max * 100%')
-print(f'Result: Margin = (33V - 25.2V) / 25.2V = {tvs_margin:.1f}%')
+print(f'Result: Margin = ({V_tvs_standoff:g}V - {V_battery_max:g}V) / {V_battery_max:g}V = {tvs_margin:.1f}%')
 print('Expected: 31% (adequate)')
 print('Status: CORRECT')
 print()
@@ -109,41 +119,34 @@ print('3. POWER DISSIPATION')
 print('-'*80)
 
 # RS_IN sense resistor
-I_ILIM = 18.3  # A
-P_RS_IN = I_ILIM**2 * RS_IN
-P_RS_IN_rating = 3.0  # W
-rs_in_margin = (P_RS_IN_rating - P_RS_IN) / P_RS_IN_rating * 100
-print('Calculation: RS_IN Power @ 18.3A ILIM')
+P_RS_IN = g['P_RS_IN_ILIM']
+print(f'Calculation: RS_IN Power @ {ILIM_calc:.1f}A ILIM')
 print('Formula: P = I^2 * R')
-print(f'Result: P = (18.3A)^2 * 3.0mohm = {P_RS_IN:.3f} W')
+print(f'Result: P = ({ILIM_calc:.2f}A)^2 * {RS_IN*1e3:.1f}mohm = {P_RS_IN:.3f} W')
 print('Expected: 1.0 W vs 3W rating = 66.7% margin')
 status = 'CORRECT' if abs(P_RS_IN - 1.0) < 0.1 else 'ERROR'
 print(f'Status: {status}')
 print()
 
 # Phase shunts
-I_phase_peak = 25  # A (conservative)
-R_phase_shunt = 2e-3  # 2 milliohm
-P_phase_shunt = I_phase_peak**2 * R_phase_shunt
-P_phase_rating = 5.0  # W (CSS2H-2512K-2L00F verified)
-phase_margin = (P_phase_rating - P_phase_shunt) / P_phase_rating * 100
-print('Calculation: Phase Shunt Power @ 25A Peak')
+I_phase_peak = g['I_PHASE_FAULT']
+R_phase_shunt = g['R_PHASE']
+P_phase_shunt = g['P_SHUNT_FAULT']
+print(f'Calculation: Phase Shunt Power @ {I_phase_peak:g}A Peak')
 print('Formula: P = I^2 * R')
-print(f'Result: P = (25A)^2 * 2mohm = {P_phase_shunt:.2f} W')
+print(f'Result: P = ({I_phase_peak:g}A)^2 * {R_phase_shunt*1e3:g}mohm = {P_phase_shunt:.2f} W')
 print('Expected: 1.25 W vs 5W rating = 75% margin')
 status = 'CORRECT' if abs(P_phase_shunt - 1.25) < 0.1 else 'ERROR'
 print(f'Status: {status}')
 print()
 
 # LMR33630 (buck regulator)
-V_in_buck = 24  # V
-V_out_buck = 3.3  # V
-I_out_buck = 3.0  # A max
-efficiency = 0.88  # 88% typical for large step-down
-P_out_buck = V_out_buck * I_out_buck
-P_in_buck = P_out_buck / efficiency
-P_loss_buck = P_in_buck - P_out_buck
-print('Calculation: LMR33630 Buck Power Loss @ 3A Output')
+V_out_buck = g['BUCK_VOUT']
+I_out_buck = g['BUCK_IOUT']
+efficiency = g['BUCK_ETA']
+P_out_buck = g['BUCK_P_OUT']
+P_loss_buck = g['BUCK_LOSS']
+print(f'Calculation: LMR33630 Buck Power Loss @ {I_out_buck:g}A Output')
 print('Formula: P_loss = P_in - P_out = (V_out * I_out / eta) - (V_out * I_out)')
 print(f'Result: P_loss = ({V_out_buck:.1f}V * {I_out_buck:.1f}A / {efficiency:.2f}) - {P_out_buck:.1f}W = {P_loss_buck:.2f} W')
 print('Expected: ~1.35 W')
@@ -152,7 +155,7 @@ print(f'Status: {status}')
 print()
 
 # Buck efficiency check
-efficiency_check = 88.0  # Claimed percentage
+efficiency_check = efficiency * 100  # Claimed percentage
 realistic_range = (85.0, 90.0)  # Realistic for 24V->3.3V step-down
 print('Calculation: Buck Efficiency Realism Check')
 print(f'Claimed: {efficiency_check:.0f}%')
@@ -170,46 +173,43 @@ print('4. ADC RANGES AND SCALING')
 print('-'*80)
 
 # Battery ADC
-R_bat_top = 140e3  # 140kohm
-R_bat_bot = 10e3   # 10kohm
-V_batt_max = 25.2  # V
-V_batt_min = 18.0  # V
-V_adc_max = V_batt_max * R_bat_bot / (R_bat_top + R_bat_bot)
-V_adc_min = V_batt_min * R_bat_bot / (R_bat_top + R_bat_bot)
-V_adc_fs = 3.5  # 12dB attenuation ~3.5V full scale (approx for ESP32)
+R_bat_top = g['R_VBAT_TOP'] / 1e3  # kohm
+R_bat_bot = g['R_VBAT_BOT'] / 1e3
+V_batt_max = g['VBAT_MAX']
+V_batt_min = g['VBAT_MIN']
+V_adc_max = g['V_ADC_VBAT_MAX']
+V_adc_min = g['V_ADC_VBAT_MIN']
+V_adc_fs = g['V_ADC_FS']
 adc_batt_margin = (V_adc_fs - V_adc_max) / V_adc_fs * 100
 print('Calculation: Battery ADC Range')
 print('Formula: V_adc = V_batt * R_bot / (R_top + R_bot)')
-print(f'Result @ 25.2V: V_adc = 25.2V * 10k/(140k+10k) = {V_adc_max:.3f} V')
-print(f'Result @ 18.0V: V_adc = 18.0V * 10k/(140k+10k) = {V_adc_min:.3f} V')
+print(f'Result @ {V_batt_max:.1f}V: V_adc = {V_batt_max:.1f}V * {R_bat_bot:g}k/({R_bat_top:g}k+{R_bat_bot:g}k) = {V_adc_max:.3f} V')
+print(f'Result @ {V_batt_min:.1f}V: V_adc = {V_batt_min:.1f}V * {R_bat_bot:g}k/({R_bat_top:g}k+{R_bat_bot:g}k) = {V_adc_min:.3f} V')
 print('Expected: 1.68V - 1.20V vs 3.5V full scale')
 print(f'Status: CORRECT - {adc_batt_margin:.1f}% margin at max')
 print()
 
 # IPROPI ADC
-k_ipropi = 1100  # A/A mirror ratio
-R_ipropi = 1000  # 1kohm
-I_actuator_max = 3.3  # A
-I_mirror = I_actuator_max / k_ipropi
-V_ipropi = I_mirror * R_ipropi
+k_ipropi = g['K_IPROPI']
+R_ipropi = g['R_IPROPI']
+I_actuator_max = g['I_ACTUATOR']
+V_ipropi = g['V_IPROPI']
 ipropi_utilization = V_ipropi / V_adc_fs * 100
 ipropi_margin = 100 - ipropi_utilization
-print('Calculation: IPROPI ADC @ 3.3A Actuator Current')
+print(f'Calculation: IPROPI ADC @ {I_actuator_max:g}A Actuator Current')
 print('Formula: V_ipropi = (I_actuator / k_ipropi) * R_ipropi')
-print(f'Result: V_ipropi = (3.3A / 1100) * 1000ohm = {V_ipropi:.2f} V')
+print(f'Result: V_ipropi = ({I_actuator_max:g}A / {k_ipropi:.0f}) * {R_ipropi:.0f}ohm = {V_ipropi:.2f} V')
 print(f'Expected: 3.0V vs 3.5V full scale = 85.7% utilization')
 print(f'Status: MARGINAL - {ipropi_utilization:.1f}% full scale, {ipropi_margin:.1f}% margin')
 print()
 
 # Motor CSA
-CSA_gain = 20  # V/V
-I_motor_peak = 25  # A
-R_sense_motor = 2e-3  # 2 milliohm
-V_csa_out = I_motor_peak * R_sense_motor * CSA_gain
+CSA_gain = g['CSA_GAIN']
+V_csa_out = g['V_CSA_FAULT']
 csa_margin = (V_adc_fs - V_csa_out) / V_adc_fs * 100
-print('Calculation: Motor CSA @ 25A Peak')
+print(f'Calculation: Motor CSA @ {I_phase_peak:g}A Peak')
 print('Formula: V_csa = I * R_sense * Gain')
-print(f'Result: V_csa = 25A * 2mohm * 20 = {V_csa_out:.2f} V')
+print(f'Result: V_csa = {I_phase_peak:g}A * {R_phase_shunt*1e3:g}mohm * {CSA_gain:g} = {V_csa_out:.2f} V')
 print('Expected: 1.0V vs 3.5V full scale')
 print(f'Status: CORRECT - {csa_margin:.1f}% margin')
 print()
@@ -220,15 +220,15 @@ print()
 print('5. LMR33630 FEEDBACK NETWORK')
 print('-'*80)
 
-RFBT = 100e3  # 100kohm
-RFBB = 43.2e3  # 43.2kohm
-VREF = 1.0  # Internal reference
-V_out_calc = VREF * (1 + RFBT/RFBB)
-V_out_target = 3.3
+RFBT = g['RFBT']
+RFBB = g['RFBB']
+VREF = g['V_FB']
+V_out_calc = g['BUCK_VOUT_FB']
+V_out_target = V_out_buck
 feedback_error = (V_out_calc - V_out_target) / V_out_target * 100
 print('Calculation: LMR33630 Output Voltage')
 print('Formula: V_out = V_ref * (1 + RFBT/RFBB)')
-print(f'Result: V_out = 1.0V * (1 + 100k/43.2k) = {V_out_calc:.4f} V')
+print(f'Result: V_out = {VREF:.1f}V * (1 + {RFBT/1e3:g}k/{RFBB/1e3:g}k) = {V_out_calc:.4f} V')
 print('Expected: 3.3V')
 status = 'CORRECT' if abs(feedback_error) < 1.0 else 'ERROR'
 print(f'Status: {status} - Error {feedback_error:.2f}%')
@@ -243,18 +243,18 @@ print('-'*80)
 # Connector ratings
 print('Calculation: Battery Connector Rating Check')
 J_bat_rating = 30  # A (XT30)
-I_bat_peak = 20  # A motor peak
+I_bat_peak = g['I_MOTOR_PEAK']
 bat_conn_margin = (J_bat_rating - I_bat_peak) / J_bat_rating * 100
-print(f'J_BAT: XT30 rated {J_bat_rating}A vs {I_bat_peak}A peak')
+print(f'J_BAT: XT30 rated {J_bat_rating}A vs {I_bat_peak:g}A peak')
 print(f'Margin: {bat_conn_margin:.1f}%')
 print('Status: CORRECT - Adequate margin')
 print()
 
 print('Calculation: Motor Connector Rating Check')
 J_mot_rating_per_phase = 30  # A (XT30 per phase)
-I_phase_peak = 20  # A
+I_phase_peak = g['I_MOTOR_PEAK']
 mot_conn_margin = (J_mot_rating_per_phase - I_phase_peak) / J_mot_rating_per_phase * 100
-print(f'J_MOT: 3x XT30 rated {J_mot_rating_per_phase}A per phase vs {I_phase_peak}A peak')
+print(f'J_MOT: 3x XT30 rated {J_mot_rating_per_phase}A per phase vs {I_phase_peak:g}A peak')
 print(f'Margin: {mot_conn_margin:.1f}%')
 print('Status: CORRECT - Adequate margin')
 print()